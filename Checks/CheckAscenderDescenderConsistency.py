@@ -4,9 +4,40 @@ __doc__ = """
 Checks ascender/descender consistency across masters. 
 Ignores expected metric touchpoints: baseline, x-height, cap height, ascender, descender.
 Reports inconsistencies and opens a tab with problematic glyphs.
+
+Extremes are kept in a per-font table (font.tempData) for the session.
+Re-runs only rescan glyphs whose lastChange, or whose components' lastChange,
+differs from the stored one. Composite extremes come from cached component bounds.
+
+For saved fonts, results are also kept between sessions in a SQLite file next
+to the font (<font>.checks.sqlite), per glyph and master with the stamp and a
+layer content hash. A layer whose glyph changed but whose outlines did not is
+taken from the store without being measured again; the hash is only taken for
+layers that have a stored entry.
 """
 
 import GlyphsApp
+from array import array
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from BezierBounds import layer_bounds
+from GlyphBounds import GlyphBounds
+from LayerData import LayerData
+from ResultStore import ResultStore, layer_hash
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TABLE_KEY = "sk.extremesTable"  # key in font.tempData
+TABLE_VERSION = 4
+COMPONENT_BOUNDS_KEY = "sk.componentExtremes"  # key in font.tempData, kept apart from the bounds of Highest & Lowest Glyphs
+USE_STORE = True                 # keep results between sessions (saved fonts only)
 
 font = Glyphs.font
 masters = font.masters
@@ -37,20 +68,141 @@ print("\n")
 # Helpers
 # ------------------------------------------------------------
 
-def get_extremes(layer):
-    """Return (highest, lowest) Y coordinates in layer."""
-    highest = None
-    lowest = None
-    for p in layer.paths:
-        for n in p.nodes:
-            y = n.y
-            if highest is None or y > highest:
-                highest = y
-            if lowest is None or y < lowest:
-                lowest = y
-    return highest or 0, lowest or 0
+def layer_paths_bounds(layer):
+    """Bounds of the layer's own paths, following the curves instead of the handles."""
+    return layer_bounds(layer.paths)
+
+
+class ExtremesTable(object):
+    """
+    Highest/lowest Y per glyph and master, stored row-major in two flat arrays
+    (glyph × master). Rows are rescanned only when a glyph's stamp moves (see GlyphBounds).
+    """
+
+    def __init__(self, masterIds):
+        self.masterIds = list(masterIds)
+        self.names = []
+        self.index = {}
+        self.stamps = []
+        self.highest = array("d")
+        self.lowest = array("d")
+
+    def update(self, font, glyphBounds, known=None, layerData=None):
+        """
+        Bring the table in sync with font. known is {(name, masterId): (stamp,
+        hash, [highest, lowest])} from the result store. Layers are hashed,
+        through layerData, only to compare them with a stored entry. Returns the
+        number of measured glyphs and the store rows [(name, masterId, stamp,
+        hash, [highest, lowest])] of every layer that was not taken from the
+        store unchanged.
+        """
+        known = known or {}
+        masterIds = [m.id for m in font.masters]
+        if masterIds != self.masterIds:
+            self.__init__(masterIds)
+
+        glyphs = list(font.glyphs)
+        names = [g.name for g in glyphs]
+        masterCount = len(self.masterIds)
+
+        if names != self.names:
+            # glyphs were added, removed, renamed or reordered: keep the rows we still have
+            highest = array("d", [0.0]) * (len(names) * masterCount)
+            lowest = array("d", [0.0]) * (len(names) * masterCount)
+            stamps = [False] * len(names)  # False never equals a real lastChange
+            for i, name in enumerate(names):
+                old = self.index.get(name)
+                if old is None:
+                    continue
+                highest[i * masterCount:(i + 1) * masterCount] = self.highest[old * masterCount:(old + 1) * masterCount]
+                lowest[i * masterCount:(i + 1) * masterCount] = self.lowest[old * masterCount:(old + 1) * masterCount]
+                stamps[i] = self.stamps[old]
+            self.names = names
+            self.index = {name: i for i, name in enumerate(names)}
+            self.stamps = stamps
+            self.highest = highest
+            self.lowest = lowest
+
+        rescanned = 0
+        rows = []
+        for i, g in enumerate(glyphs):
+            stamp = glyphBounds.stamp(g.name)
+            if self.stamps[i] is not False and stamp == self.stamps[i]:
+                continue
+            stampText = repr(stamp)
+            componentStamps = repr(stamp[1])
+            measured = False
+            for k, masterId in enumerate(self.masterIds):
+                entry = known.get((g.name, masterId))
+                if entry is not None and entry[0] == stampText:
+                    high, low = entry[2]
+                else:
+                    # the glyph changed: keep the stored extremes if this layer's outlines did not
+                    layerHash = ""
+                    if entry is not None and layerData is not None:
+                        layer = g.layers[masterId]
+                        if layer:
+                            layerHash = layer_hash(layerData.get(g, layer, stamp[0]), componentStamps)
+                    if layerHash and entry[1] == layerHash:
+                        high, low = entry[2]
+                    else:
+                        bounds = glyphBounds.bounds(g.name, masterId)
+                        high = bounds[3] if bounds else 0
+                        low = bounds[1] if bounds else 0
+                        measured = True
+                    rows.append((g.name, masterId, stampText, layerHash, [high, low]))
+                self.highest[i * masterCount + k] = high
+                self.lowest[i * masterCount + k] = low
+            self.stamps[i] = stamp
+            rescanned += measured
+        return rescanned, rows
+
+    def row(self, i):
+        masterCount = len(self.masterIds)
+        return (self.highest[i * masterCount:(i + 1) * masterCount],
+                self.lowest[i * masterCount:(i + 1) * masterCount])
+
+
+def extremes_table(font):
+    """
+    Return the font's session extremes table, updated for the current glyphs.
+    The table is stored as a plain dict of its attributes, so it survives the
+    class being redefined every time the script runs.
+    """
+    table = ExtremesTable([m.id for m in font.masters])
+    fromSession = False
+    try:
+        stored = font.tempData[TABLE_KEY]
+        if stored is not None and stored.get("version") == TABLE_VERSION:
+            table.__dict__.update(dict(stored))
+            fromSession = True
+    except Exception:
+        pass
+
+    # the store is only read when the session has no table yet, and written with every change
+    store = ResultStore(font, "AscenderDescender", enabled=USE_STORE)
+    known = {} if fromSession else store.load()
+    glyphBounds = GlyphBounds(font, None if fromSession else store.load_deps(), layer_paths_bounds, COMPONENT_BOUNDS_KEY)
+    layerData = LayerData(font)
+    rescanned, rows = table.update(font, glyphBounds, known, layerData)
+    glyphBounds.save()
+    if layerData.runMisses:
+        layerData.save()
+    store.save(rows, store.gone(known, table.index, set(table.masterIds)))
+    store.save_deps(glyphBounds.newDeps)
+    store.close()
+    try:
+        font.tempData[TABLE_KEY] = dict(vars(table), version=TABLE_VERSION)
+    except Exception:
+        pass
+    print(f"Extremes table: rescanned {rescanned} of {len(table.names)} glyphs.\n")
+    return table
 
 
+# ------------------------------------------------------------
+# Normalization
+# ------------------------------------------------------------
+
 def normalized_extreme(value, m_id):
     """
     Normalizes an extreme point:
@@ -73,6 +225,40 @@ def normalized_extreme(value, m_id):
     return float(value)
 
 
+# metric keys in the order normalized_extreme() tests them
+METRIC_ORDER = ("baseline", "desc", "xheight", "cap", "asc")
+
+
+def normalized_codes(values, masterIds):
+    """
+    Vectorized normalized_extreme() over a glyph × master array.
+    Returns (codes, numbers): codes[g, m] is 1 + the METRIC_ORDER index of the
+    matched metric, or 0 when the value is kept as a number in numbers[g, m].
+    """
+    codes = np.zeros(values.shape, dtype=np.int8)
+    for k, m_id in enumerate(masterIds):
+        column = values[:, k]
+        for code in range(len(METRIC_ORDER) - 1, -1, -1):
+            # lowest code wins, like the if-chain in normalized_extreme()
+            codes[column == metrics[m_id][METRIC_ORDER[code]], k] = code + 1
+    numbers = np.where(codes == 0, values, 0.0)
+    return codes, numbers
+
+
+def inconsistent_rows(table):
+    """Return the glyph indexes whose normalized extremes differ between masters."""
+    masterCount = len(table.masterIds)
+    glyphCount = len(table.names)
+    if not glyphCount or not masterCount:
+        return []
+    differs = np.zeros(glyphCount, dtype=bool)
+    for flat in (table.highest, table.lowest):
+        values = np.frombuffer(flat, dtype=np.float64).reshape(glyphCount, masterCount)
+        codes, numbers = normalized_codes(values, table.masterIds)
+        differs |= (codes != codes[:, :1]).any(axis=1) | (numbers != numbers[:, :1]).any(axis=1)
+    return [int(i) for i in np.nonzero(differs)[0]]
+
+
 # ------------------------------------------------------------
 # MAIN CHECK
 # ------------------------------------------------------------
@@ -82,26 +268,25 @@ problemReport = []
 
 print("Checking glyphs…\n")
 
-for g in font.glyphs:
-
-    ascResults = []
-    descResults = []
+table = extremes_table(font)
+masterIds = [m.id for m in masters]
 
-    for m in masters:
-        layer = g.layers[m.id]
-        hi, lo = get_extremes(layer)
+if np is not None:
+    candidateRows = inconsistent_rows(table)
+else:
+    candidateRows = range(len(table.names))
 
-        ascResults.append(normalized_extreme(hi, m.id))
-        descResults.append(normalized_extreme(lo, m.id))
+for i in candidateRows:
+    highs, lows = table.row(i)
+    ascResults = [normalized_extreme(hi, m_id) for hi, m_id in zip(highs, masterIds)]
+    descResults = [normalized_extreme(lo, m_id) for lo, m_id in zip(lows, masterIds)]
 
     # Determine if the normalized extremes differ
+    # (glyphs without outlines normalize to "baseline" in every master)
     if len(set(ascResults)) > 1 or len(set(descResults)) > 1:
-        # Ignore fully flat glyphs with no outlines
-        if ascResults == ["baseline"] and descResults == ["baseline"]:
-            continue
-
-        problemGlyphs.append(g.name)
-        problemReport.append(f"{g.name}: asc={ascResults}, desc={descResults}")
+        name = table.names[i]
+        problemGlyphs.append(name)
+        problemReport.append(f"{name}: asc={ascResults}, desc={descResults}")
 
 # ------------------------------------------------------------
 # REPORTING
@@ -6,131 +6,209 @@ their diacritic components should use .case variants.
 
 If problems are found:
 - Opens a new tab with affected glyphs.
-- Offers the option to replace regular accents with .case accents where available (for relevant glyphs).
+- Builds a swap plan (layer, component index, new name) for every regular
+  accent that has a .case counterpart.
+- Offers to execute the plan, or to export it as JSON for review.
+
+Set PLAN_FILE to a previously exported (and reviewed) plan to apply it
+without running the detection again.
+
+Component names of layers another check has already read come from the
+session's shared layer data (font.tempData).
 """
 
 import GlyphsApp
-from GlyphsApp import Glyphs
-from AppKit import NSAlert, NSAlertFirstButtonReturn
+from GlyphsApp import Glyphs, GetSaveFile
+from AppKit import NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn
+import json
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from LayerData import LayerData
 
 font = Glyphs.font
 masters = font.masters
 
 # ---------- CONFIGURATION ----------
 MASTER_NAMES = []  # Empty = check all masters
+PLAN_FILE = ""     # Path to an exported plan: apply it instead of checking
 # -----------------------------------
 
-def glyph_by_name(name):
-    if not name:
-        return None
-    try:
-        return font.glyphs[name]
-    except Exception:
-        pass
-    for g in font.glyphs:
-        if g.name == name:
-            return g
-    return None
-
 def is_uppercase_glyph(glyph):
     if not glyph or not glyph.name:
         return False
     n = glyph.name
     return ("A" <= n[0] <= "Z") and glyph.category == "Letter"
 
-# Determine masters to check
-if MASTER_NAMES:
-    master_ids_to_check = [m.id for m in masters if m.name in MASTER_NAMES]
-    if not master_ids_to_check:
-        print("Warning: No masters matched. Checking all masters.\n")
-        master_ids_to_check = [m.id for m in masters]
-else:
-    master_ids_to_check = [m.id for m in masters]
-
-print("### Checking uppercase letters for correct case-sensitive diacritics ###\n")
-
-problems = {}     # masterID → set of glyph names
-tabGlyphs = []    # for tab
-
-for glyph in font.glyphs:
-    if not is_uppercase_glyph(glyph):
-        continue
-
-    for layer in glyph.layers:
-        masterID = layer.associatedMasterId
-        if masterID not in master_ids_to_check:
-            continue
-
-        if not layer.components:
+def build_swap_plan(glyphs, master_ids_to_check, layerData):
+    """
+    Return (plan, problems, tabGlyphs).
+
+    plan is a list of (glyph name, layer, component index, old name, new name)
+    for every regular mark component with a .case counterpart. Glyph names and
+    mark categories are indexed once up front.
+    """
+    names = set()
+    marks = set()
+    for g in glyphs:
+        names.add(g.name)
+        if g.category == "Mark":
+            marks.add(g.name)
+
+    plan = []
+    problems = {}     # masterID → set of glyph names
+    tabGlyphs = []    # for tab
+    for glyph in glyphs:
+        if not is_uppercase_glyph(glyph):
             continue
 
-        for comp in layer.components:
-            compName = comp.componentName
-            if not compName:
+        lastChange = str(glyph.lastChange)
+        for layer in glyph.layers:
+            masterID = layer.associatedMasterId
+            if masterID not in master_ids_to_check:
                 continue
 
-            compGlyph = glyph_by_name(compName)
-            if not compGlyph or compGlyph.category != "Mark":
-                continue
+            # reuse another check's copy of the layer, else read the names only
+            data = layerData.cached(glyph, layer, lastChange)
+            if data is not None:
+                componentNames = [compName for compName, _ in data[1]]
+            else:
+                componentNames = [comp.componentName for comp in layer.components]
+            for index, compName in enumerate(componentNames):
+                # Skip non-marks and accents that are already .case
+                if compName not in marks or compName.endswith(".case"):
+                    continue
 
-            # Skip if already .case
-            if compName.endswith(".case"):
+                caseName = compName + ".case"
+                if caseName in names:
+                    plan.append((glyph.name, layer, index, compName, caseName))
+                    problems.setdefault(masterID, set()).add(glyph.name)
+                    if not tabGlyphs or tabGlyphs[-1] != glyph.name:
+                        tabGlyphs.append(glyph.name)
+    return plan, problems, tabGlyphs
+
+def execute_swap_plan(plan):
+    """Apply plan entries. Entries whose component no longer matches are skipped."""
+    swapped = 0
+    skipped = 0
+    font.disableUpdateInterface()
+    try:
+        for glyphName, layer, index, oldName, newName in plan:
+            comps = layer.components
+            if index >= len(comps) or comps[index].componentName != oldName:
+                skipped += 1
                 continue
-
-            caseName = compName + ".case"
-            if glyph_by_name(caseName):
-                problems.setdefault(masterID, set()).add(glyph.name)
-                if glyph.name not in tabGlyphs:
-                    tabGlyphs.append(glyph.name)
-                break
-
-# Reporting
-if not problems:
-    print("All uppercase glyphs use correct case-sensitive accents. ✓\n")
+            comp = comps[index]
+            transform = comp.transform
+            comp.componentName = newName
+            comp.transform = transform
+            swapped += 1
+    finally:
+        font.enableUpdateInterface()
+    return swapped, skipped
+
+def export_swap_plan(plan, path):
+    entries = [
+        {
+            "glyph": glyphName,
+            "layerId": layer.layerId,
+            "layer": layer.name,
+            "index": index,
+            "from": oldName,
+            "to": newName,
+        }
+        for glyphName, layer, index, oldName, newName in plan
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=1, ensure_ascii=False)
+
+def load_swap_plan(path):
+    """Read an exported plan back into plan entries. Missing glyphs, layers and accents are reported and dropped."""
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    plan = []
+    for e in entries:
+        glyph = font.glyphs[e["glyph"]]
+        layer = glyph.layers[e["layerId"]] if glyph else None
+        if not layer:
+            print(f"• Skipping {e['glyph']} ({e.get('layer')}): layer not found.")
+            continue
+        if font.glyphs[e["to"]] is None:
+            print(f"• Skipping {e['glyph']} ({e.get('layer')}): {e['to']} not found.")
+            continue
+        plan.append((e["glyph"], layer, int(e["index"]), e["from"], e["to"]))
+    return plan
+
+def apply_plan_file(path):
+    print(f"### Applying swap plan {path} ###\n")
+    plan = load_swap_plan(path)
+    swapped, skipped = execute_swap_plan(plan)
+    print(f"Swapped {swapped} components, skipped {skipped} that no longer match.\n")
     print("Done.\n")
-else:
-    print("The following masters contain uppercase glyphs that do NOT use .case accents:\n")
-    for m in masters:
-        if m.id in problems:
-            print(f"• {m.name}: {', '.join(sorted(problems[m.id]))}")
-
-    if tabGlyphs:
-        font.newTab("/" + "/".join(tabGlyphs))
-        print("\nA new tab has been opened with all affected glyphs.\n")
-
-    # Confirmation dialog
-    alert = NSAlert.alloc().init()
-    alert.setMessageText_("Swap to .case accents?")
-    alert.setInformativeText_("Replace regular diacritic components with their .case equivalents in affected glyphs?")
-    alert.addButtonWithTitle_("Swap")
-    alert.addButtonWithTitle_("Cancel")
-
-    response = alert.runModal()
-
-    if response == NSAlertFirstButtonReturn:
-        font.disableUpdateInterface()
 
-        for glyphName in tabGlyphs:
-            glyph = font.glyphs[glyphName]
-
-            for layer in glyph.layers:
-                if layer.associatedMasterId not in master_ids_to_check:
-                    continue
+def check_case_diacritics():
+    # Determine masters to check
+    if MASTER_NAMES:
+        master_ids_to_check = [m.id for m in masters if m.name in MASTER_NAMES]
+        if not master_ids_to_check:
+            print("Warning: No masters matched. Checking all masters.\n")
+            master_ids_to_check = [m.id for m in masters]
+    else:
+        master_ids_to_check = [m.id for m in masters]
 
-                for comp in layer.components:
-                    compName = comp.componentName
-                    if not compName or compName.endswith(".case"):
-                        continue
+    print("### Checking uppercase letters for correct case-sensitive diacritics ###\n")
 
-                    caseName = compName + ".case"
-                    if glyph_by_name(caseName):
-                        transform = comp.transform
-                        comp.componentName = caseName
-                        comp.transform = transform
+    layerData = LayerData(font)
+    plan, problems, tabGlyphs = build_swap_plan(list(font.glyphs), set(master_ids_to_check), layerData)
+    layerData.save()
 
-        font.enableUpdateInterface()
-        print("Swapped regular accents to .case where available.\n")
+    # Reporting
+    if not problems:
+        print("All uppercase glyphs use correct case-sensitive accents. ✓\n")
+        print("Done.\n")
     else:
-        print("No changes made.\n")
-
-    print("Done.\n")
+        print("The following masters contain uppercase glyphs that do NOT use .case accents:\n")
+        for m in masters:
+            if m.id in problems:
+                print(f"• {m.name}: {', '.join(sorted(problems[m.id]))}")
+
+        print(f"\nSwap plan ({len(plan)} components):")
+        for glyphName, layer, index, oldName, newName in plan:
+            print(f"  {glyphName} [{layer.name}] #{index}: {oldName} → {newName}")
+
+        if tabGlyphs:
+            font.newTab("/" + "/".join(tabGlyphs))
+            print("\nA new tab has been opened with all affected glyphs.\n")
+
+        # Confirmation dialog
+        alert = NSAlert.alloc().init()
+        alert.setMessageText_("Swap to .case accents?")
+        alert.setInformativeText_(f"Replace {len(plan)} regular diacritic components with their .case equivalents in affected glyphs?")
+        alert.addButtonWithTitle_("Swap")
+        alert.addButtonWithTitle_("Export Plan…")
+        alert.addButtonWithTitle_("Cancel")
+
+        response = alert.runModal()
+
+        if response == NSAlertFirstButtonReturn:
+            swapped, skipped = execute_swap_plan(plan)
+            print(f"Swapped {swapped} regular accents to .case.\n")
+        elif response == NSAlertSecondButtonReturn:
+            path = GetSaveFile(message="Export .case swap plan", ProposedFileName="case-swap-plan.json", filetypes=["json"])
+            if path:
+                export_swap_plan(plan, path)
+                print(f"Exported swap plan to {path}. Set PLAN_FILE to apply it.\n")
+            else:
+                print("No changes made.\n")
+        else:
+            print("No changes made.\n")
+
+        print("Done.\n")
+
+if PLAN_FILE:
+    apply_plan_file(PLAN_FILE)
+else:
+    check_case_diacritics()
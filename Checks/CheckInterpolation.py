@@ -0,0 +1,346 @@
+# MenuTitle: Check Interpolation at Instances
+# -*- coding: utf-8 -*-
+__doc__ = """
+Interpolates every compatible glyph at the instances and at a grid of
+intermediate locations, and opens a tab with the glyphs that interpolate
+badly there although their masters are fine:
+
+• kinks – nodes that are smooth in every master (handles in line) but
+  whose handles are more than KINK_ANGLE degrees out of line in between
+• direction flips – closed contours that run the same way in every master but
+  the other way in between
+
+The master nodes of many glyphs are stacked into one array per chunk and all
+locations are interpolated with a single matrix product. Master weights are
+multilinear when the masters form a grid over the axes; other designspaces
+need fontTools (its VariationModel, with the first master as origin).
+
+Node positions come from the session's shared layer data (font.tempData),
+so layers another check has already read are not read again.
+"""
+
+from GlyphsApp import *
+import itertools
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from LayerData import LayerData
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from fontTools.varLib.models import VariationModel
+except ImportError:
+    VariationModel = None
+
+# ---------- CONFIGURATION ----------
+CHECK_INSTANCES = True    # interpolate at the font's instances
+GRID_STEPS = 2            # grid locations per axis between neighbouring master values (2 = midpoints, 1 = no grid)
+KINK_ANGLE = 3.0          # degrees out of line that count as a kink
+SMOOTH_TOLERANCE = 0.5    # degrees: a node whose handles are this close to in line in every master is smooth
+MIN_HANDLE = 1.0          # shorter handles (in units) have no direction and are not checked
+MIN_AREA = 4.0            # contours smaller than this (in square units) are not checked for flips
+CHUNK_VALUES = 4000000    # nodes × (locations + masters) interpolated per chunk, bounds memory
+# -----------------------------------
+
+
+# -----------------------------
+# Designspace
+# -----------------------------
+def axis_names(font, count):
+    try:
+        names = [axis.name for axis in font.axes]
+        if len(names) == count:
+            return names
+    except Exception:
+        pass
+    return [f"axis {i + 1}" for i in range(count)]
+
+
+def check_locations(font, masterLocations, names):
+    """Return [(label, location)]: the instances, then the grid between master values, without the masters."""
+    axisCount = len(masterLocations[0])
+    found = []
+    seen = set(masterLocations)
+    if CHECK_INSTANCES:
+        for instance in getattr(font, "instances", None) or ():
+            try:
+                location = tuple(float(v) for v in instance.axes)
+            except Exception:
+                continue
+            if len(location) == axisCount and location not in seen:
+                seen.add(location)
+                found.append((instance.name, location))
+    axisValues = []
+    for a in range(axisCount):
+        values = sorted({loc[a] for loc in masterLocations})
+        samples = [values[0]]
+        for low, high in zip(values, values[1:]):
+            samples.extend(low + (high - low) * s / GRID_STEPS for s in range(1, GRID_STEPS + 1))
+        axisValues.append(samples)
+    for location in itertools.product(*axisValues):
+        if location not in seen:
+            seen.add(location)
+            found.append((", ".join(f"{n}={v:g}" for n, v in zip(names, location)), location))
+    return found
+
+
+def axis_weights(values, v):
+    """Piecewise-linear weights of v over the sorted master values of one axis (extrapolates at the ends)."""
+    weights = [0.0] * len(values)
+    if len(values) == 1:
+        weights[0] = 1.0
+        return weights
+    j = 0
+    while j < len(values) - 2 and v > values[j + 1]:
+        j += 1
+    t = (v - values[j]) / (values[j + 1] - values[j])
+    weights[j] = 1.0 - t
+    weights[j + 1] = t
+    return weights
+
+
+def master_weights(masterLocations, locations):
+    """
+    Return a (locations × masters) array: row i times the stacked master
+    values is the interpolation at locations[i]. None if the designspace
+    needs fontTools and it is not available.
+    """
+    axisCount = len(masterLocations[0])
+    axisValues = [sorted({loc[a] for loc in masterLocations}) for a in range(axisCount)]
+    grid = set(itertools.product(*axisValues))
+    if len(grid) == len(masterLocations) and grid == set(masterLocations):
+        positions = [[axisValues[a].index(loc[a]) for a in range(axisCount)] for loc in masterLocations]
+        weights = np.ones((len(locations), len(masterLocations)))
+        for i, location in enumerate(locations):
+            perAxis = [axis_weights(axisValues[a], location[a]) for a in range(axisCount)]
+            for m, position in enumerate(positions):
+                for a in range(axisCount):
+                    weights[i, m] *= perAxis[a][position[a]]
+        return weights
+    if VariationModel is None:
+        return None
+
+    origin = masterLocations[0]
+
+    def normalize(location):
+        normalized = {}
+        for a, v in enumerate(location):
+            low, default, high = axisValues[a][0], origin[a], axisValues[a][-1]
+            if v < default and default > low:
+                normalized[f"a{a}"] = max(-1.0, (v - default) / (default - low))
+            elif v > default and high > default:
+                normalized[f"a{a}"] = min(1.0, (v - default) / (high - default))
+        return normalized
+
+    model = VariationModel([normalize(loc) for loc in masterLocations], [f"a{a}" for a in range(axisCount)])
+    identity = np.eye(len(masterLocations))
+    return np.array([
+        [model.interpolateFromMasters(normalize(location), list(identity[m])) for m in range(len(masterLocations))]
+        for location in locations
+    ])
+
+
+# -----------------------------
+# Stacking
+# -----------------------------
+def glyph_stack(glyph, masters, layerData):
+    """Return (points, types, path lengths, open paths) of glyph over all masters, or None if not interpolatable."""
+    layers = [glyph.layers[m.id] for m in masters]
+    if any(layer is None for layer in layers):
+        return None
+    lastChange = str(glyph.lastChange)
+    structure = None
+    points = []
+    for layer in layers:
+        paths, _, openPaths, _ = layerData.get(glyph, layer, lastChange)
+        shape = (tuple(tuple(n[2] for n in path) for path in paths), openPaths)
+        if structure is None:
+            structure = shape
+        elif shape != structure:
+            return None
+        points.append([(x, y) for path in paths for x, y, _ in path])
+    if not structure[0]:
+        return None
+    return points, [t for path in structure[0] for t in path], [len(path) for path in structure[0]], set(structure[1])
+
+
+class Chunk(object):
+    """
+    The master nodes of several glyphs in one (masters × nodes × 2) array, with
+    the node neighbours per contour. Closed contours wrap around; the end
+    nodes of open contours are their own neighbours on the open side and are
+    not inner nodes.
+    """
+
+    def __init__(self, masterCount):
+        self.points = [[] for _ in range(masterCount)]
+        self.onCurve = []
+        self.prev = []
+        self.next = []
+        self.inner = []   # per node: has a neighbour on both sides
+        self.pathStarts = []
+        self.closed = []  # per contour
+        self.owners = []  # per contour: (glyph name, path index, first node)
+        self.size = 0
+
+    def add(self, name, stack):
+        points, types, lengths, openPaths = stack
+        for m, masterPoints in enumerate(points):
+            self.points[m].extend(masterPoints)
+        self.onCurve.extend(t != OFFCURVE for t in types)
+        start = self.size
+        for p, length in enumerate(lengths):
+            closed = p not in openPaths
+            last = start + length - 1
+            self.pathStarts.append(start)
+            self.closed.append(closed)
+            self.owners.append((name, p, start))
+            self.prev.extend([last if closed else start] + list(range(start, last)))
+            self.next.extend(list(range(start + 1, last + 1)) + [start if closed else last])
+            self.inner.extend([closed] + [True] * (length - 2) + [closed] if length > 1 else [False])
+            start += length
+        self.size = start
+
+
+# -----------------------------
+# Checking
+# -----------------------------
+def turn_angles(before, at, after):
+    """Degrees between the incoming and outgoing direction at each node, and the shorter of the two handle lengths."""
+    incoming = at - before
+    outgoing = after - at
+    cross = incoming[..., 0] * outgoing[..., 1] - incoming[..., 1] * outgoing[..., 0]
+    dot = (incoming * outgoing).sum(axis=-1)
+    shortest = np.minimum(np.hypot(incoming[..., 0], incoming[..., 1]), np.hypot(outgoing[..., 0], outgoing[..., 1]))
+    return np.degrees(np.arctan2(np.abs(cross), dot)), shortest
+
+
+def signed_areas(points, next_, pathStarts):
+    """Signed area per contour; only meaningful for closed contours (open ones have no closing edge)."""
+    x, y = points[..., 0], points[..., 1]
+    terms = x * y[..., next_] - x[..., next_] * y
+    return np.add.reduceat(terms, pathStarts, axis=-1) * 0.5
+
+
+def check_chunk(chunk, weights, labels, findings):
+    """Interpolate chunk at every location and add (kind, path, node) → [worst value, location label, count] per glyph to findings."""
+    masters = np.array(chunk.points, dtype=float)                # masters × nodes × 2
+    located = np.tensordot(weights, masters, axes=(1, 0))        # locations × nodes × 2
+    prev = np.array(chunk.prev)
+    next_ = np.array(chunk.next)
+    pathStarts = np.array(chunk.pathStarts)
+    contour = np.repeat(np.arange(len(pathStarts)), np.diff(np.append(pathStarts, chunk.size)))
+
+    # kinks: smooth in every master, out of line somewhere in between
+    angles, shortest = turn_angles(masters[:, prev], masters, masters[:, next_])
+    smooth = np.array(chunk.onCurve) & np.array(chunk.inner) & (angles < SMOOTH_TOLERANCE).all(axis=0) & (shortest > MIN_HANDLE).all(axis=0)
+    nodes = np.nonzero(smooth)[0]
+    if len(nodes):
+        angles, shortest = turn_angles(located[:, prev[nodes]], located[:, nodes], located[:, next_[nodes]])
+        kinked = (angles > KINK_ANGLE) & (shortest > MIN_HANDLE)
+        for l, n in zip(*np.nonzero(kinked)):
+            node = nodes[n]
+            name, pathIndex, first = chunk.owners[contour[node]]
+            record(findings, name, ("kink", pathIndex, node - first), float(angles[l, n]), labels[l])
+
+    # direction flips: closed contours with the same sign in every master, the other sign in between
+    areas = signed_areas(masters, next_, pathStarts)
+    steady = np.array(chunk.closed) & ((areas > MIN_AREA).all(axis=0) | (areas < -MIN_AREA).all(axis=0))
+    locatedAreas = signed_areas(located, next_, pathStarts)
+    flipped = steady & (np.sign(locatedAreas) != np.sign(areas[0]))
+    for l, c in zip(*np.nonzero(flipped)):
+        name, pathIndex, _ = chunk.owners[c]
+        record(findings, name, ("flip", pathIndex, -1), abs(float(locatedAreas[l, c])), labels[l])
+
+
+def record(findings, name, key, value, label):
+    entry = findings.setdefault(name, {}).get(key)
+    if entry is None:
+        findings[name][key] = [value, label, 1]
+    else:
+        if value > entry[0]:
+            entry[0], entry[1] = value, label
+        entry[2] += 1
+
+
+# -----------------------------
+# Main
+# -----------------------------
+def check_interpolation():
+    masters = list(font.masters)
+    if len(masters) < 2:
+        print("Needs at least two masters.")
+        return
+    try:
+        masterLocations = [tuple(float(v) for v in m.axes) for m in masters]
+    except Exception:
+        masterLocations = []
+    if not masterLocations or not masterLocations[0] or len(set(masterLocations)) != len(masters):
+        print("The masters need distinct axis locations.")
+        return
+
+    names = axis_names(font, len(masterLocations[0]))
+    locations = check_locations(font, masterLocations, names)
+    if not locations:
+        print("No instances or intermediate locations to check.")
+        return
+    weights = master_weights(masterLocations, [loc for _, loc in locations])
+    if weights is None:
+        print("The masters do not form a grid over the axes; this designspace needs fontTools.")
+        return
+    labels = [label for label, _ in locations]
+
+    layerData = LayerData(font)
+    findings = {}  # glyph name → {(kind, path, node): [worst value, location label, count]}
+    checked = skipped = 0
+    nodesPerChunk = max(1000, CHUNK_VALUES // (len(locations) + len(masters)))
+    chunk = Chunk(len(masters))
+    for glyph in font.glyphs:
+        stack = glyph_stack(glyph, masters, layerData)
+        if stack is None:
+            skipped += 1
+            continue
+        checked += 1
+        chunk.add(glyph.name, stack)
+        if chunk.size >= nodesPerChunk:
+            check_chunk(chunk, weights, labels, findings)
+            chunk = Chunk(len(masters))
+    if chunk.size:
+        check_chunk(chunk, weights, labels, findings)
+    layerData.save()
+    print(layerData.summary())
+    print(f"Checked {checked} glyphs at {len(locations)} locations ({skipped} without paths or not compatible).\n")
+
+    if not findings:
+        print("No kinks or direction flips found.")
+        return
+    for glyph in font.glyphs:
+        found = findings.get(glyph.name)
+        if not found:
+            continue
+        print(f"• {glyph.name}")
+        for (kind, pathIndex, nodeIndex), (value, label, count) in sorted(found.items(), key=lambda item: (item[0][1], item[0][2])):
+            where = f"{count} location{'s' if count != 1 else ''}, worst at {label}"
+            if kind == "kink":
+                print(f"    path {pathIndex} node {nodeIndex}: kink of {value:.1f}° ({where})")
+            else:
+                print(f"    path {pathIndex}: direction flips ({where})")
+    font.newTab("/" + "/".join(name for name in (g.name for g in font.glyphs) if name in findings))
+    print(f"\nOpened {len(findings)} glyphs with kinks or direction flips.")
+
+
+font = Glyphs.font
+
+if not font:
+    print("No font open.")
+elif np is None:
+    print("This check needs NumPy.")
+else:
+    check_interpolation()
@@ -1,49 +1,625 @@
 # Open Layers with Close Nodes
 
 from GlyphsApp import *
+from AppKit import NSAlert, NSAlertFirstButtonReturn
+import json
 import math
+import os
+import sys
 
-THRESHOLD = 5.0
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from LayerData import LayerData, read_layer_data
+from ProgressRunner import ProgressRunner
+from ResultStore import ResultStore, layer_hash
 
-font = Glyphs.font
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-if not font:
-    print("No font open.")
-else:
-    layersToOpen = []
+# ---------- CONFIGURATION ----------
+THRESHOLD = 5.0            # nodes closer than this (in units) are reported
+INCLUDE_OFFCURVES = False  # also compare off-curve (handle) nodes
+VECTORIZED = True          # scan each master as one NumPy array (falls back to per-path grid without NumPy)
+CROSS_PATHS = False        # also compare nodes of different paths in the same layer
+INCLUDE_COMPONENTS = True  # with CROSS_PATHS: also compare against decomposed component outlines
+FIX_MODE = False           # plan merges of close on-curve runs in flagged layers and offer to apply them
+DRY_RUN = True             # with FIX_MODE: only print the merge plan, never touch the font
+MERGE_TO = "midpoint"      # "midpoint" or "grid" (midpoint rounded to the font grid)
+USE_STORE = True           # reuse results of unchanged layers between sessions (saved fonts only)
+BACKGROUND = True          # scan on a worker thread so the font stays editable (inside Glyphs only)
+CHUNK_LAYERS = 2000        # layers per scan chunk: progress, results and Cancel are handled between chunks
+# -----------------------------------
+
+
+def path_points(nodes):
+    """Return [(x, y)] of the nodes to compare, from a path's (x, y, type) node tuples."""
+    return [(x, y) for x, y, nodeType in nodes if INCLUDE_OFFCURVES or nodeType != OFFCURVE]
+
+
+def close_pairs(points, threshold):
+    """
+    Return [(i, j, distance)] for every pair of points closer than threshold.
+
+    Points are bucketed into a grid with cells of size threshold, so each
+    point is only compared with the points in its own and the 8 adjacent cells.
+    """
+    pairs = []
+    if threshold <= 0 or len(points) < 2:
+        return pairs
+
+    grid = {}
+    for j, (x, y) in enumerate(points):
+        cx = math.floor(x / threshold)
+        cy = math.floor(y / threshold)
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for i in grid.get((gx, gy), ()):
+                    px, py = points[i]
+                    distance = math.hypot(x - px, y - py)
+                    if distance < threshold:
+                        pairs.append((i, j, distance))
+        grid.setdefault((cx, cy), []).append(j)
+
+    pairs.sort()
+    return pairs
+
+
+def close_pairs_between(pointsA, pointsB, threshold):
+    """Return [(i, j, distance)] for points of A closer than threshold to points of B."""
+    pairs = []
+    if threshold <= 0 or not pointsA or not pointsB:
+        return pairs
+
+    grid = {}
+    for j, (x, y) in enumerate(pointsB):
+        grid.setdefault((math.floor(x / threshold), math.floor(y / threshold)), []).append(j)
+
+    for i, (x, y) in enumerate(pointsA):
+        cx = math.floor(x / threshold)
+        cy = math.floor(y / threshold)
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for j in grid.get((gx, gy), ()):
+                    px, py = pointsB[j]
+                    distance = math.hypot(x - px, y - py)
+                    if distance < threshold:
+                        pairs.append((i, j, distance))
+
+    pairs.sort()
+    return pairs
+
+
+def scan_layer(paths):
+    """Return [(pathIndex, p1, p2, distance)] for all close pairs in a layer's paths."""
+    layerPairs = []
+    for pathIndex, nodes in enumerate(paths):
+        points = path_points(nodes)
+        for i, j, distance in close_pairs(points, THRESHOLD):
+            layerPairs.append((pathIndex, points[i], points[j], distance))
+    return layerPairs
+
+
+def scan_master_vectorized(snapshot):
+    """
+    Scan the layers of one master snapshot in a single set of array operations.
+
+    Close pairs are found with a sorted-axis sweep over the snapshot's node
+    array: nodes are sorted by (path, x) and every offset k compares each node
+    with the k-th next node of the same path, stopping as soon as no pair is
+    within THRESHOLD on the x axis.
+
+    Returns {layer position in the snapshot: [(pathIndex, p1, p2, distance)]}.
+    """
+    found = {}
+    coords = snapshot.coords
+    if not len(coords) or THRESHOLD <= 0:
+        return found
+
+    pathOffsets = snapshot.pathOffsets
+    layerOffsets = snapshot.layerOffsets
+    pathIds = np.repeat(np.arange(len(pathOffsets) - 1), np.diff(pathOffsets))
+    layerOfPath = np.repeat(np.arange(len(layerOffsets) - 1), np.diff(layerOffsets))
+    order = np.lexsort((coords[:, 0], pathIds))
+    sortedCoords = coords[order]
+    paths = pathIds[order]
+
+    firsts, seconds = [], []
+    for k in range(1, len(sortedCoords)):
+        samePath = paths[k:] == paths[:-k]
+        near = samePath & ((sortedCoords[k:, 0] - sortedCoords[:-k, 0]) < THRESHOLD)
+        if not near.any():
+            break
+        idx = np.nonzero(near)[0]
+        delta = sortedCoords[idx + k] - sortedCoords[idx]
+        close = np.hypot(delta[:, 0], delta[:, 1]) < THRESHOLD
+        firsts.append(idx[close])
+        seconds.append(idx[close] + k)
+
+    if not firsts:
+        return found
+
+    a = order[np.concatenate(firsts)]
+    b = order[np.concatenate(seconds)]
+    i = np.minimum(a, b)
+    j = np.maximum(a, b)
+    for pairIndex in np.lexsort((j, i)):
+        n1, n2 = int(i[pairIndex]), int(j[pairIndex])
+        p1 = tuple(coords[n1].tolist())
+        p2 = tuple(coords[n2].tolist())
+        distance = math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+        pathId = int(pathIds[n1])
+        position = int(layerOfPath[pathId])
+        found.setdefault(position, []).append((pathId - int(layerOffsets[position]), p1, p2, distance))
+    return found
+
+
+# -----------------------------
+# Cross-path / cross-component
+# -----------------------------
+_componentOutlines = {}  # (component glyph name, master id) → [[(x, y)] per decomposed path]
+
+
+def component_outlines(component, masterId):
+    """Return the untransformed outlines of a component's glyph, decomposed once per master."""
+    key = (component.componentName, masterId)
+    outlines = _componentOutlines.get(key)
+    if outlines is None:
+        outlines = []
+        try:
+            baseLayer = component.componentLayer
+            if baseLayer is not None:
+                if baseLayer.components:
+                    baseLayer = baseLayer.copyDecomposedLayer()
+                paths = read_layer_data(baseLayer)[0]
+                outlines = [points for points in (path_points(nodes) for nodes in paths) if points]
+        except Exception:
+            outlines = []
+        _componentOutlines[key] = outlines
+    return outlines
+
+
+def transform_points(points, transform):
+    a, b, c, d, tx, ty = transform
+    return [(a * x + c * y + tx, b * x + d * y + ty) for x, y in points]
+
+
+def bounding_box(points):
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def layer_outlines(paths, components, masterId):
+    """
+    Return [(label, owner, points, bbox)] for every path and component path of
+    a layer, from its layer data. Component outlines must have been read with
+    component_outlines() before; nothing here reads the font.
+    """
+    outlines = []
+    for pathIndex, nodes in enumerate(paths):
+        points = path_points(nodes)
+        if points:
+            outlines.append((f"path {pathIndex}", ("path", pathIndex), points, bounding_box(points)))
+
+    if INCLUDE_COMPONENTS:
+        for compIndex, (name, transform) in enumerate(components):
+            for points in _componentOutlines.get((name, masterId), ()):
+                points = transform_points(points, transform)
+                outlines.append((f"component {name}", ("component", compIndex), points, bounding_box(points)))
+    return outlines
+
+
+def candidate_outline_pairs(outlines, threshold):
+    """
+    Yield (a, b) index pairs of outlines whose bounding boxes, grown by
+    threshold, overlap. Boxes are swept along x in order of their left edge,
+    so only outlines that overlap on the x axis are ever tested against each other.
+    """
+    order = sorted(range(len(outlines)), key=lambda k: outlines[k][3][0])
+    active = []
+    for b in order:
+        bxMin, byMin, bxMax, byMax = outlines[b][3]
+        active = [a for a in active if outlines[a][3][2] + threshold > bxMin]
+        for a in active:
+            _, ayMin, _, ayMax = outlines[a][3]
+            if ayMin - threshold < byMax and byMin - threshold < ayMax:
+                yield (a, b) if a < b else (b, a)
+        active.append(b)
+
+
+def scan_layer_cross(paths, components, masterId):
+    """Return [(labelA, labelB, p1, p2, distance)] for close nodes in different outlines."""
+    outlines = layer_outlines(paths, components, masterId)
+    crossPairs = []
+    for a, b in sorted(candidate_outline_pairs(outlines, THRESHOLD)):
+        labelA, ownerA, pointsA, _ = outlines[a]
+        labelB, ownerB, pointsB, _ = outlines[b]
+        if ownerA == ownerB:
+            # paths of the same component belong to the base glyph's own check
+            continue
+        for i, j, distance in close_pairs_between(pointsA, pointsB, THRESHOLD):
+            crossPairs.append((labelA, labelB, pointsA[i], pointsB[j], distance))
+    return crossPairs
+
+
+# -----------------------------
+# Snapshot
+# -----------------------------
+class MasterSnapshot(object):
+    """
+    Everything the scan needs from the stale layers of one master, copied in
+    one pass on the main thread. The scan then runs on a worker thread without
+    touching the font, so the designer can keep drawing.
 
-    for glyph in font.glyphs:
-        for master in font.masters:
-            layer = glyph.layers[master.id]
-            if not layer:
-                continue
+    layerPaths and components hold each layer's data tuples. With NumPy, the
+    compared nodes are also packed into one read-only (n, 2) float array, with
+    pathOffsets (start of every path's nodes, plus the end) and layerOffsets
+    (start of every layer's paths, plus the end).
+    """
 
-            foundCloseNodes = False
+    def __init__(self, masterIndex, masterId, glyphIndexes, layers):
+        self.masterIndex = masterIndex
+        self.masterId = masterId
+        self.glyphIndexes = glyphIndexes           # glyph index of every layer
+        self.layerPaths = [data[0] for data in layers]
+        self.components = [data[1] for data in layers]
+        self.coords = self.pathOffsets = self.layerOffsets = None
+        if np is None:
+            return
 
-            for path in layer.paths:
-                nodes = [n for n in path.nodes if n.type != OFFCURVE]
-                nodeCount = len(nodes)
+        xs, ys, pathSizes, layerSizes = [], [], [], []
+        for paths in self.layerPaths:
+            layerSizes.append(len(paths))
+            for nodes in paths:
+                points = path_points(nodes)
+                pathSizes.append(len(points))
+                for x, y in points:
+                    xs.append(x)
+                    ys.append(y)
+        self.coords = np.column_stack((np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)))
+        self.pathOffsets = np.concatenate(([0], np.cumsum(pathSizes, dtype=np.int64)))
+        self.layerOffsets = np.concatenate(([0], np.cumsum(layerSizes, dtype=np.int64)))
+        for array in (self.coords, self.pathOffsets, self.layerOffsets):
+            array.flags.writeable = False
 
-                for i in range(nodeCount):
-                    n1 = nodes[i]
-                    for j in range(i + 1, nodeCount):
-                        n2 = nodes[j]
 
-                        dx = n1.position.x - n2.position.x
-                        dy = n1.position.y - n2.position.y
-                        distance = math.hypot(dx, dy)
+def scan_snapshot(snapshot, vectorized):
+    """
+    Scan one snapshot. Reads no font objects, so it can run on a worker thread.
+    Returns {(glyphIndex, masterIndex): (layerPairs, crossPairs)}.
+    """
+    results = {}
+    found = scan_master_vectorized(snapshot) if vectorized else None
+    for position, glyphIndex in enumerate(snapshot.glyphIndexes):
+        paths = snapshot.layerPaths[position]
+        if found is not None:
+            layerPairs = found.get(position) or []
+        else:
+            layerPairs = scan_layer(paths)
+        crossPairs = scan_layer_cross(paths, snapshot.components[position], snapshot.masterId) if CROSS_PATHS else []
+        results[(glyphIndex, snapshot.masterIndex)] = (layerPairs, crossPairs)
+    return results
 
-                        if distance < THRESHOLD:
-                            layersToOpen.append(layer)
-                            foundCloseNodes = True
-                            break
-                    if foundCloseNodes:
-                        break
-                if foundCloseNodes:
-                    break
+
+def glyph_stamps(glyphs, deps, newDeps, withComponents):
+    """
+    Return {glyph name: (lastChange, component stamps)}. Component stamps are
+    only filled in withComponents, recursively, so editing a base glyph changes
+    the stamp of every composite built on it. deps maps names to (lastChange,
+    component names) and is updated in place; updates are also put in newDeps.
+    """
+    byName = {g.name: g for g in glyphs}
+    stamps = {}
+
+    def stamp(name):
+        if name in stamps:
+            return stamps[name]
+        stamps[name] = None  # guards against component cycles
+        glyph = byName.get(name)
+        if glyph is None:
+            return None
+        lastChange = str(glyph.lastChange)
+        componentStamps = ()
+        if withComponents:
+            known = deps.get(name)
+            if known is None or known[0] != lastChange:
+                names = sorted({c.componentName for layer in glyph.layers for c in layer.components})
+                known = deps[name] = newDeps[name] = (lastChange, names)
+            componentStamps = tuple(stamp(dep) for dep in known[1])
+        stamps[name] = (lastChange, componentStamps)
+        return stamps[name]
+
+    for glyph in glyphs:
+        stamp(glyph.name)
+    return stamps
+
+
+# -----------------------------
+# Fix mode
+# -----------------------------
+def close_oncurve_runs(path):
+    """
+    Return runs of consecutive on-curve nodes of path where each node is closer
+    than THRESHOLD to the next one, as lists of (nodeIndex, (x, y)).
+    Runs wrap around the start node of closed paths.
+    """
+    onCurves = []
+    for index, n in enumerate(path.nodes):
+        if n.type != OFFCURVE:
+            pos = n.position
+            onCurves.append((index, (pos.x, pos.y)))
+    count = len(onCurves)
+    if count < 2:
+        return []
+
+    closed = bool(getattr(path, "closed", True))
+    linkCount = count if closed else count - 1
+    isClose = [
+        math.hypot(onCurves[k][1][0] - onCurves[(k + 1) % count][1][0],
+                   onCurves[k][1][1] - onCurves[(k + 1) % count][1][1]) < THRESHOLD
+        for k in range(linkCount)
+    ]
+    if not any(isClose):
+        return []
+    if closed and all(isClose):
+        # merging every node would collapse the path
+        return []
+
+    # start on a node that does not continue a run from its predecessor
+    start = 0
+    if closed:
+        while isClose[start - 1]:
+            start += 1
+
+    runs = []
+    current = [onCurves[start]]
+    for step in range(linkCount):
+        k = (start + step) % count
+        if isClose[k]:
+            current.append(onCurves[(k + 1) % count])
+        else:
+            if len(current) > 1:
+                runs.append(current)
+            current = [onCurves[(k + 1) % count]]
+    if len(current) > 1:
+        runs.append(current)
+    return runs
+
+
+def merge_target(points, grid):
+    x = sum(p[0] for p in points) / len(points)
+    y = sum(p[1] for p in points) / len(points)
+    if MERGE_TO == "grid" and grid:
+        x = round(x / grid) * grid
+        y = round(y / grid) * grid
+    return x, y
+
+
+def plan_merges(layer, grid):
+    """Return [(pathIndex, [nodeIndex], [(x, y)], target)] for every close on-curve run in layer."""
+    merges = []
+    for pathIndex, path in enumerate(layer.paths):
+        for run in close_oncurve_runs(path):
+            indexes = [index for index, _ in run]
+            points = [point for _, point in run]
+            merges.append((pathIndex, indexes, points, merge_target(points, grid)))
+    return merges
+
+
+def apply_merges(layer, merges):
+    """
+    Collapse each planned run into its first node: move that node to the target
+    and delete the following nodes of the run, including the handles between them.
+    """
+    byPath = {}
+    for pathIndex, indexes, _, target in merges:
+        byPath.setdefault(pathIndex, []).append((indexes, target))
+
+    for pathIndex, runs in byPath.items():
+        path = layer.paths[pathIndex]
+        nodeCount = len(path.nodes)
+        doomed = set()
+        for indexes, (x, y) in runs:
+            first, last = indexes[0], indexes[-1]
+            k = first
+            while k != last:
+                k = (k + 1) % nodeCount
+                doomed.add(k)
+            node = path.nodes[first]
+            node.x = x
+            node.y = y
+        for k in sorted(doomed, reverse=True):
+            del path.nodes[k]
+
+
+def run_fix(flagged, grid):
+    """Analysis pass over all flagged layers, dry-run report, then one mutation pass with one undo group per glyph."""
+    plan = []
+    for glyphName, masterName, layer in flagged:
+        merges = plan_merges(layer, grid)
+        if merges:
+            plan.append((glyphName, masterName, layer, merges))
+
+    mergeCount = sum(len(merges) for _, _, _, merges in plan)
+    if not plan:
+        print("\nNo close on-curve runs to merge.")
+        return
+
+    print(f"\nMerge plan ({MERGE_TO}):\n")
+    for glyphName, masterName, _, merges in plan:
+        print(f"• {glyphName} [{masterName}]")
+        for pathIndex, _, points, (x, y) in merges:
+            sources = ", ".join(f"({px:g}, {py:g})" for px, py in points)
+            print(f"    path {pathIndex}: {sources} → ({x:g}, {y:g})")
+    print(f"\n{mergeCount} merges in {len(plan)} layers.")
+
+    if DRY_RUN:
+        print("Dry run: no changes made. Set DRY_RUN = False to apply.")
+        return
+
+    alert = NSAlert.alloc().init()
+    alert.setMessageText_("Merge close nodes?")
+    alert.setInformativeText_(f"Apply {mergeCount} merges in {len(plan)} layers? See the Macro Panel for the full plan.")
+    alert.addButtonWithTitle_("Merge")
+    alert.addButtonWithTitle_("Cancel")
+    if alert.runModal() != NSAlertFirstButtonReturn:
+        print("No changes made.")
+        return
+
+    # one pass on the main thread with the interface updates off; each glyph's merges are one undo step
+    byGlyph = {}
+    for _, _, layer, merges in plan:
+        byGlyph.setdefault(layer.parent.name, []).append((layer, merges))
+    font.disableUpdateInterface()
+    try:
+        for edits in byGlyph.values():
+            glyph = edits[0][0].parent
+            glyph.beginUndo()
+            try:
+                for layer, merges in edits:
+                    apply_merges(layer, merges)
+            finally:
+                glyph.endUndo()
+    finally:
+        font.enableUpdateInterface()
+    print(f"Merged {mergeCount} runs of close nodes.")
+
+
+def report_results(glyphs, masters, results):
+    """Print the close pairs, open the flagged layers and run FIX_MODE. Main thread."""
+    layersToOpen = []
+    report = []
+    flagged = []  # layers with close nodes inside a path, candidates for FIX_MODE
+    for glyphIndex, glyph in enumerate(glyphs):
+        for masterIndex, master in enumerate(masters):
+            layerPairs, crossPairs = results.get((glyphIndex, masterIndex), ((), ()))
+            if layerPairs or crossPairs:
+                layer = glyph.layers[master.id]
+                layersToOpen.append(layer)
+                report.append((glyph.name, master.name, layerPairs, crossPairs))
+                if layerPairs:
+                    flagged.append((glyph.name, master.name, layer))
 
     if layersToOpen:
+        pairCount = sum(len(pairs) + len(crossPairs) for _, _, pairs, crossPairs in report)
+        print(f"Close node pairs (< {THRESHOLD} units):\n")
+        for glyphName, masterName, pairs, crossPairs in report:
+            print(f"• {glyphName} [{masterName}]")
+            for pathIndex, (x1, y1), (x2, y2), distance in pairs:
+                print(f"    path {pathIndex}: ({x1:g}, {y1:g}) ↔ ({x2:g}, {y2:g})  d={distance:.2f}")
+            for labelA, labelB, (x1, y1), (x2, y2), distance in crossPairs:
+                print(f"    {labelA} ↔ {labelB}: ({x1:g}, {y1:g}) ↔ ({x2:g}, {y2:g})  d={distance:.2f}")
+
         font.newTab(layersToOpen)
-        print(f"Opened {len(layersToOpen)} layers with on-curve nodes closer than {THRESHOLD} units.")
+        nodeKind = "nodes" if INCLUDE_OFFCURVES else "on-curve nodes"
+        print(f"\nOpened {len(layersToOpen)} layers with {pairCount} pairs of {nodeKind} closer than {THRESHOLD} units.")
+
+        if FIX_MODE:
+            run_fix(flagged, getattr(font, "grid", 1) or 1)
     else:
-        print("No layers found with close on-curve nodes.")
\ No newline at end of file
+        print("No layers found with close on-curve nodes.")
+
+
+def check_close_nodes():
+    glyphs = list(font.glyphs)
+    masters = list(font.masters)
+
+    # a stored result is reused while its glyph's stamp, or else its layer's content hash, is unchanged
+    withComponents = CROSS_PATHS and INCLUDE_COMPONENTS
+    store = ResultStore(font, "CloseNodes", json.dumps([THRESHOLD, INCLUDE_OFFCURVES, CROSS_PATHS, withComponents]), USE_STORE)
+    known = store.load()
+    newDeps = {}
+    stamps = glyph_stamps(glyphs, store.load_deps(), newDeps, withComponents)
+    layerData = LayerData(font)
+
+    results = {}  # (glyphIndex, masterIndex) → (layerPairs, crossPairs)
+    stale = {}    # masterIndex → ([glyphIndex], [layer data]) of layers to scan
+    hashes = {}   # (glyphIndex, masterIndex) → layer hash of stale layers
+    rows = []     # new store rows
+    scanned = []  # keys of the layers scanned in this run
+
+    vectorized = VECTORIZED and np is not None
+    if VECTORIZED and np is None:
+        print("NumPy not available, scanning path by path.\n")
+
+    def read_layers():
+        # main thread: the only phase that reads the font
+        for glyphIndex, glyph in enumerate(glyphs):
+            stamp = stamps[glyph.name]
+            stampText = repr(stamp)
+            for masterIndex, master in enumerate(masters):
+                entry = known.get((glyph.name, master.id))
+                if entry is not None and entry[0] == stampText:
+                    results[(glyphIndex, masterIndex)] = entry[2]
+                    continue
+                layer = glyph.layers[master.id]
+                if not layer:
+                    continue
+                data = layerData.get(glyph, layer, stamp[0])
+                layerHash = layer_hash(data, repr(stamp[1]))
+                if entry is not None and entry[1] == layerHash:
+                    results[(glyphIndex, masterIndex)] = entry[2]
+                    rows.append((glyph.name, master.id, stampText, layerHash, entry[2]))
+                    continue
+                hashes[(glyphIndex, masterIndex)] = layerHash
+                glyphIndexes, layers = stale.setdefault(masterIndex, ([], []))
+                glyphIndexes.append(glyphIndex)
+                layers.append(data)
+                if withComponents:
+                    for component in layer.components:
+                        component_outlines(component, master.id)
+            yield glyphIndex + 1, len(glyphs), []
+
+    def scan_layers():
+        # worker thread (with BACKGROUND): works on snapshots only
+        total = sum(len(glyphIndexes) for glyphIndexes, _ in stale.values())
+        done = 0
+        for masterIndex, (glyphIndexes, layers) in stale.items():
+            for start in range(0, len(glyphIndexes), CHUNK_LAYERS):
+                snapshot = MasterSnapshot(
+                    masterIndex, masters[masterIndex].id,
+                    glyphIndexes[start:start + CHUNK_LAYERS], layers[start:start + CHUNK_LAYERS],
+                )
+                found = scan_snapshot(snapshot, vectorized)
+                results.update(found)
+                scanned.extend(found)
+                done += len(found)
+                yield done, total, [key for key, (layerPairs, crossPairs) in found.items() if layerPairs or crossPairs]
+
+    def show_found(keys):
+        for glyphIndex, masterIndex in keys:
+            layerPairs, crossPairs = results[(glyphIndex, masterIndex)]
+            print(f"  found {glyphs[glyphIndex].name} [{masters[masterIndex].name}]: {len(layerPairs) + len(crossPairs)} pairs")
+
+    def finish(cancelled):
+        for key in scanned:
+            glyphIndex, masterIndex = key
+            glyph = glyphs[glyphIndex]
+            rows.append((glyph.name, masters[masterIndex].id, repr(stamps[glyph.name]), hashes[key], list(results[key])))
+        layerData.save()
+        if layerData.runHits or layerData.runMisses:
+            print(layerData.summary() + "\n")
+        if store.db is not None:
+            print(f"Result store: scanned {len(scanned)} layers, reused {len(results) - len(scanned)}.\n")
+        store.save(rows, store.gone(known, stamps, {m.id for m in masters}))
+        store.save_deps(newDeps)
+        store.close()
+        if cancelled:
+            print("Cancelled: showing the layers checked so far.\n")
+        report_results(glyphs, masters, results)
+
+    ProgressRunner("Close Nodes", "layers").run([
+        ("Reading layers…", False, read_layers),
+        ("Scanning for close nodes…", BACKGROUND, scan_layers),
+    ], show_found, finish)
+
+
+font = Glyphs.font
+
+if not font:
+    print("No font open.")
+else:
+    check_close_nodes()
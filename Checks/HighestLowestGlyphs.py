@@ -1,33 +1,103 @@
 #MenuTitle: Highest & Lowest Glyphs
 # -*- coding: utf-8 -*-
+__doc__ = """
+Reports the TOP_K tallest and deepest glyphs per master, with a histogram of
+top and bottom values, and opens them in a new tab. Ignores backup layers.
+
+Bounds are kept in a per-font table (font.tempData) for the session, shared
+with Vertical Metrics Calculator. Re-runs only rescan glyphs whose lastChange,
+or whose components' lastChange, differs from the stored one. Composite bounds
+come from cached component bounds.
+"""
 
 from GlyphsApp import Glyphs
+import heapq
+import math
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from GlyphBounds import bounds_table
+
+# ---------- CONFIGURATION ----------
+TOP_K = 10             # tallest/deepest layers reported per master
+HISTOGRAM_BIN = 50     # histogram bucket size in units
+HISTOGRAM_WIDTH = 40   # characters for the longest histogram bar
+# -----------------------------------
+
+
+# -----------------------------
+# Report helpers
+# -----------------------------
+def histogram(values):
+    """Return [(binStart, count)] for values, bucketed by HISTOGRAM_BIN."""
+    counts = {}
+    for v in values:
+        b = math.floor(v / HISTOGRAM_BIN) * HISTOGRAM_BIN
+        counts[b] = counts.get(b, 0) + 1
+    return sorted(counts.items())
+
+
+def print_histogram(title, values):
+    bins = histogram(values)
+    if not bins:
+        return
+    print(f"  {title}:")
+    peak = max(count for _, count in bins)
+    for start, count in bins:
+        bar = "█" * max(1, round(count * HISTOGRAM_WIDTH / peak))
+        print(f"    {start:>6g} … {start + HISTOGRAM_BIN:<6g} {count:>6}  {bar}")
 
-maxY = None
-minY = None
-highest = None
-lowest = None
 
 font = Glyphs.font
 
-for glyph in font.glyphs:
-    for layer in glyph.layers:
-        if not layer.isMasterLayer:
+if not font:
+    print("No font open.")
+else:
+    table = bounds_table(font)
+    masters = list(font.masters)
+    masterCount = len(masters)
+
+    maxY = None
+    minY = None
+    layersToOpen = []
+    for k, master in enumerate(masters):
+        opened = set()
+        tops = []
+        bottoms = []
+        for i in range(len(table.names)):
+            top = table.top[i * masterCount + k]
+            if top != top:  # nan: empty layer
+                continue
+            tops.append((top, i))
+            bottoms.append((table.bottom[i * masterCount + k], i))
+
+        if not tops:
             continue
 
-        top = layer.bounds.origin.y + layer.bounds.size.height
-        bottom = layer.bounds.origin.y
+        tallest = heapq.nlargest(TOP_K, tops, key=lambda t: t[0])
+        deepest = heapq.nsmallest(TOP_K, bottoms, key=lambda t: t[0])
+
+        if maxY is None or tallest[0][0] > maxY:
+            maxY = tallest[0][0]
+        if minY is None or deepest[0][0] < minY:
+            minY = deepest[0][0]
 
-        if maxY is None or top > maxY:
-            maxY = top
-            highest = layer
+        print(f"\n• {master.name}")
+        print("  tallest: " + ", ".join(f"{table.names[i]} ({top:g})" for top, i in tallest))
+        print("  deepest: " + ", ".join(f"{table.names[i]} ({bottom:g})" for bottom, i in deepest))
+        print_histogram("top", [top for top, _ in tops])
+        print_histogram("bottom", [bottom for bottom, _ in bottoms])
 
-        if minY is None or bottom < minY:
-            minY = bottom
-            lowest = layer
+        for _, i in tallest + deepest:
+            if i not in opened:
+                opened.add(i)
+                layersToOpen.append(font.glyphs[table.names[i]].layers[master.id])
 
-print("highest: %s" % maxY)
-print("lowest: %s" % minY)
+    print("\nhighest: %s" % maxY)
+    print("lowest: %s" % minY)
 
-if highest and lowest:
-    font.newTab([highest, lowest])
\ No newline at end of file
+    if layersToOpen:
+        font.newTab(layersToOpen)
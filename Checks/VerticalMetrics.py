@@ -0,0 +1,162 @@
+#MenuTitle: Vertical Metrics Calculator
+# -*- coding: utf-8 -*-
+__doc__ = """
+Calculates hhea, typo and win ascender/descender candidates from the outline
+bounds of all exporting glyphs in all masters, using two strategies:
+• tallest: the single highest/lowest glyph decides
+• percentile: the PERCENTILE-th highest/lowest value decides (ignores outliers)
+Also prints top/bottom percentile distributions per category and script.
+Read only, does not open tabs.
+
+Bounds are kept in a per-font table (font.tempData) for the session.
+Re-runs only rescan glyphs whose lastChange, or whose components' lastChange,
+differs from the stored one. Composite bounds come from cached component bounds.
+"""
+
+from GlyphsApp import Glyphs
+import math
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from GlyphBounds import NAN, bounds_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ---------- CONFIGURATION ----------
+PERCENTILE = 99.0        # percentile strategy: share of glyphs that must fit
+EXPORTING_ONLY = True    # ignore non-exporting glyphs
+# -----------------------------------
+
+
+# ------------------------------------------------------------
+# Statistics
+# ------------------------------------------------------------
+
+def percentile(values, q):
+    """Linear-interpolated percentile of a sorted list (same as numpy's default)."""
+    if not values:
+        return NAN
+    pos = (len(values) - 1) * q / 100.0
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def distribution(tops, bottoms):
+    """Return (count, maxTop, pTop, minBottom, pBottom) for non-empty values."""
+    if np is not None:
+        tops = np.asarray(tops, dtype=float)
+        bottoms = np.asarray(bottoms, dtype=float)
+        tops = tops[~np.isnan(tops)]
+        bottoms = bottoms[~np.isnan(bottoms)]
+        if not len(tops):
+            return 0, NAN, NAN, NAN, NAN
+        return (
+            len(tops),
+            float(tops.max()), float(np.percentile(tops, PERCENTILE)),
+            float(bottoms.min()), float(np.percentile(bottoms, 100.0 - PERCENTILE)),
+        )
+
+    tops = sorted(v for v in tops if v == v)
+    bottoms = sorted(v for v in bottoms if v == v)
+    if not tops:
+        return 0, NAN, NAN, NAN, NAN
+    return len(tops), tops[-1], percentile(tops, PERCENTILE), bottoms[0], percentile(bottoms, 100.0 - PERCENTILE)
+
+
+def metrics_candidates(top, bottom, typoAscender, typoDescender):
+    """
+    Return {field: value} for one strategy. win covers the extremes, hhea
+    matches win, and the typo line gap makes typo line spacing equal hhea.
+    """
+    winAscent = max(0, math.ceil(top))
+    winDescent = max(0, math.ceil(-bottom))
+    return {
+        "winAscent": winAscent,
+        "winDescent": winDescent,
+        "hheaAscender": winAscent,
+        "hheaDescender": -winDescent,
+        "hheaLineGap": 0,
+        "typoAscender": typoAscender,
+        "typoDescender": typoDescender,
+        "typoLineGap": max(0, (winAscent + winDescent) - (typoAscender - typoDescender)),
+    }
+
+
+# ------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------
+
+font = Glyphs.font
+
+if not font:
+    print("No font open.")
+else:
+    print("\n### VERTICAL METRICS CALCULATOR ###\n")
+
+    table = bounds_table(font)
+    masters = list(font.masters)
+    masterCount = len(masters)
+
+    rows = [i for i, info in enumerate(table.info) if info[0] or not EXPORTING_ONLY]
+
+    # all masters at once: one glyph × master selection per array
+    if np is not None:
+        top = np.frombuffer(table.top, dtype=np.float64).reshape(-1, masterCount)[rows]
+        bottom = np.frombuffer(table.bottom, dtype=np.float64).reshape(-1, masterCount)[rows]
+        masterTops = top.T  # master × glyph views
+        masterBottoms = bottom.T
+        allTops = top.ravel()
+        allBottoms = bottom.ravel()
+    else:
+        masterTops = [[table.top[i * masterCount + k] for i in rows] for k in range(masterCount)]
+        masterBottoms = [[table.bottom[i * masterCount + k] for i in rows] for k in range(masterCount)]
+        allTops = [v for column in masterTops for v in column]
+        allBottoms = [v for column in masterBottoms for v in column]
+
+    print(f"Per master (top max / p{PERCENTILE:g}, bottom min / p{100 - PERCENTILE:g}):")
+    for k, m in enumerate(masters):
+        count, maxTop, pTop, minBottom, pBottom = distribution(masterTops[k], masterBottoms[k])
+        print(f"• {m.name}: {count} glyphs, top {maxTop:g} / {pTop:g}, bottom {minBottom:g} / {pBottom:g}")
+
+    count, maxTop, pTop, minBottom, pBottom = distribution(allTops, allBottoms)
+    if not count:
+        print("\nNo glyphs with outlines found.")
+    else:
+        typoAscender = max(m.ascender for m in masters)
+        typoDescender = min(m.descender for m in masters)
+
+        print(f"\nCandidates over all masters (typo from master ascender/descender {typoAscender:g} / {typoDescender:g}):")
+        strategies = (
+            ("tallest", metrics_candidates(maxTop, minBottom, typoAscender, typoDescender)),
+            (f"p{PERCENTILE:g}", metrics_candidates(pTop, pBottom, typoAscender, typoDescender)),
+        )
+        fields = list(strategies[0][1])
+        print("  " + "field".ljust(16) + "".join(name.rjust(10) for name, _ in strategies))
+        for field in fields:
+            print("  " + field.ljust(16) + "".join(f"{values[field]:>10g}" for _, values in strategies))
+
+        print(f"\nDistribution per category / script (top max / p{PERCENTILE:g}, bottom min / p{100 - PERCENTILE:g}):")
+        groups = {}
+        for r, i in enumerate(rows):
+            _, category, script = table.info[i]
+            groups.setdefault((category, script), []).append(r)
+        for category, script in sorted(groups):
+            members = groups[(category, script)]
+            if np is not None:
+                tops = masterTops[:, members].ravel()
+                bottoms = masterBottoms[:, members].ravel()
+            else:
+                tops = [masterTops[k][r] for r in members for k in range(masterCount)]
+                bottoms = [masterBottoms[k][r] for r in members for k in range(masterCount)]
+            count, maxTop, pTop, minBottom, pBottom = distribution(tops, bottoms)
+            if count:
+                print(f"• {category} / {script}: {count} layers, top {maxTop:g} / {pTop:g}, bottom {minBottom:g} / {pBottom:g}")
+
+    print("\nDone.\n")
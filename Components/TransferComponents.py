@@ -12,11 +12,19 @@ Options:
 • Include anchors from source master (checked) or keep target anchors (unchecked)
 Per-font preferences (stored in font.userData["sk.copycomponents"]).
 Robust across Glyphs 3 builds (safe component & shape removal, preserves transforms and auto-align flags).
+Set Glyphs.defaults["sk.profilePhases"] to 1 (or 2 for cProfile stats) to print phase timings.
 """
 
 import GlyphsApp
 from GlyphsApp import Glyphs, GSComponent, GSAnchor
 import vanilla
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from PhaseTimer import PhaseTimer
 
 # -----------------------------
 # Per-font preference helpers
@@ -38,6 +46,11 @@ def setpref_font(font, key, value):
     except Exception:
         pass
 
+# -----------------------------
+# Phase timing
+# -----------------------------
+TIMER = PhaseTimer("Transfer Components")
+
 # -----------------------------
 # Selection helpers
 # -----------------------------
@@ -156,7 +169,8 @@ def clear_drawn_shapes(dstLayer):
         except Exception:
             pass
     try:
-        dstLayer.updateMetrics()
+        with TIMER.phase("updateMetrics"):
+            dstLayer.updateMetrics()
     except Exception:
         pass
     return removed
@@ -260,7 +274,8 @@ def copy_anchors_from_layer_to_layer(srcLayer, dstLayer):
             pass
 
     try:
-        dstLayer.updateMetrics()
+        with TIMER.phase("updateMetrics"):
+            dstLayer.updateMetrics()
     except Exception:
         pass
     return copied
@@ -272,10 +287,11 @@ def copy_components_from_layer_to_layer(srcLayer, dstLayer, clearComps=False, cl
     if not srcLayer or not dstLayer:
         return 0
 
-    if clearShapes:
-        clear_drawn_shapes(dstLayer)
-    if clearComps:
-        clear_components(dstLayer)
+    with TIMER.phase("clear"):
+        if clearShapes:
+            clear_drawn_shapes(dstLayer)
+        if clearComps:
+            clear_components(dstLayer)
 
     srcComps = list(srcLayer.components or [])
     if not srcComps and not includeAnchors:
@@ -316,12 +332,14 @@ def copy_components_from_layer_to_layer(srcLayer, dstLayer, clearComps=False, cl
     # Copy anchors if requested
     if includeAnchors:
         try:
-            copy_anchors_from_layer_to_layer(srcLayer, dstLayer)
+            with TIMER.phase("anchors"):
+                copy_anchors_from_layer_to_layer(srcLayer, dstLayer)
         except Exception:
             pass
 
     try:
-        dstLayer.updateMetrics()
+        with TIMER.phase("updateMetrics"):
+            dstLayer.updateMetrics()
     except Exception:
         pass
     return copied
@@ -385,7 +403,33 @@ class CopyComponentsUI(object):
         self.w.runButton = vanilla.Button((14, y, -14, 28), "Copy Components", callback=self.run)
         self.w.open()
 
+    def _collect_work(self, layers, srcID, tgtID):
+        """Return [(glyph, source layer, target layer)] for the selected layers, once per target layer."""
+        seen = set()
+        work = []
+        for L in layers:
+            g = getattr(L, "parent", None)
+            if not g:
+                continue
+            srcLayer = g.layers[srcID]
+            tgtLayer = g.layers[tgtID]
+            if not srcLayer or not tgtLayer:
+                continue
+            key = (g.name, tgtLayer.layerId)
+            if key in seen:
+                continue
+            seen.add(key)
+            work.append((g, srcLayer, tgtLayer))
+        return work
+
     def run(self, sender):
+        TIMER.start()
+        try:
+            self._run(sender)
+        finally:
+            TIMER.report()
+
+    def _run(self, sender):
         try:
             srcIdx = int(self.w.srcPop.get())
             tgtIdx = int(self.w.tgtPop.get())
@@ -412,39 +456,28 @@ class CopyComponentsUI(object):
             setpref_font(self.font, "inheritSideBearings", inheritSB)
             setpref_font(self.font, "includeAnchors", includeAnchors)
 
-            layers = get_selected_layers(self.font)
+            with TIMER.phase("selection"):
+                layers = get_selected_layers(self.font)
             if not layers:
                 Glyphs.showNotification("Copy Components", "No selection found. Select glyphs (Font view) or place the caret in a glyph (Edit view).")
                 return
 
-            seen = set()
-            work = []
-            for L in layers:
-                g = getattr(L, "parent", None)
-                if not g:
-                    continue
-                srcLayer = g.layers[srcID]
-                tgtLayer = g.layers[tgtID]
-                if not srcLayer or not tgtLayer:
-                    continue
-                key = (g.name, tgtLayer.layerId)
-                if key in seen:
-                    continue
-                seen.add(key)
-                work.append((g, srcLayer, tgtLayer))
+            with TIMER.phase("selection"):
+                work = self._collect_work(layers, srcID, tgtID)
 
             totalGlyphs = 0
             totalCopied = 0
             self.font.disableUpdateInterface()
             try:
                 for g, srcLayer, tgtLayer in work:
-                    copied = copy_components_from_layer_to_layer(
-                        srcLayer, tgtLayer,
-                        clearComps=clearComps,
-                        clearShapes=clearShapes,
-                        inheritSB=inheritSB,
-                        includeAnchors=includeAnchors
-                    )
+                    with TIMER.phase("transfer"):
+                        copied = copy_components_from_layer_to_layer(
+                            srcLayer, tgtLayer,
+                            clearComps=clearComps,
+                            clearShapes=clearShapes,
+                            inheritSB=inheritSB,
+                            includeAnchors=includeAnchors
+                        )
                     if copied:
                         totalGlyphs += 1
                         totalCopied += copied
@@ -459,7 +492,8 @@ class CopyComponentsUI(object):
                             except Exception:
                                 pass
             finally:
-                self.font.enableUpdateInterface()
+                with TIMER.phase("enableUpdateInterface"):
+                    self.font.enableUpdateInterface()
 
             msg = f"Source: {srcMaster.name} → Target: {tgtMaster.name}\nGlyphs updated: {totalGlyphs}\nComponents copied: {totalCopied}"
             print("Copy Components — Summary")
@@ -10,11 +10,19 @@ Options:
 • (Optional) Only change the suffix after the first dot (keep 'A.' etc.)
 
 Per-font preferences are stored in font.userData["sk.renamerFR"].
+Set Glyphs.defaults["sk.profilePhases"] to 1 (or 2 for cProfile stats) to print phase timings.
 """
 
 import re
 import vanilla
 from GlyphsApp import Glyphs
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from PhaseTimer import PhaseTimer
 
 UDK = "sk.renamerFR"  # per-font preferences key
 
@@ -36,6 +44,11 @@ def setpref_font(font, key, value):
     except Exception:
         pass
 
+# -----------------------------
+# Phase timing
+# -----------------------------
+TIMER = PhaseTimer("Rename Selected Glyphs")
+
 # -----------------------------
 # Selection helpers
 # -----------------------------
@@ -130,6 +143,13 @@ class RenameFindReplaceUI(object):
         return pattern.sub(repl, s, count=1)
 
     def run(self, sender):
+        TIMER.start()
+        try:
+            self._run(sender)
+        finally:
+            TIMER.report()
+
+    def _run(self, sender):
         self._save()
 
         find = (self.w.findInp.get() or "")
@@ -149,7 +169,8 @@ class RenameFindReplaceUI(object):
             Glyphs.showNotification("Rename Selected Glyphs — F&R", f"Regex error: {e}")
             return
 
-        glyphs = selected_glyphs(self.font)
+        with TIMER.phase("selection"):
+            glyphs = selected_glyphs(self.font)
         if not glyphs:
             Glyphs.showNotification("Rename Selected Glyphs — F&R", "No glyphs selected.")
             return
@@ -179,18 +200,21 @@ class RenameFindReplaceUI(object):
                         unchanged += 1
                         continue
 
-                    finalName = next_available_name(self.font, target)
+                    with TIMER.phase("name lookup"):
+                        finalName = next_available_name(self.font, target)
                     if not finalName:
                         # extremely unlikely; treat as unchanged
                         unchanged += 1
                         continue
 
-                    g.name = finalName
+                    with TIMER.phase("rename"):
+                        g.name = finalName
                     renamed += 1
                 except Exception:
                     errors += 1
         finally:
-            self.font.enableUpdateInterface()
+            with TIMER.phase("enableUpdateInterface"):
+                self.font.enableUpdateInterface()
 
         msg = (
             f"Renamed: {renamed} • Unchanged: {unchanged} • "
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Run the Checks and Open Glyphs finders over many .glyphs files in parallel.
+
+    python Headless/BatchCheck.py --out reports/ Families/*.glyphs
+    python Headless/BatchCheck.py --checks CloseNodes,Incompatible --jobs 8 Families/
+
+Each check is the unmodified script from this repository, run through
+GlyphsApp.run_script() on a font opened with GlyphsFileReader. The work is
+split by file and, for checks that judge every glyph on its own, by glyph
+range (--shard glyphs per task). All tasks go to one process pool, largest
+first. Because the reader parses glyphs lazily, a shard only parses its own
+glyphs and the components they use.
+
+One JSON report is written per font. For every check it lists the glyphs
+(and, for checks that open layers, the glyph/layer pairs) in the order the
+script passes them to font.newTab, plus its notifications and timing. Scripts
+that describe their findings in a DETAILS dict (glyph name → details) get it
+added to their check as "details".
+
+The result store of Close Nodes and the ascender/descender check is turned
+off in the workers: shards of one font run at the same time and would each
+write the same <font>.checks.sqlite, which a batch run should not create.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+HEADLESS = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HEADLESS)
+sys.path.insert(0, HEADLESS)
+sys.path.insert(1, os.path.join(REPO, "Lib"))
+
+import Dialogs
+import GlyphsApp
+import ResultStore
+from GlyphsFileReader import GlyphsFile
+
+# name → (script, shardable: the script judges each glyph on its own)
+CHECKS = {
+    "CloseNodes": ("Checks/CloseNodes.py", True),
+    "AscenderDescender": ("Checks/CheckAscenderDescenderConsistency.py", True),
+    "CaseDiacritics": ("Checks/CheckCaseDiacritics.py", False),
+    "HighestLowest": ("Checks/HighestLowestGlyphs.py", False),
+    "Interpolation": ("Checks/CheckInterpolation.py", True),
+    "Empty": ("Open Glyphs/EmptyGlyphs.py", True),
+    "Unique": ("Open Glyphs/OpenUniqueGlyphs.py", True),
+    "Incompatible": ("Open Glyphs/OpenIncompatibleGlyphs.py", True),
+    "WithoutAutoAlignment": ("Open Glyphs/OpenGlyphsWithoutAutoAlignment.py", True),
+}
+SHARD_SIZE = 5000  # glyphs per task for shardable checks
+
+
+# -----------------------------
+# Glyph ranges
+# -----------------------------
+class GlyphRange(object):
+    """
+    font.glyphs limited to [start, end) for iteration, len() and int indexes.
+    Lookups by name still reach every glyph, so components resolve.
+    """
+
+    def __init__(self, glyphs, start, end):
+        self.glyphs = glyphs
+        self.start = start
+        self.end = min(end, len(glyphs))
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __iter__(self):
+        for i in range(self.start, self.end):
+            yield self.glyphs[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError(key)
+            return self.glyphs[self.start + key]
+        return self.glyphs[key]
+
+    def __contains__(self, name):
+        return name in self.glyphs
+
+    def keys(self):
+        return self.glyphs.keys()[self.start:self.end]
+
+    def _renamed(self, glyph, old):
+        self.glyphs._renamed(glyph, old)
+
+
+def tab_findings(tabs):
+    """
+    Return (glyph names, [glyph name, layer name] pairs) from font.tabs in order.
+    Tab text is split on slashes and whitespace; layer lists give both.
+    """
+    names = []
+    layers = []
+    seen = set()
+    for tab in tabs:
+        text = tab.text
+        if isinstance(text, str):
+            found = [n for n in text.replace("/", " ").split() if n]
+        else:
+            found = []
+            for layer in text:
+                glyph = layer.parent
+                found.append(glyph.name)
+                layers.append([glyph.name, layer.name])
+        for name in found:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+    return names, layers
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+_opened = {}  # path → (mtime, GlyphsFile): the file this worker process used last
+
+
+def _open(path):
+    mtime = os.path.getmtime(path)
+    cached = _opened.get(path)
+    if cached is None or cached[0] != mtime:
+        _opened.clear()
+        cached = _opened[path] = (mtime, GlyphsFile(path))
+    return cached[1]
+
+
+def _init_worker():
+    Dialogs.install()
+    ResultStore.ENABLED = False
+
+
+def run_task(path, check, start, end, keepOutput=False):
+    """Run one check on glyphs [start, end) of path (end None = all). Returns a result dict."""
+    result = {"path": path, "check": check, "start": start, "end": end}
+    began = time.perf_counter()
+    try:
+        gsFile = _open(path)
+        font = gsFile.font
+        allGlyphs = font.glyphs
+        font.tempData.clear()
+        font.tabs[:] = []
+        font.selectedLayers = []
+        font.glyphs = allGlyphs if end is None else GlyphRange(allGlyphs, start, end)
+        GlyphsApp.Glyphs.fonts[:] = [font]
+        GlyphsApp.Glyphs.notifications[:] = []
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                names = GlyphsApp.run_script(os.path.join(REPO, CHECKS[check][0]), font)
+        finally:
+            font.glyphs = allGlyphs
+        result["glyphs"], result["layers"] = tab_findings(font.tabs)
+        if isinstance(names.get("DETAILS"), dict):
+            result["details"] = names["DETAILS"]
+        result["notifications"] = [list(n) for n in GlyphsApp.Glyphs.notifications]
+        if keepOutput:
+            result["output"] = output.getvalue()
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - began
+    return result
+
+
+# -----------------------------
+# Scheduling
+# -----------------------------
+def collect_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".glyphs"))
+        else:
+            files.append(path)
+    return files
+
+
+def plan_tasks(files, checks, shardSize):
+    """Return [(size, path, check, start, end)], largest first, and {path: (glyph count, master count)}."""
+    tasks = []
+    fonts = {}
+    for path in files:
+        font = GlyphsFile(path).font  # only indexes the glyphs
+        count = len(font.glyphs)
+        fonts[path] = (count, len(font.masters))
+        for check in checks:
+            if CHECKS[check][1] and count > shardSize:
+                for start in range(0, count, shardSize):
+                    tasks.append((min(shardSize, count - start), path, check, start, start + shardSize))
+            else:
+                tasks.append((count, path, check, 0, None))
+    tasks.sort(key=lambda t: -t[0])
+    return tasks, fonts
+
+
+def merge(results):
+    """Merge shard results per (path, check) in glyph order."""
+    merged = {}
+    seen = {}
+    for r in sorted(results, key=lambda r: (r["path"], r["check"], r["start"])):
+        entry = merged.setdefault((r["path"], r["check"]), {
+            "glyphs": [], "layers": [], "notifications": [], "seconds": 0.0, "shards": 0,
+        })
+        entry["shards"] += 1
+        entry["seconds"] += r["seconds"]
+        if "error" in r:
+            entry.setdefault("errors", []).append(r["error"])
+            continue
+        names = seen.setdefault((r["path"], r["check"]), set())
+        entry["glyphs"].extend(n for n in r["glyphs"] if n not in names)
+        names.update(r["glyphs"])
+        entry["layers"].extend(r["layers"])
+        if "details" in r:
+            entry.setdefault("details", {}).update(r["details"])
+        if r["end"] is None:
+            # a shard's notifications only describe its own glyph range
+            entry["notifications"].extend(r["notifications"])
+        if "output" in r:
+            entry["output"] = entry.get("output", "") + r["output"]
+    for entry in merged.values():
+        entry["seconds"] = round(entry["seconds"], 3)
+    return merged
+
+
+def run_batch(files, checks, jobs=None, shardSize=SHARD_SIZE, keepOutput=False, progress=print):
+    tasks, fonts = plan_tasks(files, checks, shardSize)
+    progress(f"{len(files)} fonts, {len(tasks)} tasks on {jobs or os.cpu_count()} processes")
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = [pool.submit(run_task, path, check, start, end, keepOutput) for _, path, check, start, end in tasks]
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            r = future.result()
+            results.append(r)
+            status = "error" if "error" in r else f"{len(r['glyphs'])} glyphs"
+            progress(f"  [{done}/{len(tasks)}] {os.path.basename(r['path'])} {r['check']} {r['start']}… {status} ({r['seconds']:.2f} s)")
+    return merge(results), fonts
+
+
+def write_reports(merged, fonts, checks, outDir):
+    written = []
+    for path, (glyphCount, masterCount) in fonts.items():
+        report = {
+            "font": os.path.abspath(path),
+            "glyphCount": glyphCount,
+            "masterCount": masterCount,
+            "checks": {check: merged.get((path, check)) for check in checks},
+        }
+        name = os.path.splitext(os.path.basename(path))[0] + ".checks.json"
+        target = os.path.join(outDir, name) if outDir else os.path.splitext(path)[0] + ".checks.json"
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, ensure_ascii=False)
+        written.append(target)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the checks over .glyphs files in parallel.")
+    parser.add_argument("paths", nargs="+", help=".glyphs files or folders")
+    parser.add_argument("--checks", default=",".join(CHECKS), help="comma-separated: " + ", ".join(CHECKS))
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--shard", type=int, default=SHARD_SIZE, help="glyphs per task for shardable checks")
+    parser.add_argument("--out", help="folder for the reports (default: next to each font)")
+    parser.add_argument("--output", action="store_true", help="keep the scripts' printed output in the reports")
+    args = parser.parse_args()
+
+    checks = [c for c in args.checks.split(",") if c]
+    unknown = [c for c in checks if c not in CHECKS]
+    if unknown:
+        parser.error("unknown checks: " + ", ".join(unknown))
+    files = collect_files(args.paths)
+    if not files:
+        parser.error("no .glyphs files found")
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+
+    start = time.perf_counter()
+    merged, fonts = run_batch(files, checks, args.jobs, args.shard, args.output)
+    for target in write_reports(merged, fonts, checks, args.out):
+        print(f"Wrote {target}")
+    failed = sum(1 for entry in merged.values() if entry.get("errors"))
+    print(f"Done in {time.perf_counter() - start:.1f} s, {failed} checks with errors.")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Benchmarks for the check scripts on synthetic fonts.
+
+Runs each check with GlyphsApp.run_script() against fonts from SyntheticFont
+for every combination of glyph and master count, and records wall time, peak
+traced memory and per-glyph cost to a JSON baseline. With --compare, the new
+numbers are checked against an earlier baseline and slowdowns are listed.
+
+    python Headless/Benchmark.py --out bench.json
+    python Headless/Benchmark.py --glyphs 1000 --masters 2 --compare bench.json
+
+Each check runs on a cold session: font.tempData is cleared first, so session
+caches do not carry over between checks or runs. Script output is discarded.
+Alerts the scripts show are answered with Cancel, so nothing is changed.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+HEADLESS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HEADLESS)
+
+import Dialogs
+import GlyphsApp
+from SyntheticFont import make_font
+
+REPO = os.path.dirname(HEADLESS)
+
+CHECKS = {
+    "CloseNodes": "Checks/CloseNodes.py",
+    "AscenderDescender": "Checks/CheckAscenderDescenderConsistency.py",
+    "WithoutAutoAlignment": "Open Glyphs/OpenGlyphsWithoutAutoAlignment.py",
+    "CaseDiacritics": "Checks/CheckCaseDiacritics.py",
+    "Interpolation": "Checks/CheckInterpolation.py",
+}
+GLYPH_COUNTS = (1000, 10000, 60000)
+MASTER_COUNTS = (2, 8, 16)
+SLOWDOWN = 1.2  # --compare flags checks slower than this factor
+
+
+def run_check(script, font, traceMemory=False):
+    """Run one check on font. Returns (seconds, peak traced bytes or None)."""
+    font.tempData.clear()
+    font.tabs[:] = []
+    gc.collect()
+    if traceMemory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        GlyphsApp.run_script(os.path.join(REPO, script), font)
+    seconds = time.perf_counter() - start
+    peak = None
+    if traceMemory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def benchmark(glyphCounts, masterCounts, checks, repeat=1, traceMemory=True, **fontOptions):
+    results = []
+    for glyphCount in glyphCounts:
+        for masterCount in masterCounts:
+            start = time.perf_counter()
+            font = make_font(glyphCount, masterCount, **fontOptions)
+            print(f"{glyphCount} glyphs × {masterCount} masters (built in {time.perf_counter() - start:.1f} s)")
+            for name in checks:
+                seconds = min(run_check(CHECKS[name], font)[0] for _ in range(repeat))
+                peak = run_check(CHECKS[name], font, traceMemory=True)[1] if traceMemory else None
+                result = {
+                    "check": name,
+                    "glyphs": glyphCount,
+                    "masters": masterCount,
+                    "seconds": round(seconds, 4),
+                    "usPerGlyph": round(seconds / glyphCount * 1e6, 2),
+                    "peakMB": round(peak / 1e6, 1) if peak is not None else None,
+                    "tabs": len(font.tabs),
+                }
+                results.append(result)
+                memory = f"{result['peakMB']:8.1f} MB" if peak is not None else ""
+                print(f"  {name:22} {seconds:9.3f} s  {result['usPerGlyph']:9.1f} µs/glyph  {memory}")
+            del font
+            gc.collect()
+    return results
+
+
+def compare(results, baseline):
+    """Print the ratio to the baseline for every matching result. Returns the number of slowdowns."""
+    old = {(r["check"], r["glyphs"], r["masters"]): r for r in baseline.get("results", ())}
+    slower = 0
+    print("\nCompared with baseline:")
+    for r in results:
+        before = old.get((r["check"], r["glyphs"], r["masters"]))
+        if not before or not before["seconds"]:
+            continue
+        ratio = r["seconds"] / before["seconds"]
+        flag = ""
+        if ratio > SLOWDOWN:
+            flag = "  ⚠ slower"
+            slower += 1
+        print(f"  {r['check']:22} {r['glyphs']:6} × {r['masters']:2}  {before['seconds']:9.3f} → {r['seconds']:9.3f} s  ×{ratio:.2f}{flag}")
+    return slower
+
+
+def _ints(text):
+    return tuple(int(v) for v in text.split(","))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the check scripts on synthetic fonts.")
+    parser.add_argument("--glyphs", type=_ints, default=GLYPH_COUNTS, help="comma-separated glyph counts")
+    parser.add_argument("--masters", type=_ints, default=MASTER_COUNTS, help="comma-separated master counts")
+    parser.add_argument("--checks", default=",".join(CHECKS), help="comma-separated: " + ", ".join(CHECKS))
+    parser.add_argument("--nodes", type=int, default=16, help="nodes per path")
+    parser.add_argument("--composites", type=float, default=0.3, help="share of composite glyphs")
+    parser.add_argument("--backups", type=int, default=0, help="backup layers per master")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per check, the fastest is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the extra traced run for peak memory")
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare with")
+    args = parser.parse_args()
+
+    checks = [c for c in args.checks.split(",") if c]
+    unknown = [c for c in checks if c not in CHECKS]
+    if unknown:
+        parser.error("unknown checks: " + ", ".join(unknown))
+
+    Dialogs.install()
+    results = benchmark(
+        args.glyphs, args.masters, checks, repeat=args.repeat, traceMemory=not args.no_memory,
+        nodesPerPath=args.nodes, compositeRatio=args.composites, backupLayers=args.backups,
+    )
+
+    try:
+        import numpy
+        numpyVersion = numpy.__version__
+    except ImportError:
+        numpyVersion = None
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": numpyVersion,
+        "machine": platform.machine(),
+        "font": {"nodesPerPath": args.nodes, "compositeRatio": args.composites, "backupLayers": args.backups},
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"\nWrote {args.out}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            slower = compare(results, json.load(f))
+        sys.exit(1 if slower else 0)
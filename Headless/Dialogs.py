@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Stand-ins for the dialogs the scripts show (AppKit NSAlert and
+vanilla.dialogs.message), for headless runs. Every alert is answered with
+Cancel (its last button) and messages go to Glyphs.notifications, so a check
+never changes the font. install() only fills in modules that are missing.
+"""
+
+import sys
+import types
+
+NSAlertFirstButtonReturn = 1000
+NSAlertSecondButtonReturn = 1001
+NSAlertThirdButtonReturn = 1002
+
+
+class NSAlert(object):
+    @classmethod
+    def alloc(cls):
+        return cls()
+
+    def init(self):
+        self.buttons = []
+        return self
+
+    def addButtonWithTitle_(self, title):
+        self.buttons.append(title)
+
+    def __getattr__(self, name):
+        return lambda *args: None
+
+    def runModal(self):
+        # the last button the scripts add is always Cancel
+        return NSAlertFirstButtonReturn + max(0, len(self.buttons) - 1) if len(self.buttons) > 1 else 0
+
+
+def message(messageText="", informativeText="", *args, **kwargs):
+    from GlyphsApp import Glyphs
+    Glyphs.notifications.append((messageText, informativeText))
+
+
+def _missing(name):
+    try:
+        __import__(name)
+        return False
+    except ImportError:
+        return True
+
+
+def install():
+    if _missing("AppKit"):
+        appKit = types.ModuleType("AppKit")
+        appKit.NSAlert = NSAlert
+        appKit.NSAlertFirstButtonReturn = NSAlertFirstButtonReturn
+        appKit.NSAlertSecondButtonReturn = NSAlertSecondButtonReturn
+        appKit.NSAlertThirdButtonReturn = NSAlertThirdButtonReturn
+        sys.modules["AppKit"] = appKit
+    if _missing("vanilla.dialogs"):
+        vanilla = sys.modules.get("vanilla") or types.ModuleType("vanilla")
+        dialogs = types.ModuleType("vanilla.dialogs")
+        dialogs.message = message
+        vanilla.dialogs = dialogs
+        sys.modules["vanilla"] = vanilla
+        sys.modules["vanilla.dialogs"] = dialogs
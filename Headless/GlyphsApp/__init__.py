@@ -0,0 +1,1009 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Pure-Python stand-in for the GlyphsApp module, for running the scripts in this
+repository outside Glyphs.app (tests, benchmarks, build servers).
+
+Implements the part of the API the scripts use: Glyphs.font / fonts / defaults /
+showNotification, font.glyphs[name], font.masters, selectedLayers, newTab,
+userData / tempData, disableUpdateInterface, glyph.layers[masterId], and the
+layer shapes / paths / components / anchors / guides with the mutations the
+Transfer, Rename, Alignment and Check scripts perform. All classes use
+__slots__ so synthetic fonts with tens of thousands of glyphs stay small.
+
+Put the Headless folder first on sys.path (the Lib folder next to it is added
+for BezierBounds) and run a script like the Macro panel would:
+
+    import GlyphsApp
+    font = GlyphsApp.Glyphs.open("MyFamily.glyphs")   # or build a GSFont()
+    font.selectedLayers = [font.glyphs["A"].layers[0]]
+    run_script("Checks/CheckCaseDiacritics.py")
+    print(font.tabs[-1].text)
+
+Only GlyphsApp is provided: scripts that build vanilla windows or NSAlerts at
+import time also need vanilla / AppKit. Nothing here touches lastChange; set it
+yourself when a test needs cache invalidation.
+"""
+
+import math
+import os
+import runpy
+import sys
+import uuid
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.append(LIB)
+from BezierBounds import layer_bounds
+
+__all__ = [
+    "Glyphs", "GSApplication", "GSDocument", "GSFont", "GSFontMaster", "GSGlyph", "GSLayer",
+    "GSPath", "GSNode", "GSComponent", "GSAnchor", "GSGuide", "GSEditViewController",
+    "LINE", "CURVE", "OFFCURVE", "QCURVE", "GSLINE", "GSCURVE", "GSOFFCURVE", "GSQCURVE",
+    "GSSMOOTH", "GSSHARP", "NSPoint", "Message", "GetSaveFile", "GetOpenFile", "GetFolder",
+]
+
+# -----------------------------
+# Constants
+# -----------------------------
+LINE = GSLINE = "line"
+CURVE = GSCURVE = "curve"
+OFFCURVE = GSOFFCURVE = "offcurve"
+QCURVE = GSQCURVE = "qcurve"
+
+GSSMOOTH = True
+GSSHARP = False
+
+
+# -----------------------------
+# Geometry
+# -----------------------------
+class Point(object):
+    """NSPoint look-alike."""
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __eq__(self, other):
+        try:
+            return tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"<Point {self.x} {self.y}>"
+
+
+class Size(object):
+    __slots__ = ("width", "height")
+
+    def __init__(self, width=0, height=0):
+        self.width = width
+        self.height = height
+
+
+class Rect(object):
+    """NSRect look-alike: origin.x/y and size.width/height."""
+    __slots__ = ("origin", "size")
+
+    def __init__(self, x=0, y=0, width=0, height=0):
+        self.origin = Point(x, y)
+        self.size = Size(width, height)
+
+
+NSPoint = Point
+
+
+def _rect(bounds):
+    if bounds is None:
+        return Rect()
+    xMin, yMin, xMax, yMax = bounds
+    return Rect(xMin, yMin, xMax - xMin, yMax - yMin)
+
+
+def _xy(pt):
+    if pt is None:
+        return 0, 0
+    if isinstance(pt, Point):
+        return pt.x, pt.y
+    return pt[0], pt[1]
+
+
+def _compose(sx, sy, angle, x, y):
+    """Transform tuple for scale, rotation in degrees and offset, as Glyphs stores it."""
+    radians = math.radians(angle)
+    cos, sin = math.cos(radians), math.sin(radians)
+    return (sx * cos, sx * sin, -sy * sin, sy * cos, x, y)
+
+
+def _transform_rect(bounds, transform):
+    a, b, c, d, tx, ty = transform
+    x0, y0, x1, y1 = bounds
+    xs = [a * x + c * y + tx for x in (x0, x1) for y in (y0, y1)]
+    ys = [b * x + d * y + ty for x in (x0, x1) for y in (y0, y1)]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+# -----------------------------
+# Owned lists
+# -----------------------------
+class _Children(list):
+    """A list that sets .parent on the objects added to it."""
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, items=()):
+        list.__init__(self, items)
+        self.owner = owner
+        for item in self:
+            item.parent = owner
+
+    def append(self, item):
+        item.parent = self.owner
+        list.append(self, item)
+
+    def insert(self, index, item):
+        item.parent = self.owner
+        list.insert(self, index, item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+
+class _Anchors(_Children):
+    """layer.anchors: a list that can also be indexed by anchor name."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for anchor in self:
+                if anchor.name == key:
+                    return anchor
+            return None
+        return list.__getitem__(self, key)
+
+
+class _ShapeView(object):
+    """layer.paths / layer.components: a filtered, writable view on layer.shapes."""
+    __slots__ = ("layer", "kind")
+
+    def __init__(self, layer, kind):
+        self.layer = layer
+        self.kind = kind
+
+    def _items(self):
+        return [s for s in self.layer.shapes if isinstance(s, self.kind)]
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __len__(self):
+        return len(self._items())
+
+    def __bool__(self):
+        return any(isinstance(s, self.kind) for s in self.layer.shapes)
+
+    def __getitem__(self, index):
+        return self._items()[index]
+
+    def __contains__(self, item):
+        return item in self._items()
+
+    def append(self, item):
+        self.layer.shapes.append(item)
+
+    def extend(self, items):
+        self.layer.shapes.extend(items)
+
+    def remove(self, item):
+        self.layer.shapes.remove(item)
+
+    def __repr__(self):
+        return repr(self._items())
+
+
+# -----------------------------
+# Shapes
+# -----------------------------
+class GSNode(object):
+    __slots__ = ("x", "y", "type", "smooth", "parent")
+
+    def __init__(self, pt=None, type=LINE):
+        self.x, self.y = _xy(pt)
+        self.type = type
+        self.smooth = False
+        self.parent = None
+
+    @property
+    def position(self):
+        return Point(self.x, self.y)
+
+    @position.setter
+    def position(self, pt):
+        self.x, self.y = _xy(pt)
+
+    @property
+    def index(self):
+        return self.parent.nodes.index(self) if self.parent is not None else None
+
+    @property
+    def nextNode(self):
+        nodes = self.parent.nodes
+        return nodes[(nodes.index(self) + 1) % len(nodes)]
+
+    @property
+    def prevNode(self):
+        nodes = self.parent.nodes
+        return nodes[nodes.index(self) - 1]
+
+    def copy(self):
+        node = GSNode((self.x, self.y), self.type)
+        node.smooth = self.smooth
+        return node
+
+    def __repr__(self):
+        return f"<GSNode {self.x} {self.y} {self.type}>"
+
+
+class GSPath(object):
+    __slots__ = ("_nodes", "closed", "parent")
+
+    def __init__(self):
+        self._nodes = _Children(self)
+        self.closed = True
+        self.parent = None
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes):
+        self._nodes = _Children(self, nodes)
+
+    @property
+    def bounds(self):
+        return _rect(layer_bounds([self]))
+
+    def applyTransform(self, transform):
+        a, b, c, d, tx, ty = transform
+        for node in self._nodes:
+            node.x, node.y = a * node.x + c * node.y + tx, b * node.x + d * node.y + ty
+
+    def copy(self):
+        path = GSPath()
+        path.nodes = [n.copy() for n in self._nodes]
+        path.closed = self.closed
+        return path
+
+    def __repr__(self):
+        return f"<GSPath {len(self._nodes)} nodes {'closed' if self.closed else 'open'}>"
+
+
+class GSComponent(object):
+    __slots__ = ("componentName", "transform", "alignment", "locked", "smartComponentValues", "parent")
+
+    def __init__(self, glyph=None, offset=(0, 0), scale=(1, 1), transform=None):
+        self.componentName = getattr(glyph, "name", glyph)
+        if transform is None:
+            x, y = _xy(offset)
+            sx, sy = (scale, scale) if isinstance(scale, (int, float)) else scale
+            transform = (sx, 0, 0, sy, x, y)
+        self.transform = tuple(transform)
+        self.alignment = 0
+        self.locked = False
+        self.smartComponentValues = {}
+        self.parent = None
+
+    # position / scale / rotation are views on the transform
+    @property
+    def position(self):
+        return Point(self.transform[4], self.transform[5])
+
+    @position.setter
+    def position(self, pt):
+        x, y = _xy(pt)
+        self.transform = self.transform[:4] + (x, y)
+
+    @property
+    def scale(self):
+        a, b, c, d = self.transform[:4]
+        sy = math.hypot(c, d)
+        return (math.hypot(a, b), sy if a * d - b * c >= 0 else -sy)
+
+    @scale.setter
+    def scale(self, scale):
+        sx, sy = (scale, scale) if isinstance(scale, (int, float)) else scale
+        self.transform = _compose(sx, sy, self.rotation, *self.transform[4:])
+
+    @property
+    def rotation(self):
+        return math.degrees(math.atan2(self.transform[1], self.transform[0]))
+
+    @rotation.setter
+    def rotation(self, angle):
+        sx, sy = self.scale
+        self.transform = _compose(sx, sy, angle, *self.transform[4:])
+
+    # alignment -1 means automatic alignment is disabled
+    @property
+    def automaticAlignment(self):
+        return self.alignment != -1
+
+    @automaticAlignment.setter
+    def automaticAlignment(self, value):
+        self.alignment = 0 if value else -1
+
+    def setAutomaticAlignment_(self, value):
+        self.automaticAlignment = value
+
+    @property
+    def disableAlignment(self):
+        return self.alignment == -1
+
+    def setDisableAlignment_(self, value):
+        self.automaticAlignment = not value
+
+    @property
+    def name(self):
+        return self.componentName
+
+    @property
+    def component(self):
+        font = _font_of(self.parent)
+        return font.glyphs[self.componentName] if font is not None else None
+
+    @property
+    def componentLayer(self):
+        glyph = self.component
+        layer = self.parent
+        if glyph is None or layer is None:
+            return None
+        return glyph.layers[layer.associatedMasterId]
+
+    @property
+    def bounds(self):
+        layer = self.componentLayer
+        inner = layer._bounds() if layer is not None else None
+        return _rect(_transform_rect(inner, self.transform) if inner is not None else None)
+
+    def applyTransform(self, transform):
+        a, b, c, d, tx, ty = transform
+        a1, b1, c1, d1, tx1, ty1 = self.transform
+        self.transform = (
+            a * a1 + c * b1, b * a1 + d * b1,
+            a * c1 + c * d1, b * c1 + d * d1,
+            a * tx1 + c * ty1 + tx, b * tx1 + d * ty1 + ty,
+        )
+
+    def copy(self):
+        component = GSComponent(self.componentName, transform=self.transform)
+        component.alignment = self.alignment
+        component.locked = self.locked
+        component.smartComponentValues = dict(self.smartComponentValues)
+        return component
+
+    def __repr__(self):
+        return f"<GSComponent '{self.componentName}' x={self.transform[4]} y={self.transform[5]}>"
+
+
+class GSAnchor(object):
+    __slots__ = ("name", "x", "y", "parent")
+
+    def __init__(self, name=None, pt=None):
+        self.name = name
+        self.x, self.y = _xy(pt)
+        self.parent = None
+
+    @property
+    def position(self):
+        return Point(self.x, self.y)
+
+    @position.setter
+    def position(self, pt):
+        self.x, self.y = _xy(pt)
+
+    def copy(self):
+        return GSAnchor(self.name, (self.x, self.y))
+
+    def __repr__(self):
+        return f"<GSAnchor '{self.name}' x={self.x} y={self.y}>"
+
+
+class GSGuide(object):
+    __slots__ = ("x", "y", "angle", "locked", "name", "parent")
+
+    def __init__(self, pt=None, angle=0):
+        self.x, self.y = _xy(pt)
+        self.angle = angle
+        self.locked = False
+        self.name = None
+        self.parent = None
+
+    @property
+    def position(self):
+        return Point(self.x, self.y)
+
+    @position.setter
+    def position(self, pt):
+        self.x, self.y = _xy(pt)
+
+    def copy(self):
+        guide = GSGuide((self.x, self.y), self.angle)
+        guide.locked = self.locked
+        guide.name = self.name
+        return guide
+
+
+# -----------------------------
+# Layers and glyphs
+# -----------------------------
+def _font_of(layer):
+    glyph = layer.parent if layer is not None else None
+    return glyph.parent if glyph is not None else None
+
+
+class GSLayer(object):
+    __slots__ = ("layerId", "associatedMasterId", "name", "width", "_shapes", "_anchors", "_guides",
+                 "attributes", "userData", "selection", "parent")
+
+    def __init__(self):
+        self.layerId = None
+        self.associatedMasterId = None
+        self.name = None
+        self.width = 600
+        self._shapes = _Children(self)
+        self._anchors = _Anchors(self)
+        self._guides = _Children(self)
+        self.attributes = {}
+        self.userData = {}
+        self.selection = []
+        self.parent = None
+
+    @property
+    def shapes(self):
+        return self._shapes
+
+    @shapes.setter
+    def shapes(self, shapes):
+        self._shapes = _Children(self, shapes)
+
+    @property
+    def anchors(self):
+        return self._anchors
+
+    @anchors.setter
+    def anchors(self, anchors):
+        self._anchors = _Anchors(self, anchors)
+
+    @property
+    def guides(self):
+        return self._guides
+
+    @guides.setter
+    def guides(self, guides):
+        self._guides = _Children(self, guides)
+
+    @property
+    def paths(self):
+        return _ShapeView(self, GSPath)
+
+    @property
+    def components(self):
+        return _ShapeView(self, GSComponent)
+
+    @property
+    def isMasterLayer(self):
+        return self.layerId == self.associatedMasterId
+
+    @property
+    def master(self):
+        font = _font_of(self)
+        return font.masters[self.associatedMasterId] if font is not None else None
+
+    # ----- metrics -----
+    def _bounds(self):
+        """Exact (xMin, yMin, xMax, yMax) of paths and, recursively, components; None if empty."""
+        bounds = layer_bounds(s for s in self._shapes if isinstance(s, GSPath))
+        for shape in self._shapes:
+            if isinstance(shape, GSComponent):
+                layer = shape.componentLayer
+                inner = layer._bounds() if layer is not None else None
+                if inner is not None:
+                    bounds = _union(bounds, _transform_rect(inner, shape.transform))
+        return bounds
+
+    @property
+    def bounds(self):
+        return _rect(self._bounds())
+
+    @property
+    def LSB(self):
+        bounds = self._bounds()
+        return bounds[0] if bounds is not None else 0
+
+    @LSB.setter
+    def LSB(self, value):
+        bounds = self._bounds()
+        if bounds is None:
+            return
+        shift = value - bounds[0]
+        self.applyTransform((1, 0, 0, 1, shift, 0))
+        self.width += shift
+
+    @property
+    def RSB(self):
+        bounds = self._bounds()
+        return self.width - bounds[2] if bounds is not None else 0
+
+    @RSB.setter
+    def RSB(self, value):
+        bounds = self._bounds()
+        if bounds is not None:
+            self.width = bounds[2] + value
+
+    def updateMetrics(self):
+        pass
+
+    # ----- editing -----
+    def applyTransform(self, transform):
+        for shape in self._shapes:
+            shape.applyTransform(transform)
+        a, b, c, d, tx, ty = transform
+        for anchor in self._anchors:
+            anchor.x, anchor.y = a * anchor.x + c * anchor.y + tx, b * anchor.x + d * anchor.y + ty
+
+    def removeShape_(self, shape):
+        self._shapes.remove(shape)
+
+    def removeObjectFromComponentsAtIndex_(self, index):
+        self._shapes.remove(self.components[index])
+
+    def addAnchor_(self, anchor):
+        self._anchors.append(anchor)
+
+    def removeAnchor_(self, anchor):
+        self._anchors.remove(anchor)
+
+    def removeAnchorWithName_(self, name):
+        anchor = self._anchors[name]
+        if anchor is not None:
+            self._anchors.remove(anchor)
+
+    def copy(self):
+        layer = GSLayer()
+        layer.associatedMasterId = self.associatedMasterId
+        layer.name = self.name
+        layer.width = self.width
+        layer.shapes = [s.copy() for s in self._shapes]
+        layer.anchors = [a.copy() for a in self._anchors]
+        layer.guides = [g.copy() for g in self._guides]
+        layer.attributes = dict(self.attributes)
+        layer.userData = dict(self.userData)
+        return layer
+
+    def copyDecomposedLayer(self):
+        """A detached copy with every component replaced by its (transformed) outlines."""
+        layer = self.copy()
+        layer.layerId = self.layerId
+        layer.parent = self.parent  # for component lookups; not added to glyph.layers
+        shapes = []
+        for shape in layer._shapes:
+            if isinstance(shape, GSComponent):
+                inner = shape.componentLayer
+                if inner is None:
+                    continue
+                for path in inner.copyDecomposedLayer()._shapes:
+                    path.applyTransform(shape.transform)
+                    shapes.append(path)
+            else:
+                shapes.append(shape)
+        layer.shapes = shapes
+        return layer
+
+    def decomposeComponents(self):
+        self.shapes = self.copyDecomposedLayer()._shapes
+
+    def __repr__(self):
+        glyphName = self.parent.name if self.parent is not None else None
+        return f"<GSLayer \"{glyphName}\" \"{self.name}\">"
+
+
+class GlyphLayers(object):
+    """glyph.layers: index by layer id or position, iterate over all layers."""
+    __slots__ = ("glyph", "_layers", "_byId")
+
+    def __init__(self, glyph, layers=()):
+        self.glyph = glyph
+        self._layers = []
+        self._byId = {}
+        for layer in layers:
+            self.append(layer)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._layers[key]
+        return self._byId.get(key)
+
+    def __setitem__(self, key, layer):
+        old = self._byId.get(key)
+        layer.layerId = layer.associatedMasterId = key
+        layer.parent = self.glyph
+        if old is not None:
+            self._layers[self._layers.index(old)] = layer
+        else:
+            self._layers.append(layer)
+        self._byId[key] = layer
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __len__(self):
+        return len(self._layers)
+
+    def append(self, layer):
+        if layer.layerId is None or layer.layerId in self._byId:
+            layer.layerId = str(uuid.uuid4()).upper()
+        if layer.associatedMasterId is None:
+            layer.associatedMasterId = layer.layerId
+        layer.parent = self.glyph
+        self._layers.append(layer)
+        self._byId[layer.layerId] = layer
+
+    def extend(self, layers):
+        for layer in layers:
+            self.append(layer)
+
+    def remove(self, layer):
+        self._layers.remove(layer)
+        del self._byId[layer.layerId]
+
+
+class GSGlyph(object):
+    __slots__ = ("_name", "unicodes", "category", "subCategory", "script", "export", "color", "lastChange",
+                 "leftKerningGroup", "rightKerningGroup", "userData", "_layers", "parent")
+
+    def __init__(self, name=None):
+        self._name = name
+        self.unicodes = []
+        self.category = None
+        self.subCategory = None
+        self.script = None
+        self.export = True
+        self.color = None
+        self.lastChange = None
+        self.leftKerningGroup = None
+        self.rightKerningGroup = None
+        self.userData = {}
+        self._layers = GlyphLayers(self)
+        self.parent = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        old, self._name = self._name, name
+        if self.parent is not None and old != name:
+            self.parent.glyphs._renamed(self, old)
+
+    @property
+    def layers(self):
+        return self._layers
+
+    @layers.setter
+    def layers(self, layers):
+        self._layers = GlyphLayers(self, layers)
+
+    @property
+    def unicode(self):
+        return self.unicodes[0] if self.unicodes else None
+
+    @unicode.setter
+    def unicode(self, value):
+        self.unicodes = [value] if value else []
+
+    def beginUndo(self):
+        pass
+
+    def endUndo(self):
+        pass
+
+    @property
+    def mastersCompatible(self):
+        """Same path/node structure, component order and anchor names in every master layer."""
+        signatures = set()
+        for master in self.parent.masters:
+            layer = self._layers[master.id]
+            if layer is None:
+                continue
+            signatures.add((
+                tuple(tuple(n.type for n in s.nodes) if isinstance(s, GSPath) else s.componentName for s in layer.shapes),
+                tuple(sorted(a.name for a in layer.anchors)),
+            ))
+        return len(signatures) <= 1
+
+    def copy(self):
+        glyph = GSGlyph(self._name)
+        for attr in ("unicodes", "category", "subCategory", "script", "export", "color",
+                     "leftKerningGroup", "rightKerningGroup"):
+            setattr(glyph, attr, getattr(self, attr))
+        glyph.unicodes = list(self.unicodes)
+        glyph.userData = dict(self.userData)
+        for layer in self._layers:
+            copy = layer.copy()
+            copy.layerId = layer.layerId
+            glyph._layers.append(copy)
+        return glyph
+
+    def __repr__(self):
+        return f"<GSGlyph \"{self._name}\" with {len(self._layers)} layers>"
+
+
+# -----------------------------
+# Font
+# -----------------------------
+class GSFontMaster(object):
+    __slots__ = ("id", "name", "ascender", "descender", "xHeight", "capHeight", "italicAngle", "axes",
+                 "guides", "userData", "customParameters", "parent")
+
+    def __init__(self, name="Regular"):
+        self.id = str(uuid.uuid4()).upper()
+        self.name = name
+        self.ascender = 800
+        self.descender = -200
+        self.xHeight = 500
+        self.capHeight = 700
+        self.italicAngle = 0
+        self.axes = []
+        self.guides = []
+        self.userData = {}
+        self.customParameters = {}
+        self.parent = None
+
+    def __repr__(self):
+        return f"<GSFontMaster \"{self.name}\">"
+
+
+class FontMasters(list):
+    """font.masters: a list that can also be indexed by master id."""
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for master in self:
+                if master.id == key:
+                    return master
+            return None
+        return list.__getitem__(self, key)
+
+
+class FontGlyphs(object):
+    """font.glyphs: index by name or position, append/remove keep the name index current."""
+    __slots__ = ("font", "_glyphs", "_byName")
+
+    def __init__(self, font, glyphs=()):
+        self.font = font
+        self._glyphs = []
+        self._byName = {}
+        for glyph in glyphs:
+            self.append(glyph)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._glyphs[key]
+        return self._byName.get(key)
+
+    def __iter__(self):
+        return iter(self._glyphs)
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def __contains__(self, name):
+        return name in self._byName
+
+    def keys(self):
+        return [g.name for g in self._glyphs]
+
+    def append(self, glyph):
+        glyph.parent = self.font
+        self._glyphs.append(glyph)
+        self._byName[glyph.name] = glyph
+
+    def extend(self, glyphs):
+        for glyph in glyphs:
+            self.append(glyph)
+
+    def remove(self, glyph):
+        self._glyphs.remove(glyph)
+        self._byName.pop(glyph.name, None)
+        glyph.parent = None
+
+    def __delitem__(self, key):
+        self.remove(self[key])
+
+    def _renamed(self, glyph, old):
+        if self._byName.get(old) is glyph:
+            del self._byName[old]
+        self._byName[glyph.name] = glyph
+
+
+class GSEditViewController(object):
+    """font.newTab() result: keeps the tab text for inspection."""
+    __slots__ = ("text", "parent")
+
+    def __init__(self, text, parent=None):
+        self.text = text
+        self.parent = parent
+
+    def close(self):
+        if self.parent is not None and self in self.parent.tabs:
+            self.parent.tabs.remove(self)
+
+
+class GSFont(object):
+    __slots__ = ("familyName", "upm", "grid", "filepath", "formatVersion", "masters", "_glyphs",
+                 "userData", "tempData", "customParameters", "masterIndex", "selectedLayers", "selection",
+                 "tabs", "updateInterfaceDisabled")
+
+    def __init__(self):
+        self.familyName = "Untitled"
+        self.upm = 1000
+        self.grid = 1
+        self.filepath = None
+        self.formatVersion = 3
+        self.masters = FontMasters()
+        self._glyphs = FontGlyphs(self)
+        self.userData = {}
+        self.tempData = {}
+        self.customParameters = []
+        self.masterIndex = 0
+        self.selectedLayers = []
+        self.selection = []
+        self.tabs = []
+        self.updateInterfaceDisabled = 0
+
+    @property
+    def glyphs(self):
+        return self._glyphs
+
+    @glyphs.setter
+    def glyphs(self, glyphs):
+        self._glyphs = glyphs if hasattr(glyphs, "_renamed") else FontGlyphs(self, glyphs)
+
+    @property
+    def selectedFontMaster(self):
+        return self.masters[self.masterIndex] if self.masters else None
+
+    @property
+    def currentTab(self):
+        return self.tabs[-1] if self.tabs else None
+
+    def newTab(self, tabText=""):
+        tab = GSEditViewController(tabText, self)
+        self.tabs.append(tab)
+        return tab
+
+    def disableUpdateInterface(self):
+        self.updateInterfaceDisabled += 1
+
+    def enableUpdateInterface(self):
+        self.updateInterfaceDisabled = max(0, self.updateInterfaceDisabled - 1)
+
+    def __repr__(self):
+        return f"<GSFont \"{self.familyName}\" v{self.formatVersion} with {len(self.masters)} masters and {len(self._glyphs)} glyphs>"
+
+
+# -----------------------------
+# Application
+# -----------------------------
+class GSDocument(object):
+    __slots__ = ("font",)
+
+    def __init__(self, font):
+        self.font = font
+
+    def windowController(self):
+        return None
+
+
+class GSApplication(object):
+    """The Glyphs object. Notifications are collected instead of shown."""
+    __slots__ = ("fonts", "defaults", "notifications", "versionNumber", "buildNumber")
+
+    def __init__(self):
+        self.fonts = []
+        self.defaults = {}
+        self.notifications = []
+        self.versionNumber = 3.2
+        self.buildNumber = 3000
+
+    @property
+    def font(self):
+        return self.fonts[0] if self.fonts else None
+
+    @font.setter
+    def font(self, font):
+        if font in self.fonts:
+            self.fonts.remove(font)
+        if font is not None:
+            self.fonts.insert(0, font)
+
+    @property
+    def documents(self):
+        return [GSDocument(font) for font in self.fonts]
+
+    @property
+    def currentDocument(self):
+        return GSDocument(self.fonts[0]) if self.fonts else None
+
+    def open(self, path, showInterface=True):
+        """Open a .glyphs file with the headless reader and make it the current font."""
+        from GlyphsFileReader import open_font
+        font = open_font(path)
+        self.font = font
+        return font
+
+    def showNotification(self, title, message):
+        self.notifications.append((title, message))
+
+    def showMacroWindow(self):
+        pass
+
+    def clearLog(self):
+        pass
+
+    def redraw(self):
+        pass
+
+
+Glyphs = GSApplication()
+
+
+def Message(message, title="Alert", OKButton=None):
+    Glyphs.notifications.append((title, message))
+
+
+def GetSaveFile(message=None, ProposedFileName=None, filetypes=None):
+    return None
+
+
+def GetOpenFile(message=None, allowsMultipleSelection=False, filetypes=None, path=None):
+    return None
+
+
+def GetFolder(message=None, allowsMultipleSelection=False, path=None):
+    return None
+
+
+# -----------------------------
+# Running scripts
+# -----------------------------
+def run_script(path, font=None):
+    """
+    Run a script the way the Macro panel does: Glyphs and the GlyphsApp names
+    are predefined globals. Returns the script's globals; a SystemExit raised
+    by the script ends it normally.
+    """
+    if font is not None:
+        Glyphs.font = font
+    module = sys.modules[__name__]
+    names = {name: getattr(module, name) for name in __all__}
+    names["GlyphsApp"] = module
+    try:
+        return runpy.run_path(path, init_globals=names, run_name="__main__")
+    except SystemExit:
+        return names
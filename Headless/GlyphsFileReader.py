@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Headless reader for Glyphs 3 (.glyphs, format version 3) source files.
+
+Opens a file without Glyphs.app and builds the objects of the GlyphsApp
+stand-in package (Headless/GlyphsApp), so the scripts in this repository can
+run against it. Glyph byte
+offsets are indexed up front and each glyph is parsed only the first time it
+is accessed, so a check that touches a few hundred glyphs of a large file does
+not pay for a full parse.
+
+    from GlyphsFileReader import GlyphsFile
+    font = GlyphsFile("MyFamily.glyphs").font
+    for glyph in font.glyphs: ...
+
+Category is read from the file when it is set there, and otherwise derived
+from the Unicode general category (Glyphs.app uses its own GlyphData, so this
+is an approximation). Script is only available when set in the file.
+"""
+
+import math
+import os
+import re
+import sys
+import unicodedata
+
+from GlyphsApp import GSFont, GSFontMaster, GSGlyph, GSLayer, GSPath, GSNode, GSComponent, GSAnchor, GSGuide
+
+# -----------------------------
+# OpenStep plist parser
+# -----------------------------
+_TOKEN = re.compile(
+    r'\s*(?:(?P<punct>[{}()=;,])'
+    r'|"(?P<quoted>(?:[^"\\]|\\.)*)"'
+    r'|<(?P<data>[0-9a-fA-F\s]*)>'
+    r'|(?P<bare>[^\s{}()=;,"<>]+))',
+    re.S,
+)
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$")
+_ESCAPE = re.compile(r'\\(U[0-9a-fA-F]{4}|[0-7]{1,3}|.)', re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "a": "\a", "b": "\b", "f": "\f", "v": "\v"}
+
+
+def _unescape(text):
+    def replace(match):
+        code = match.group(1)
+        if code[0] == "U" and len(code) == 5:
+            return chr(int(code[1:], 16))
+        if code[0].isdigit():
+            return chr(int(code, 8))
+        return _ESCAPES.get(code, code)
+    return _ESCAPE.sub(replace, text) if "\\" in text else text
+
+
+def _bare_value(text):
+    if _NUMBER.match(text):
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        return int(text)
+    return text
+
+
+def parse_plist(text, pos=0):
+    """
+    Parse one OpenStep plist value from text starting at pos.
+    Returns (value, end position). Dicts become dict, arrays list, numbers
+    int/float and everything else str.
+    """
+    stack = []       # containers being filled
+    keys = []        # pending dict key per dict on the stack
+    value = None
+    have_value = False
+    length = len(text)
+
+    while True:
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            if text[pos:].strip() == "":
+                raise ValueError("Unexpected end of plist")
+            raise ValueError(f"Unexpected character at {pos}: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        punct = match.group("punct")
+
+        if punct is None:
+            if match.group("quoted") is not None:
+                token = _unescape(match.group("quoted"))
+            elif match.group("data") is not None:
+                token = bytes.fromhex("".join(match.group("data").split()))
+            else:
+                token = _bare_value(match.group("bare"))
+            value, have_value = token, True
+        elif punct == "{":
+            stack.append({})
+            keys.append(None)
+            continue
+        elif punct == "(":
+            stack.append([])
+            keys.append(None)
+            continue
+        elif punct in "})":
+            container = stack.pop()
+            keys.pop()
+            if punct == ")" and have_value:
+                container.append(value)
+            value, have_value = container, True
+        elif punct == "=":
+            keys[-1] = str(value)
+            have_value = False
+            continue
+        elif punct == ";":
+            stack[-1][keys[-1]] = value
+            keys[-1] = None
+            have_value = False
+            continue
+        elif punct == ",":
+            stack[-1].append(value)
+            have_value = False
+            continue
+
+        if not stack:
+            return value, pos
+        if pos >= length:
+            raise ValueError("Unexpected end of plist")
+
+
+# -----------------------------
+# Building objects from plist data
+# -----------------------------
+NODE_TYPES = {"l": "line", "c": "curve", "o": "offcurve", "q": "qcurve"}
+
+
+def _transform(shape):
+    x, y = (shape.get("pos") or (0, 0))[:2]
+    sx, sy = (shape.get("scale") or (1, 1))[:2]
+    angle = math.radians(shape.get("angle", 0))
+    cos, sin = math.cos(angle), math.sin(angle)
+    return (sx * cos, sx * sin, -sy * sin, sy * cos, x, y)
+
+
+def _build_node(node):
+    code = str(node[2])
+    gsNode = GSNode((node[0], node[1]), NODE_TYPES.get(code[0], "line"))
+    gsNode.smooth = code.endswith("s")
+    return gsNode
+
+
+def _build_layer(data, masterNames):
+    layer = GSLayer()
+    layer.layerId = str(data.get("layerId", ""))
+    layer.associatedMasterId = str(data.get("associatedMasterId", layer.layerId))
+    layer.name = str(data.get("name", masterNames.get(layer.layerId, "")))
+    layer.width = data.get("width", 600)
+    layer.attributes = data.get("attr", {})
+    layer.userData = data.get("userData", {})
+    shapes = []
+    for shape in data.get("shapes", ()):
+        if "ref" in shape:
+            component = GSComponent(str(shape["ref"]), transform=_transform(shape))
+            component.alignment = shape.get("alignment", 0)
+            component.locked = bool(shape.get("locked", 0))
+            component.smartComponentValues = shape.get("piece", {})
+            shapes.append(component)
+        else:
+            path = GSPath()
+            path.closed = bool(shape.get("closed", 0))
+            path.nodes = [_build_node(node) for node in shape.get("nodes", ())]
+            shapes.append(path)
+    layer.shapes = shapes
+    layer.anchors = [GSAnchor(str(a.get("name", "")), (a.get("pos") or (0, 0))[:2]) for a in data.get("anchors", ())]
+    guides = []
+    for g in data.get("guides", ()):
+        guide = GSGuide((g.get("pos") or (0, 0))[:2], g.get("angle", 0))
+        guide.locked = bool(g.get("locked", 0))
+        guide.name = g.get("name")
+        guides.append(guide)
+    layer.guides = guides
+    return layer
+
+
+_CATEGORIES = {"L": "Letter", "M": "Mark", "N": "Number", "P": "Punctuation", "S": "Symbol", "Z": "Separator"}
+
+
+def _derived_category(glyph, font):
+    """Approximate the Glyphs category from the Unicode general category or the base glyph."""
+    codepoint = glyph.unicodes[0] if glyph.unicodes else None
+    if codepoint is None and "." in glyph.name:
+        base = font.glyphs[glyph.name.split(".", 1)[0]]
+        return base.category if base is not None else None
+    if codepoint is None:
+        return None
+    general = unicodedata.category(chr(int(codepoint, 16)))
+    if general == "Sk":
+        return "Mark"  # spacing accents are marks in Glyphs
+    return _CATEGORIES.get(general[0], "Other")
+
+
+def _build_glyph(data, font):
+    glyph = GSGlyph(str(data.get("glyphname", "")))
+    glyph.parent = font
+    unicodes = data.get("unicode")
+    if unicodes is not None:
+        if not isinstance(unicodes, list):
+            unicodes = [unicodes]
+        glyph.unicodes = ["%04X" % int(u) for u in unicodes]
+    glyph.subCategory = data.get("subCategory")
+    glyph.script = data.get("script")
+    glyph.export = bool(data.get("export", 1))
+    glyph.color = data.get("color")
+    glyph.lastChange = data.get("lastChange")
+    glyph.leftKerningGroup = data.get("kernLeft")
+    glyph.rightKerningGroup = data.get("kernRight")
+    glyph.userData = data.get("userData", {})
+    masterNames = {m.id: m.name for m in font.masters}
+    glyph.layers = [_build_layer(layer, masterNames) for layer in data.get("layers", ())]
+    glyph.category = data.get("category") or _derived_category(glyph, font)
+    return glyph
+
+
+# -----------------------------
+# Lazy glyph access
+# -----------------------------
+_SCAN = re.compile(rb'"(?:[^"\\]|\\.)*"|\([^()"{}]*\)|\{[^()"{}]*\}|[{}()]')
+_GLYPHNAME = re.compile(rb'\bglyphname\s*=\s*("(?:[^"\\]|\\.)*"|[^;\s]+)\s*;')
+
+
+class LazyGlyphs(object):
+    """
+    font.glyphs: parses each glyph from its byte offset on first access.
+    Renaming parsed glyphs is tracked; adding or removing glyphs is not supported.
+    """
+
+    def __init__(self, font, data, offsets, names, end):
+        self._font = font
+        self._data = data
+        self._offsets = offsets
+        self._end = end
+        self._names = names
+        self._index = {name: i for i, name in enumerate(names)}
+        self._cache = [None] * len(names)
+
+    def _glyph(self, i):
+        glyph = self._cache[i]
+        if glyph is None:
+            start = self._offsets[i]
+            end = self._offsets[i + 1] if i + 1 < len(self._offsets) else self._end
+            text = self._data[start:end].decode("utf-8")
+            value, _ = parse_plist(text)
+            glyph = self._cache[i] = _build_glyph(value, self._font)
+        return glyph
+
+    @property
+    def parsedCount(self):
+        return sum(1 for g in self._cache if g is not None)
+
+    def keys(self):
+        return list(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        for i in range(len(self._names)):
+            yield self._glyph(i)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._glyph(key if key >= 0 else len(self._names) + key)
+        i = self._index.get(key)
+        return self._glyph(i) if i is not None else None
+
+    def _renamed(self, glyph, old):
+        i = self._index.pop(old, None)
+        if i is not None:
+            self._names[i] = glyph.name
+            self._index[glyph.name] = i
+
+
+class GlyphsFile(object):
+    """
+    A .glyphs file opened for reading. The font-level data is parsed right
+    away; glyphs are indexed by byte offset and parsed lazily.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = f.read()
+        self.font = self._read()
+
+    def _top_level_key(self, pattern):
+        """
+        Return the first match of pattern, at the start of a line, that is a key
+        of the top-level dict: matches inside strings or nested dicts (a
+        userData entry named glyphs, say) are skipped.
+        """
+        data = self.data
+        tokens = _SCAN.finditer(data)
+        token = next(tokens, None)
+        depth = 0
+        for match in re.finditer(rb'\n\s*(' + pattern + rb')', data):
+            key = match.start(1)
+            while token is not None and token.end() <= key:
+                text = token.group()
+                if len(text) == 1:
+                    depth += 1 if text in b"{(" else -1
+                token = next(tokens, None)
+            if token is not None and token.start() < key:
+                continue  # inside a string
+            if depth == 1:
+                return match
+        return None
+
+    def _glyphs_array(self):
+        """Return (start of the glyphs array, [glyph offsets], [glyph names], end of the glyphs array)."""
+        data = self.data
+        match = self._top_level_key(rb'glyphs\s*=\s*\(')
+        if match is None:
+            return None
+        arrayStart = match.end()
+
+        # walk the brackets only, jumping over strings and flat groups such as
+        # node tuples, to find where each glyph dict starts and the array ends
+        offsets = []
+        arrayEnd = None
+        depth = 0
+        for token in _SCAN.finditer(data, arrayStart):
+            text = token.group()
+            if len(text) > 1:
+                continue
+            if text in b"{(":
+                if depth == 0:
+                    offsets.append(token.start())
+                depth += 1
+            else:
+                depth -= 1
+                if depth < 0:
+                    arrayEnd = token.start()
+                    break
+        if arrayEnd is None:
+            raise ValueError(f"{self.path}: unterminated glyphs array")
+
+        names = []
+        for i, start in enumerate(offsets):
+            end = offsets[i + 1] if i + 1 < len(offsets) else arrayEnd
+            name = _GLYPHNAME.search(data, start, end)
+            if name is None:
+                raise ValueError(f"{self.path}: glyph without glyphname at byte {start}")
+            name = name.group(1).decode("utf-8")
+            names.append(_unescape(name[1:-1]) if name.startswith('"') else name)
+        return arrayStart, offsets, names, arrayEnd
+
+    def _read(self):
+        located = self._glyphs_array()
+        if located is None:
+            raise ValueError(f"{self.path}: no glyphs array found")
+        arrayStart, offsets, names, arrayEnd = located
+
+        # parse everything but the glyph bodies
+        header = self.data[:arrayStart] + self.data[arrayEnd:]
+        top, _ = parse_plist(header.decode("utf-8"))
+        if int(top.get(".formatVersion", 2)) < 3:
+            raise ValueError(f"{self.path}: only Glyphs 3 files (.formatVersion = 3) are supported")
+
+        font = GSFont()
+        font.filepath = self.path
+        font.familyName = top.get("familyName", "")
+        font.upm = top.get("unitsPerEm", 1000)
+        font.grid = top.get("gridLength", 1)
+        font.userData = top.get("userData", {})
+        font.customParameters = top.get("customParameters", [])
+
+        metricTypes = [m.get("type", "") for m in top.get("metrics", ())]
+        for data in top.get("fontMaster", ()):
+            master = GSFontMaster(str(data.get("name", "")))
+            master.id = str(data.get("id", ""))
+            master.parent = font
+            values = data.get("metricValues", ())
+            for metricType, value in zip(metricTypes, values):
+                pos = value.get("pos", 0) if isinstance(value, dict) else 0
+                if metricType == "ascender":
+                    master.ascender = pos
+                elif metricType == "descender":
+                    master.descender = pos
+                elif metricType == "x-height":
+                    master.xHeight = pos
+                elif metricType == "cap height":
+                    master.capHeight = pos
+            master.italicAngle = data.get("italicAngle", 0)
+            master.axes = list(data.get("axesValues", ()))
+            master.userData = data.get("userData", {})
+            font.masters.append(master)
+
+        font.glyphs = LazyGlyphs(font, self.data, offsets, names, arrayEnd)
+        return font
+
+
+def open_font(path):
+    """Open a .glyphs file and return its (lazily parsed) font."""
+    return GlyphsFile(path).font
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        font = open_font(path)
+        print(f"{os.path.basename(path)}: {font.familyName}, {len(font.masters)} masters, {len(font.glyphs)} glyphs")
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Synthetic fonts for benchmarking the scripts without Glyphs.app.
+
+make_font() builds a GSFont of the GlyphsApp stand-in with a configurable
+number of glyphs, masters, nodes per path, composite ratio and backup layers.
+The fonts are deterministic for a given seed and contain what the checks look
+for: a few close on-curve nodes, composites with regular (non-.case) accents
+on uppercase bases, components with automatic alignment disabled, and glyphs
+reaching past the vertical metrics. All masters of a glyph share the same
+structure, so the fonts are compatible.
+
+write_glyphs_file() saves such a font as a Glyphs 3 file that
+GlyphsFileReader can open, for runs over .glyphs files:
+
+    python Headless/SyntheticFont.py --glyphs 10000 --masters 8 Synthetic.glyphs
+"""
+
+import argparse
+import math
+import random
+import re
+
+from GlyphsApp import GSFont, GSFontMaster, GSGlyph, GSLayer, GSPath, GSNode, GSComponent, GSAnchor, LINE, CURVE, OFFCURVE
+
+MARKS = ("acute", "grave", "circumflex", "dieresis", "tilde", "ring", "caron", "macron", "breve", "dotaccent", "cedilla", "ogonek")
+BASES = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+LAST_CHANGE = "2025-01-01 12:00:00 +0000"
+
+CLOSE_NODE_RATE = 0.02     # share of paths with two on-curve nodes 1–3 units apart
+NO_ALIGNMENT_RATE = 0.05   # share of composites with automatic alignment disabled
+CASE_MARK_RATE = 0.5       # share of uppercase composites that already use .case accents
+
+
+# -----------------------------
+# Outlines
+# -----------------------------
+def outline(rng, nodeCount, top, bottom, left, right):
+    """
+    Return [(x, y, type)] for one closed contour of about nodeCount nodes
+    around an ellipse: curve segments (two handles + on-curve) and the rest lines.
+    """
+    nodes = []
+    onCurves = max(2, nodeCount // 3)
+    cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
+    rx, ry = (right - left) / 2.0, (top - bottom) / 2.0
+    step = 2 * math.pi / onCurves
+    lines = nodeCount - 3 * onCurves
+    for i in range(onCurves):
+        angle = i * step
+        if lines > 0:
+            lines -= 1
+            nodes.append((round(cx + rx * math.cos(angle - step / 2)), round(cy + ry * math.sin(angle - step / 2)), LINE))
+        # handles on the tangents, so the curve stays inside the box
+        for t in (0.66, 0.33):
+            a = angle - step * t
+            nodes.append((round(cx + rx * math.cos(a)), round(cy + ry * math.sin(a)), OFFCURVE))
+        nodes.append((round(cx + rx * math.cos(angle)), round(cy + ry * math.sin(angle)), CURVE))
+    if rng.random() < CLOSE_NODE_RATE:
+        x, y, _ = nodes[-1]
+        nodes.append((x + rng.randint(1, 3), y, LINE))
+    return nodes
+
+
+def _path(points, scale, shift):
+    path = GSPath()
+    nodes = []
+    for x, y, nodeType in points:
+        node = GSNode((round(x * scale + shift), round(y * scale)), nodeType)
+        nodes.append(node)
+    path.nodes = nodes
+    return path
+
+
+# -----------------------------
+# Font
+# -----------------------------
+def _glyph_names(glyphCount, compositeRatio):
+    """Return [(name, kind, base, mark)] with kind 'mark', 'base' or 'composite'."""
+    specs = []
+    for mark in MARKS:
+        specs.append((mark, "mark", None, None))
+        specs.append((mark + ".case", "mark", None, None))
+    composites = int(max(0, glyphCount - len(specs)) * compositeRatio)
+    bases = max(0, glyphCount - len(specs) - composites)
+
+    for i in range(bases):
+        letter = BASES[i % len(BASES)]
+        round_ = i // len(BASES)
+        specs.append((letter if round_ == 0 else f"{letter}.alt{round_:03d}", "base", None, None))
+    baseNames = [s[0] for s in specs if s[1] == "base"] or ["A"]
+    for i in range(composites):
+        base = baseNames[i % len(baseNames)]
+        mark = MARKS[(i // len(baseNames)) % len(MARKS)]
+        round_ = i // (len(baseNames) * len(MARKS))
+        stem, _, suffix = base.partition(".")
+        name = stem + mark + ("." + suffix if suffix else "")
+        specs.append((name if round_ == 0 else f"{name}.{round_:03d}", "composite", base, mark))
+    return specs[:glyphCount]
+
+
+def make_font(glyphCount=1000, masterCount=2, nodesPerPath=16, pathsPerGlyph=2, compositeRatio=0.3, backupLayers=0, seed=0):
+    """Return a synthetic GSFont. Masters get heavier/taller in order, like a weight axis."""
+    rng = random.Random(seed)
+    font = GSFont()
+    font.familyName = f"Synthetic {glyphCount}x{masterCount}"
+    for i in range(masterCount):
+        master = GSFontMaster(f"Master {i + 1}")
+        master.id = f"m{i + 1:02d}"
+        master.ascender = 750 + 5 * i
+        master.descender = -250 - 5 * i
+        master.xHeight = 500 + 2 * i
+        master.capHeight = 700
+        master.axes = [100 + 800 * i / max(1, masterCount - 1)]
+        master.parent = font
+        font.masters.append(master)
+    masters = list(font.masters)
+
+    glyphs = []
+    for name, kind, base, mark in _glyph_names(glyphCount, compositeRatio):
+        glyph = GSGlyph(name)
+        glyph.category = "Mark" if kind == "mark" else "Letter"
+        glyph.lastChange = LAST_CHANGE
+        if kind == "base" and "." not in name:
+            glyph.unicode = "%04X" % ord(name)
+
+        contours = []
+        components = []
+        if kind == "mark":
+            contours.append(outline(rng, max(4, nodesPerPath // 2), 100, 0, 0, 120))
+        elif kind == "base":
+            upper = name[0].isupper()
+            # a few glyphs reach past the vertical metrics
+            top = (700 if upper else rng.choice((500, 500, 500, 760))) + rng.choice((0, 0, 0, 0, 0, 0, 0, 0, 0, 120))
+            bottom = rng.choice((0,) * 9 + (-260,))
+            for p in range(pathsPerGlyph):
+                inset = 40 * p
+                contours.append(outline(rng, nodesPerPath, top - inset, bottom + inset, 40 + inset, 560 - inset))
+        else:
+            upper = base[0].isupper()
+            markName = mark + ".case" if upper and rng.random() < CASE_MARK_RATE else mark
+            components.append((base, (0, 0), 0))
+            components.append((markName, (240, 720 if upper else 520), -1 if rng.random() < NO_ALIGNMENT_RATE else 0))
+
+        layers = []
+        for index, master in enumerate(masters):
+            scale = 1.0 + 0.1 * index / max(1, masterCount - 1)
+            sources = [(master.id, master.id, master.name)]
+            sources += [(None, master.id, f"Backup {b + 1}") for b in range(backupLayers)]
+            for layerId, masterId, layerName in sources:
+                layer = GSLayer()
+                layer.layerId = layerId
+                layer.associatedMasterId = masterId
+                layer.name = layerName
+                layer.width = round(600 * scale)
+                shapes = [_path(points, scale, 0) for points in contours]
+                for componentName, offset, alignment in components:
+                    component = GSComponent(componentName, offset)
+                    component.alignment = alignment
+                    shapes.append(component)
+                layer.shapes = shapes
+                if kind == "base":
+                    layer.anchors = [GSAnchor("top", (300, 720 if name[0].isupper() else 520))]
+                layers.append(layer)
+        glyph.layers = layers
+        glyphs.append(glyph)
+    font.glyphs = glyphs
+    return font
+
+
+# -----------------------------
+# Writing .glyphs files
+# -----------------------------
+_BARE = re.compile(r"^[A-Za-z0-9._]+$")
+_NODE_CODES = {LINE: "l", CURVE: "c", OFFCURVE: "o", "qcurve": "q"}
+
+
+def _string(value):
+    value = str(value)
+    if _BARE.match(value) and not value[0] == ".":
+        return value
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def write_glyphs_file(font, path):
+    """
+    Write font as a Glyphs 3 file. Only what GlyphsFileReader reads is written
+    (masters with vertical metrics, glyphs, layers, paths, components, anchors),
+    so the file is meant for headless runs, not for editing in Glyphs.
+    """
+    out = ["{", ".appVersion = \"3300\";", ".formatVersion = 3;", f"familyName = {_string(font.familyName)};", "fontMaster = ("]
+    for i, master in enumerate(font.masters):
+        metrics = (master.ascender, 0, master.descender, master.xHeight, master.capHeight)
+        out.append("{")
+        out.append("axesValues = (" + ",".join(_number(v) for v in master.axes) + ");")
+        out.append(f"id = {_string(master.id)};")
+        out.append("metricValues = (" + ",".join("{pos = %s;}" % _number(v) for v in metrics) + ");")
+        out.append(f"name = {_string(master.name)};")
+        out.append("}," if i + 1 < len(font.masters) else "}")
+    out.append(");")
+    out.append("glyphs = (")
+    for i, glyph in enumerate(font.glyphs):
+        out.append("{")
+        if glyph.category:
+            out.append(f"category = {_string(glyph.category)};")
+        if glyph.color is not None:
+            out.append(f"color = {glyph.color};")
+        if not glyph.export:
+            out.append("export = 0;")
+        out.append(f"glyphname = {_string(glyph.name)};")
+        if glyph.lastChange:
+            out.append(f"lastChange = {_string(glyph.lastChange)};")
+        out.append("layers = (")
+        for j, layer in enumerate(glyph.layers):
+            out.append("{")
+            if layer.anchors:
+                anchors = ",".join("{name = %s;pos = (%s,%s);}" % (_string(a.name), _number(a.x), _number(a.y)) for a in layer.anchors)
+                out.append(f"anchors = ({anchors});")
+            if not layer.isMasterLayer:
+                out.append(f"associatedMasterId = {_string(layer.associatedMasterId)};")
+            out.append(f"layerId = {_string(layer.layerId)};")
+            if not layer.isMasterLayer:
+                out.append(f"name = {_string(layer.name)};")
+            shapes = []
+            for shape in layer.shapes:
+                if isinstance(shape, GSComponent):
+                    x, y = shape.position
+                    alignment = "alignment = -1;" if not shape.automaticAlignment else ""
+                    shapes.append("{%spos = (%s,%s);ref = %s;}" % (alignment, _number(x), _number(y), _string(shape.componentName)))
+                else:
+                    nodes = ",\n".join("(%s,%s,%s%s)" % (_number(n.x), _number(n.y), _NODE_CODES[n.type], "s" if n.smooth else "") for n in shape.nodes)
+                    shapes.append("{\nclosed = %d;\nnodes = (\n%s\n);\n}" % (1 if shape.closed else 0, nodes))
+            if shapes:
+                out.append("shapes = (\n" + ",\n".join(shapes) + "\n);")
+            out.append(f"width = {_number(layer.width)};")
+            out.append("}," if j + 1 < len(glyph.layers) else "}")
+        out.append(");")
+        if glyph.unicode:
+            out.append(f"unicode = {int(glyph.unicode, 16)};")
+        out.append("}," if i + 1 < len(font.glyphs) else "}")
+    out.append(");")
+    out.append("metrics = ({type = ascender;},{type = baseline;},{type = descender;},{type = \"x-height\";},{type = \"cap height\";});")
+    out.append(f"unitsPerEm = {font.upm};")
+    out.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic Glyphs 3 file.")
+    parser.add_argument("path")
+    parser.add_argument("--glyphs", type=int, default=1000)
+    parser.add_argument("--masters", type=int, default=2)
+    parser.add_argument("--nodes", type=int, default=16, help="nodes per path")
+    parser.add_argument("--paths", type=int, default=2, help="paths per non-composite glyph")
+    parser.add_argument("--composites", type=float, default=0.3, help="share of composite glyphs")
+    parser.add_argument("--backups", type=int, default=0, help="backup layers per master")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    font = make_font(args.glyphs, args.masters, args.nodes, args.paths, args.composites, args.backups, args.seed)
+    write_glyphs_file(font, args.path)
+    print(f"Wrote {args.path}: {len(font.glyphs)} glyphs, {len(font.masters)} masters")
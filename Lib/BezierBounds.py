@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Exact outline bounds from node lists, without Glyphs.app.
+
+Takes the node lists the scripts already iterate (GSNode-like objects with
+x, y and type, or plain (x, y, type) tuples) and returns the bounds including
+the true extrema of cubic and quadratic curve segments, not just node
+coordinates. batch_layer_bounds() solves all cubic segments of many layers in
+one NumPy pass when NumPy is available and falls back to pure Python otherwise.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OFFCURVE = "offcurve"
+EPSILON = 1e-12
+
+
+# -----------------------------
+# Segments
+# -----------------------------
+def _xyt(node):
+    if isinstance(node, tuple):
+        return node
+    return node.x, node.y, node.type
+
+
+def path_segments(nodes, closed=True):
+    """
+    Split a Glyphs node list into segments.
+
+    Returns [(kind, [(x, y), ...])] with kind "line", "cubic" or "quad".
+    In closed paths the node list is cyclic: the off-curves before the first
+    on-curve node belong to the segment that ends on it. TrueType-style
+    qcurves with several off-curves are split at their implied on-curves.
+    """
+    nodes = [_xyt(n) for n in nodes]
+    onCurves = [i for i, n in enumerate(nodes) if n[2] != OFFCURVE]
+    if not onCurves:
+        return []
+
+    if closed:
+        start = onCurves[-1]
+        order = [nodes[(start + 1 + k) % len(nodes)] for k in range(len(nodes))]
+    else:
+        start = onCurves[0]
+        order = nodes[start + 1:]
+
+    segments = []
+    previous = nodes[start][:2]
+    offCurves = []
+    for x, y, nodeType in order:
+        if nodeType == OFFCURVE:
+            offCurves.append((x, y))
+            continue
+        point = (x, y)
+        if not offCurves:
+            segments.append(("line", [previous, point]))
+        elif nodeType == "curve" and len(offCurves) == 2:
+            segments.append(("cubic", [previous, offCurves[0], offCurves[1], point]))
+        elif nodeType == "qcurve" or len(offCurves) == 1:
+            controls = offCurves
+            p0 = previous
+            for k, c in enumerate(controls):
+                if k + 1 < len(controls):
+                    nxt = controls[k + 1]
+                    p2 = ((c[0] + nxt[0]) / 2.0, (c[1] + nxt[1]) / 2.0)
+                else:
+                    p2 = point
+                segments.append(("quad", [p0, c, p2]))
+                p0 = p2
+        else:
+            # unexpected handle count: the control polygon still contains the curve
+            segments.append(("line", [previous] + offCurves + [point]))
+        previous = point
+        offCurves = []
+    return segments
+
+
+# -----------------------------
+# Extrema
+# -----------------------------
+def _cubic_roots(a, b, c):
+    """Roots in (0, 1) of the cubic derivative a*t² + b*t + c."""
+    if abs(a) < EPSILON:
+        if abs(b) < EPSILON:
+            return []
+        roots = [-c / b]
+    else:
+        d = b * b - 4 * a * c
+        if d < 0:
+            return []
+        s = math.sqrt(d)
+        roots = [(-b + s) / (2 * a), (-b - s) / (2 * a)]
+    return [t for t in roots if 0 < t < 1]
+
+
+def _cubic_at(p0, p1, p2, p3, t):
+    mt = 1 - t
+    return mt * mt * mt * p0 + 3 * mt * mt * t * p1 + 3 * mt * t * t * p2 + t * t * t * p3
+
+
+def _axis_values(kind, values):
+    """Return the endpoint and extremum values of one coordinate axis of a segment."""
+    if kind == "cubic":
+        p0, p1, p2, p3 = values
+        a = -p0 + 3 * p1 - 3 * p2 + p3
+        b = 2 * (p0 - 2 * p1 + p2)
+        c = p1 - p0
+        return [p0, p3] + [_cubic_at(p0, p1, p2, p3, t) for t in _cubic_roots(a, b, c)]
+    if kind == "quad":
+        p0, p1, p2 = values
+        denominator = p0 - 2 * p1 + p2
+        out = [p0, p2]
+        if abs(denominator) > EPSILON:
+            t = (p0 - p1) / denominator
+            if 0 < t < 1:
+                mt = 1 - t
+                out.append(mt * mt * p0 + 2 * mt * t * p1 + t * t * p2)
+        return out
+    return list(values)
+
+
+def segment_bounds(kind, points):
+    """Return (xMin, yMin, xMax, yMax) of one segment from path_segments()."""
+    xs = _axis_values(kind, [p[0] for p in points])
+    ys = _axis_values(kind, [p[1] for p in points])
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def union_bounds(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def path_bounds(nodes, closed=True):
+    """Return the exact (xMin, yMin, xMax, yMax) of one path, or None if it has no on-curve nodes."""
+    bounds = None
+    segments = path_segments(nodes, closed)
+    for kind, points in segments:
+        bounds = union_bounds(bounds, segment_bounds(kind, points))
+    if bounds is None:
+        # a single on-curve node
+        for x, y, nodeType in (_xyt(n) for n in nodes):
+            if nodeType != OFFCURVE:
+                bounds = union_bounds(bounds, (x, y, x, y))
+    return bounds
+
+
+def _path_args(path):
+    if isinstance(path, tuple):
+        return path
+    return path.nodes, bool(getattr(path, "closed", True))
+
+
+def layer_bounds(paths):
+    """
+    Return the exact (xMin, yMin, xMax, yMax) of a layer, or None if empty.
+    paths are GSPath-like objects (nodes, closed) or (nodes, closed) tuples.
+    """
+    bounds = None
+    for path in paths:
+        nodes, closed = _path_args(path)
+        bounds = union_bounds(bounds, path_bounds(nodes, closed))
+    return bounds
+
+
+# -----------------------------
+# Batch
+# -----------------------------
+def batch_layer_bounds(layers):
+    """
+    Return [bounds or None] for a list of layers (each a list of paths as
+    accepted by layer_bounds()). With NumPy, the derivative roots of every
+    cubic segment of every layer are solved in one vectorized pass.
+    """
+    if np is None:
+        return [layer_bounds(paths) for paths in layers]
+
+    results = [None] * len(layers)
+    cubicOwners = []
+    cubicPoints = []
+    for index, paths in enumerate(layers):
+        bounds = None
+        for path in paths:
+            nodes, closed = _path_args(path)
+            segments = path_segments(nodes, closed)
+            if not segments:
+                bounds = union_bounds(bounds, path_bounds(nodes, closed))
+            for kind, points in segments:
+                if kind == "cubic":
+                    cubicOwners.append(index)
+                    cubicPoints.append(points)
+                else:
+                    bounds = union_bounds(bounds, segment_bounds(kind, points))
+        results[index] = bounds
+
+    if not cubicPoints:
+        return results
+
+    P = np.asarray(cubicPoints, dtype=float)  # segments × 4 × 2
+    p0, p1, p2, p3 = P[:, 0], P[:, 1], P[:, 2], P[:, 3]
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = np.abs(a) < EPSILON
+        d = b * b - 4 * a * c
+        s = np.sqrt(np.where(d >= 0, d, np.nan))
+        t1 = np.where(linear, -c / b, (-b + s) / (2 * a))
+        t2 = np.where(linear, np.nan, (-b - s) / (2 * a))
+
+    candidates = [p0, p3]
+    for t in (t1, t2):
+        valid = (t > 0) & (t < 1)
+        t = np.where(valid, t, 0.0)
+        mt = 1 - t
+        value = mt * mt * mt * p0 + 3 * mt * mt * t * p1 + 3 * mt * t * t * p2 + t * t * t * p3
+        candidates.append(np.where(valid, value, p0))
+    stacked = np.stack(candidates)  # 4 × segments × 2
+    lows = stacked.min(axis=0)
+    highs = stacked.max(axis=0)
+
+    # segments were collected layer by layer, so each layer is one contiguous run
+    owners, starts = np.unique(np.asarray(cubicOwners), return_index=True)
+    layerLows = np.minimum.reduceat(lows, starts)
+    layerHighs = np.maximum.reduceat(highs, starts)
+    for index, low, high in zip(owners, layerLows, layerHighs):
+        index = int(index)
+        results[index] = union_bounds(results[index], (float(low[0]), float(low[1]), float(high[0]), float(high[1])))
+    return results
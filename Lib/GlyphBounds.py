@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Outline bounds per glyph and master, kept in font.tempData for the session.
+
+GlyphBounds measures each glyph's own paths once and builds composite bounds
+from the cached bounds of their components, so editing a base glyph only
+rescans that glyph and moves the stamps of the composites built on it.
+BoundsTable keeps the top and bottom of every glyph and master in flat arrays
+for Highest & Lowest Glyphs and Vertical Metrics Calculator, which share one
+table through bounds_table().
+"""
+
+from array import array
+
+from BezierBounds import union_bounds
+
+TABLE_KEY = "sk.boundsTable"  # key in font.tempData, shared by Highest & Lowest Glyphs and Vertical Metrics
+TABLE_VERSION = 3
+COMPONENT_BOUNDS_KEY = "sk.componentBounds"  # key in font.tempData
+COMPONENT_BOUNDS_VERSION = 2
+
+NAN = float("nan")
+
+
+def rect_to_bounds(rect):
+    return (rect.origin.x, rect.origin.y,
+            rect.origin.x + rect.size.width, rect.origin.y + rect.size.height)
+
+
+def transform_bounds(bounds, transform):
+    """Bounds of the transformed box (exact for shifts and scales, a tight superset for rotations)."""
+    a, b, c, d, tx, ty = transform
+    xMin, yMin, xMax, yMax = bounds
+    corners = [(a * x + c * y + tx, b * x + d * y + ty) for x in (xMin, xMax) for y in (yMin, yMax)]
+    xs = [x for x, _ in corners]
+    ys = [y for _, y in corners]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def paths_bounds(layer):
+    """Bounds of the layer's own paths as Glyphs reports them, or None."""
+    bounds = None
+    for path in layer.paths:
+        bounds = union_bounds(bounds, rect_to_bounds(path.bounds))
+    return bounds
+
+
+class GlyphBounds(object):
+    """
+    Memoized outline bounds per (glyph name, master id).
+
+    Composite bounds are the cached bounds of their components moved through
+    component.transform, resolved recursively for nested components. An entry
+    is valid while the glyph's stamp is unchanged; the stamp combines the
+    glyph's own lastChange with the stamps of its component glyphs, so editing
+    a base glyph invalidates every composite built on it.
+
+    measure(layer) returns the bounds of a layer's own paths (paths_bounds by
+    default). A check that measures differently passes its own function and
+    its own key, so the two caches never mix. deps seeds the component names
+    per glyph, e.g. from a result store; the ones read in this run are also
+    collected in newDeps.
+    """
+
+    def __init__(self, font, deps=None, measure=paths_bounds, key=COMPONENT_BOUNDS_KEY):
+        self.font = font
+        self.measure = measure
+        self.key = key
+        self.entries = {}   # (name, masterId) → (stamp, bounds or None)
+        self.deps = dict(deps or {})  # name → (lastChange, sorted component glyph names)
+        self.newDeps = {}   # deps read in this run
+        self.stamps = {}    # name → stamp, valid for this run only
+        try:
+            stored = font.tempData[key]
+            if stored is not None and stored.get("version") == COMPONENT_BOUNDS_VERSION:
+                self.entries = stored["entries"]
+                self.deps = stored["deps"]
+        except Exception:
+            pass
+
+    def save(self):
+        try:
+            self.font.tempData[self.key] = {
+                "version": COMPONENT_BOUNDS_VERSION,
+                "entries": self.entries,
+                "deps": self.deps,
+            }
+        except Exception:
+            pass
+
+    def stamp(self, name):
+        """Return the effective change stamp of a glyph and, recursively, of its components."""
+        if name in self.stamps:
+            return self.stamps[name]
+        self.stamps[name] = None  # guards against component cycles
+
+        glyph = self.font.glyphs[name]
+        if glyph is None:
+            return None
+        lastChange = str(glyph.lastChange)
+        known = self.deps.get(name)
+        if known is None or known[0] != lastChange:
+            names = set()
+            for layer in glyph.layers:
+                for component in layer.components:
+                    names.add(component.componentName)
+            known = (lastChange, sorted(names))
+            self.deps[name] = known
+            self.newDeps[name] = known
+
+        stamp = (lastChange, tuple(self.stamp(dep) for dep in known[1]))
+        self.stamps[name] = stamp
+        return stamp
+
+    def bounds(self, name, masterId):
+        """Return (xMin, yMin, xMax, yMax) of a glyph's master layer, or None if it is empty."""
+        stamp = self.stamp(name)
+        key = (name, masterId)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        # cache the placeholder first so component cycles end here
+        self.entries[key] = (stamp, None)
+        bounds = None
+        glyph = self.font.glyphs[name]
+        layer = glyph.layers[masterId] if glyph is not None else None
+        if layer:
+            bounds = self.measure(layer)
+            for component in layer.components:
+                componentBounds = self.bounds(component.componentName, masterId)
+                if componentBounds is not None:
+                    bounds = union_bounds(bounds, transform_bounds(componentBounds, tuple(component.transform)))
+        self.entries[key] = (stamp, bounds)
+        return bounds
+
+
+class BoundsTable(object):
+    """
+    Top/bottom of the outline bounds per glyph and master, stored row-major in
+    two flat arrays (glyph × master), plus each glyph's export flag, category
+    and script. Rows are rescanned only when a glyph's stamp moves (see GlyphBounds).
+    """
+
+    def __init__(self, masterIds):
+        self.masterIds = list(masterIds)
+        self.names = []
+        self.index = {}
+        self.stamps = []
+        self.info = []  # (export, category, script) per glyph
+        self.top = array("d")
+        self.bottom = array("d")
+
+    def update(self, font, glyphBounds):
+        """Bring the table in sync with font. Returns the number of rescanned glyphs."""
+        masterIds = [m.id for m in font.masters]
+        if masterIds != self.masterIds:
+            self.__init__(masterIds)
+
+        glyphs = list(font.glyphs)
+        names = [g.name for g in glyphs]
+        masterCount = len(self.masterIds)
+
+        if names != self.names:
+            # glyphs were added, removed, renamed or reordered: keep the rows we still have
+            top = array("d", [NAN]) * (len(names) * masterCount)
+            bottom = array("d", [NAN]) * (len(names) * masterCount)
+            stamps = [False] * len(names)  # False never equals a real lastChange
+            info = [None] * len(names)
+            for i, name in enumerate(names):
+                old = self.index.get(name)
+                if old is None:
+                    continue
+                top[i * masterCount:(i + 1) * masterCount] = self.top[old * masterCount:(old + 1) * masterCount]
+                bottom[i * masterCount:(i + 1) * masterCount] = self.bottom[old * masterCount:(old + 1) * masterCount]
+                stamps[i] = self.stamps[old]
+                info[i] = self.info[old]
+            self.names = names
+            self.index = {name: i for i, name in enumerate(names)}
+            self.stamps = stamps
+            self.info = info
+            self.top = top
+            self.bottom = bottom
+
+        rescanned = 0
+        for i, g in enumerate(glyphs):
+            stamp = glyphBounds.stamp(g.name)
+            if self.stamps[i] is not False and stamp == self.stamps[i]:
+                continue
+            for k, masterId in enumerate(self.masterIds):
+                bounds = glyphBounds.bounds(g.name, masterId)
+                self.top[i * masterCount + k] = bounds[3] if bounds else NAN
+                self.bottom[i * masterCount + k] = bounds[1] if bounds else NAN
+            self.info[i] = (bool(g.export), g.category or "Other", g.script or "none")
+            self.stamps[i] = stamp
+            rescanned += 1
+        return rescanned
+
+
+def bounds_table(font):
+    """
+    Return the font's session bounds table, updated for the current glyphs.
+    The table is stored as a plain dict of its attributes, so it survives the
+    class being redefined when the module is reloaded.
+    """
+    table = BoundsTable([m.id for m in font.masters])
+    try:
+        stored = font.tempData[TABLE_KEY]
+        if stored is not None and stored.get("version") == TABLE_VERSION:
+            table.__dict__.update(dict(stored))
+    except Exception:
+        pass
+
+    glyphBounds = GlyphBounds(font)
+    rescanned = table.update(font, glyphBounds)
+    glyphBounds.save()
+    try:
+        font.tempData[TABLE_KEY] = dict(vars(table), version=TABLE_VERSION)
+    except Exception:
+        pass
+    print(f"Bounds table: rescanned {rescanned} of {len(table.names)} glyphs.\n")
+    return table
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Layer contents shared by the Checks and Open Glyphs scripts for the session.
+
+read_layer_data() copies a layer's nodes, open paths and components (with
+their automatic alignment) out of Glyphs once; LayerData keeps those copies in font.tempData, so a layer one
+script has read is not read through the bridge again by the next one while
+its glyph is unchanged.
+
+Scripts that only need a cheap look at a layer (is it empty, does it have
+paths) use LayerData.cached() and fall back to their own check, instead of
+reading every node of every layer.
+"""
+
+LAYER_DATA_KEY = "sk.layerData"  # key in font.tempData, shared by the Checks and Open Glyphs scripts
+LAYER_DATA_VERSION = 3
+LAYER_DATA_LIMIT = 50000         # layers kept for the session, least recently used are dropped first
+
+
+def alignment_reader(component):
+    """
+    Probe once which property this Glyphs version uses and return a function
+    component → True if automatic alignment is disabled, or None if neither exists.
+    """
+    # Newer/common property: automaticAlignment (True == enabled)
+    try:
+        component.automaticAlignment
+        return lambda c: not c.automaticAlignment
+    except Exception:
+        pass
+    # Older/alternate property: disableAutomaticAlignment (True == disabled)
+    try:
+        component.disableAutomaticAlignment
+        return lambda c: bool(c.disableAutomaticAlignment)
+    except Exception:
+        pass
+    return None
+
+
+_is_unaligned = None  # set by alignment_reader() from the first component read
+
+
+def read_layer_data(layer):
+    """
+    Return (paths, components, openPaths, unaligned): (x, y, type) per node
+    of every path, (name, transform) per component, the indexes of open paths
+    and the indexes of components with automatic alignment disabled.
+    """
+    global _is_unaligned
+    paths = []
+    openPaths = []
+    for index, path in enumerate(layer.paths):
+        nodes = []
+        for n in path.nodes:
+            pos = n.position
+            nodes.append((pos.x, pos.y, n.type))
+        paths.append(tuple(nodes))
+        if not path.closed:
+            openPaths.append(index)
+    comps = layer.components
+    components = tuple((c.componentName, tuple(c.transform)) for c in comps)
+    unaligned = ()
+    if comps:
+        if _is_unaligned is None:
+            _is_unaligned = alignment_reader(comps[0]) or (lambda c: False)
+        unaligned = tuple(index for index, c in enumerate(comps) if _is_unaligned(c))
+    return tuple(paths), components, tuple(openPaths), unaligned
+
+
+class LayerData(object):
+    """
+    Layer data read through the bridge once per session and shared by every
+    script that uses LAYER_DATA_KEY. Entries are keyed on (glyph name, layer
+    id) and valid while the glyph's lastChange is unchanged. The table is a
+    plain dict in font.tempData, kept in least-recently-used order and cut to
+    LAYER_DATA_LIMIT layers.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.entries = {}  # (glyph name, layerId) → (lastChange, (paths, components, openPaths, unaligned)), oldest first
+        self.hits = 0      # session totals
+        self.misses = 0
+        self.runHits = 0
+        self.runMisses = 0
+        try:
+            stored = font.tempData[LAYER_DATA_KEY]
+            if stored is not None and stored.get("version") == LAYER_DATA_VERSION:
+                self.entries = stored["entries"]
+                self.hits = stored["hits"]
+                self.misses = stored["misses"]
+        except Exception:
+            pass
+
+    def get(self, glyph, layer, lastChange=None):
+        """Return (paths, components, openPaths, unaligned) of layer, from the table while glyph's lastChange matches."""
+        if lastChange is None:
+            lastChange = str(glyph.lastChange)
+        key = (glyph.name, layer.layerId)
+        entry = self.entries.pop(key, None)
+        if entry is not None and entry[0] == lastChange:
+            self.runHits += 1
+        else:
+            entry = (lastChange, read_layer_data(layer))
+            self.runMisses += 1
+            if len(self.entries) >= LAYER_DATA_LIMIT:
+                del self.entries[next(iter(self.entries))]
+        self.entries[key] = entry  # most recently used last
+        return entry[1]
+
+    def cached(self, glyph, layer, lastChange=None):
+        """Return the stored data of layer if it is still valid, else None. Never reads the layer."""
+        entry = self.entries.get((glyph.name, layer.layerId))
+        if entry is None:
+            return None
+        if lastChange is None:
+            lastChange = str(glyph.lastChange)
+        if entry[0] != lastChange:
+            return None
+        self.runHits += 1
+        return entry[1]
+
+    def save(self):
+        try:
+            self.font.tempData[LAYER_DATA_KEY] = {
+                "version": LAYER_DATA_VERSION,
+                "entries": self.entries,
+                "hits": self.hits + self.runHits,
+                "misses": self.misses + self.runMisses,
+            }
+        except Exception:
+            pass
+
+    def summary(self):
+        total = self.hits + self.runHits + self.misses + self.runMisses
+        rate = (self.hits + self.runHits) / total * 100 if total else 0
+        return (f"Layer data: {self.runHits} layers reused, {self.runMisses} read "
+                f"({len(self.entries)} cached, {rate:.0f}% reused this session).")
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Phase timing for the scripts with long runs (Transfer Components, Rename
+Glyphs, Word Generator). Off unless Glyphs.defaults[PROFILE_KEY] is set, so
+normal runs only pay for one shared no-op context manager per phase.
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import time
+
+from GlyphsApp import Glyphs
+
+PROFILE_KEY = "sk.profilePhases"    # Glyphs.defaults: 1 = time phases, 2 = also collect cProfile stats
+PROFILE_FILE_KEY = "sk.profileFile"  # Glyphs.defaults: append reports to this file instead of the Macro panel
+PROFILE_TOP = 25                     # functions listed from the cProfile stats
+
+
+class PhaseTimer(object):
+    """
+    Times named phases of a run when Glyphs.defaults[PROFILE_KEY] is set:
+
+        TIMER.start()
+        with TIMER.phase("selection"):
+            ...
+        TIMER.report()
+
+    The key is read at start(), so it can be switched from the Macro panel
+    while the window is open. When it is off, phase() returns one shared
+    no-op context manager and report() returns at once.
+    """
+
+    def __init__(self, title):
+        self.title = title
+        self.enabled = False
+        self.profiler = None
+
+    def start(self):
+        if self.profiler is not None:
+            self.profiler.disable()  # left over from a run that did not report
+        try:
+            level = int(Glyphs.defaults[PROFILE_KEY] or 0)
+        except Exception:
+            level = 0
+        self.enabled = level > 0
+        if not self.enabled:
+            return
+        self.totals = {}  # phase → [calls, seconds], in first-use order
+        self.began = time.perf_counter()
+        self.profiler = None
+        if level > 1:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NO_PHASE
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.totals.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += time.perf_counter() - began
+
+    def report(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        elapsed = time.perf_counter() - self.began
+        if self.profiler is not None:
+            self.profiler.disable()
+        out = io.StringIO()
+        out.write(f"### {self.title}: phase timings ({time.strftime('%Y-%m-%d %H:%M:%S')}) ###\n")
+        out.write(f"{'phase':24} {'calls':>8} {'seconds':>10} {'share':>7}\n")
+        for name, (calls, seconds) in self.totals.items():
+            share = seconds / elapsed * 100 if elapsed else 0
+            out.write(f"{name[:24]:24} {calls:>8} {seconds:>10.4f} {share:>6.1f}%\n")
+        out.write(f"{'run':24} {'':>8} {elapsed:>10.4f}   (nested phases count in their parents too)\n")
+        if self.profiler is not None:
+            out.write("\n")
+            pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            self.profiler = None
+        try:
+            path = Glyphs.defaults[PROFILE_FILE_KEY]
+        except Exception:
+            path = None
+        if path:
+            with open(os.path.expanduser(str(path)), "a", encoding="utf-8") as f:
+                f.write(out.getvalue() + "\n")
+            print(f"{self.title}: phase timings written to {path}")
+        else:
+            print(out.getvalue())
+
+
+_NO_PHASE = contextlib.nullcontext()
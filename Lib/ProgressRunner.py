@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Progress window with ETA and Cancel for the scripts with long runs (Close
+Nodes). Inside Glyphs the work runs in chunks, on a worker thread or in short
+main-thread slices; headless runs, without vanilla, run it to the end.
+"""
+
+import threading
+import time
+import traceback
+
+try:
+    import vanilla
+    from PyObjCTools.AppHelper import callAfter, callLater
+except ImportError:
+    vanilla = callAfter = callLater = None
+
+
+class ProgressRunner(object):
+    """
+    Runs a job in chunks behind a progress window with ETA and Cancel.
+
+    A job is a list of phases (label, background, start). start() returns a
+    generator that yields (done, total, found) after every chunk: the units
+    done and to do in this phase, and a list of results found in that chunk.
+    Phases with background=True run on a worker thread and must not touch the
+    font. The others run on the main thread in slices of SLICE seconds, with
+    events handled in between, so they may read and edit the font.
+
+    onFound(found) is called with every batch of results, and finish(cancelled)
+    once at the end, both on the main thread. Cancel stops after the current
+    chunk; finish then gets what was found so far. Without AppKit (headless
+    runs) the phases simply run to the end.
+    """
+
+    SLICE = 0.05      # seconds of main-thread work per slice
+    UPDATE = 0.1      # seconds between window updates from the worker
+    SHOW_AFTER = 0.5  # seconds before the window appears, so quick jobs do not flash it
+
+    def __init__(self, title, unit="items"):
+        self.title = title
+        self.unit = unit
+        self.cancelled = False
+        self.w = None
+        self.shown = False
+
+    def run(self, phases, onFound, finish):
+        self.phases = list(phases)
+        self.onFound = onFound
+        self.finish = finish
+        self.found = 0
+        if callAfter is None or vanilla is None:
+            for label, background, start in self.phases:
+                for done, total, found in start():
+                    if found:
+                        self.onFound(found)
+            self.finish(False)
+            return
+        self.w = vanilla.FloatingWindow((400, 100), self.title)
+        self.w.phase = vanilla.TextBox((15, 12, -15, 17), "", sizeStyle="small")
+        self.w.bar = vanilla.ProgressBar((15, 34, -15, 16))
+        self.w.status = vanilla.TextBox((15, 64, -110, 17), "", sizeStyle="small")
+        self.w.cancel = vanilla.Button((-100, 60, -15, 24), "Cancel", callback=self.cancel)
+        self.w.bind("close", self.cancel)
+        self.started = time.time()
+        self._next_phase()
+
+    def cancel(self, sender=None):
+        self.cancelled = True
+
+    def _next_phase(self):
+        if self.cancelled or not self.phases:
+            self._end()
+            return
+        label, background, start = self.phases.pop(0)
+        self.w.phase.set(label)
+        self.began = time.time()
+        self.job = start()
+        if background:
+            threading.Thread(target=self._work, name=self.title, daemon=True).start()
+        else:
+            callLater(0, self._slice)
+
+    def _work(self):
+        pending = []
+        last = 0
+        done = total = 0
+        try:
+            for done, total, found in self.job:
+                pending.extend(found)
+                if self.cancelled:
+                    break
+                if time.time() - last >= self.UPDATE:
+                    callAfter(self._update, done, total, pending)
+                    pending = []
+                    last = time.time()
+        except Exception:
+            callAfter(print, f"{self.title} failed:\n" + traceback.format_exc())
+            self.cancelled = True
+        callAfter(self._update, done, total, pending)
+        callAfter(self._next_phase)
+
+    def _slice(self):
+        pending = []
+        done = total = None
+        deadline = time.time() + self.SLICE
+        try:
+            while time.time() < deadline and not self.cancelled:
+                done, total, found = next(self.job)
+                pending.extend(found)
+        except StopIteration:
+            self._update(None, None, pending)
+            self._next_phase()
+            return
+        except Exception:
+            print(f"{self.title} failed:\n" + traceback.format_exc())
+            self.cancelled = True
+        self._update(done, total, pending)
+        if self.cancelled:
+            self._next_phase()
+        else:
+            callLater(0, self._slice)
+
+    def _update(self, done, total, found):
+        if found:
+            self.found += len(found)
+            self.onFound(found)
+        if done is None or self.w is None:
+            return
+        if not self.shown and time.time() - self.started > self.SHOW_AFTER:
+            self.w.open()
+            self.shown = True
+        self.w.bar.set(100.0 * done / total if total else 100)
+        status = f"{done:,} of {total:,} {self.unit}, {self.found:,} found"
+        elapsed = time.time() - self.began
+        if done and done < total and elapsed > 1:
+            status += f", about {elapsed / done * (total - done):.0f} s left"
+        self.w.status.set(status)
+
+    def _end(self):
+        if self.shown:
+            self.w.unbind("close", self.cancel)
+            self.w.close()
+        self.w = None
+        self.finish(self.cancelled)
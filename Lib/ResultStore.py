@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+__doc__ = """
+Check results kept between sessions in a SQLite file next to the font
+(<font>.checks.sqlite), used by Close Nodes and the ascender/descender check.
+
+Rows are keyed on (check, glyph, master) and carry the glyph stamp and a hash
+of the layer contents they were computed from, so a layer whose glyph changed
+but whose outlines did not is taken from the store without being checked
+again.
+
+Headless/BatchCheck.py sets ENABLED to False: its shards run in parallel on
+parts of one font and would all write the same file.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+STORE_SUFFIX = ".checks.sqlite"  # result store next to the font file
+ENABLED = True                   # False turns every store into a no-op
+
+
+def store_path(font):
+    """Sidecar SQLite file next to the font file, or None for unsaved fonts."""
+    path = getattr(font, "filepath", None)
+    if not path:
+        return None
+    return os.path.splitext(str(path).rstrip("/"))[0] + STORE_SUFFIX
+
+
+def layer_hash(data, extra=""):
+    """Hash of a layer's outline content (its layer data): nodes, component names and transforms, plus extra."""
+    paths, components = data[:2]
+    digest = hashlib.sha1(extra.encode("utf-8"))
+    for nodes in paths:
+        digest.update(repr(list(nodes)).encode("utf-8"))
+    for component in components:
+        digest.update(repr(component).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultStore(object):
+    """
+    Check results per (check, glyph, master) in a SQLite sidecar next to the
+    font file, together with the glyph stamp and layer hash they were computed
+    from. Also keeps every glyph's component names per lastChange, so stamps
+    can be rebuilt in a new session without reading the layers again.
+    Unsaved fonts, enabled=False, or a store that cannot be opened, make every
+    method a no-op.
+    """
+
+    def __init__(self, font, check, variant="", enabled=True):
+        self.font = font
+        self.check = check
+        self.variant = variant  # settings the results depend on
+        self.db = None
+        path = store_path(font) if enabled and ENABLED else None
+        if path is None:
+            return
+        try:
+            db = sqlite3.connect(path)
+            db.executescript(
+                "CREATE TABLE IF NOT EXISTS results (check_name TEXT, glyph TEXT, master TEXT, variant TEXT,"
+                " stamp TEXT, hash TEXT, result TEXT, PRIMARY KEY (check_name, glyph, master));"
+                "CREATE TABLE IF NOT EXISTS deps (glyph TEXT PRIMARY KEY, lastChange TEXT, components TEXT);"
+            )
+            self.db = db
+        except Exception as e:
+            print(f"Result store unavailable ({e}), not caching between sessions.\n")
+
+    def load(self):
+        """Return {(glyph, masterId): (stamp, hash, result)} for this check and variant."""
+        if self.db is None:
+            return {}
+        try:
+            rows = self.db.execute(
+                "SELECT glyph, master, stamp, hash, result FROM results WHERE check_name = ? AND variant = ?",
+                (self.check, self.variant),
+            )
+            return {(g, m): (stamp, h, json.loads(result)) for g, m, stamp, h, result in rows}
+        except Exception:
+            return {}
+
+    def gone(self, known, checked, masterIds):
+        """
+        Return the keys of known whose glyph is no longer in the font or whose
+        master is gone. checked holds the names of the glyphs this run went
+        through; only the others are looked up, by name, so a run over part of
+        the font keeps the rows of the rest.
+        """
+        missing = {}
+        for name, masterId in known:
+            if name not in checked and name not in missing:
+                missing[name] = self.font.glyphs[name] is None
+        return [key for key in known if missing.get(key[0]) or key[1] not in masterIds]
+
+    def save(self, rows, drop=()):
+        """Store [(glyph, masterId, stamp, hash, result)] and delete the (glyph, masterId) keys in drop."""
+        if self.db is None or not (rows or drop):
+            return
+        try:
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(self.check, g, m, self.variant, stamp, h, json.dumps(result)) for g, m, stamp, h, result in rows],
+                )
+                self.db.executemany(
+                    "DELETE FROM results WHERE check_name = ? AND glyph = ? AND master = ?",
+                    [(self.check, g, m) for g, m in drop],
+                )
+        except Exception as e:
+            print(f"Could not update the result store: {e}\n")
+
+    def load_deps(self):
+        """Return {glyph: (lastChange, [component glyph names])}."""
+        if self.db is None:
+            return {}
+        try:
+            return {g: (lastChange, json.loads(names)) for g, lastChange, names in self.db.execute("SELECT * FROM deps")}
+        except Exception:
+            return {}
+
+    def save_deps(self, deps):
+        if self.db is None or not deps:
+            return
+        try:
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO deps VALUES (?, ?, ?)",
+                    [(g, lastChange, json.dumps(names)) for g, (lastChange, names) in deps.items()],
+                )
+        except Exception:
+            pass
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
@@ -1,11 +1,16 @@
 # MenuTitle: Open All Permutations
 # -*- coding: utf-8 -*-
+__doc__ = """
+Opens a new tab with every ordered pair of the selected glyphs.
+Large sets are split over several tabs of at most PAIRS_PER_TAB pairs, so no
+single tab gets too long to lay out.
+"""
 
 from GlyphsApp import Glyphs
-from itertools import product
 from AppKit import NSAlert, NSAlertFirstButtonReturn
 
 PAIR_WARNING_THRESHOLD = 3000
+PAIRS_PER_TAB = 3000  # longer sets are split over several tabs, whole rows per tab
 
 
 def main():
@@ -24,6 +29,8 @@ def main():
 
     n = len(glyphNames)
     pairCount = n * n
+    rowsPerTab = max(1, PAIRS_PER_TAB // n)
+    tabCount = -(-n // rowsPerTab)
 
     # warn user if the result will be large
     if pairCount > PAIR_WARNING_THRESHOLD:
@@ -31,7 +38,7 @@ def main():
         alert.setMessageText_("Large Permutation Set")
         alert.setInformativeText_(
             f"You are about to generate {pairCount} glyph pairs "
-            f"from {n} unique glyphs.\n\n"
+            f"from {n} unique glyphs, in {tabCount} tabs.\n\n"
             "This may take some time or make Glyphs unresponsive.\n\n"
             "Do you want to continue?"
         )
@@ -44,14 +51,14 @@ def main():
             print("Operation cancelled.")
             return
 
-    # generate permutations efficiently
-    tabText = " ".join(
-        f"/{left}/{right}" for left, right in product(glyphNames, glyphNames)
-    )
-
-    font.newTab(tabText)
+    # one row of pairs per left glyph, whole rows per tab
+    for start in range(0, n, rowsPerTab):
+        tabText = " ".join(
+            f"/{left}/{right}" for left in glyphNames[start:start + rowsPerTab] for right in glyphNames
+        )
+        font.newTab(tabText)
 
-    print(f"Opened tab with {pairCount} pairs from {n} glyphs.")
+    print(f"Opened {tabCount} tab{'s' if tabCount > 1 else ''} with {pairCount} pairs from {n} glyphs.")
 
 
-main()
\ No newline at end of file
+main()
@@ -0,0 +1,106 @@
+# MenuTitle: Open Glyphs by Several Criteria
+# -*- coding: utf-8 -*-
+__doc__ = """
+Runs several of the Open Glyphs finders in one pass over the font and opens
+one tab per finder:
+
+• empty        – exporting glyphs with no paths or components in the current master (Open Empty Glyphs)
+• paths        – glyphs with at least one path in any master (Open Unique Glyphs)
+• color        – glyphs with one of COLOR_LABELS (Open by Color Label)
+• incompatible – glyphs whose masters are not compatible (Open Incompatible Glyphs)
+• autoAlign    – glyphs with a component whose automatic alignment is disabled (Open Glyphs without Auto-Alignment)
+
+Each glyph and each master layer is read once for all finders. Layer contents
+come from the session's shared layer data (font.tempData), so layers another
+script has already read are not read again.
+"""
+
+import GlyphsApp
+from GlyphsApp import Glyphs
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from LayerData import LayerData
+
+# ---------- CONFIGURATION ----------
+FINDERS = ("empty", "paths", "color", "incompatible", "autoAlign")  # tabs to open, in this order
+COLOR_LABELS = ()  # color label indexes for "color" (0 = red … 11 = charcoal); empty = any label
+INTENTIONALLY_EMPTY = {
+    "space", "nbspace", "nonbreakingspace", "zerowidthspace", "zwsp",
+    "tab", "cr", "nl", "paragraph", "newline", "softhyphen",
+}
+# -----------------------------------
+
+TITLES = {
+    "empty": "empty in the current master",
+    "paths": "with paths",
+    "color": "with the color labels",
+    "incompatible": "incompatible across masters",
+    "autoAlign": "with components without auto-alignment",
+}
+LAYER_FINDERS = {"empty", "paths", "autoAlign"}  # finders that look at master layers
+
+
+def scan(font, finders):
+    """Return {finder: [glyph names]} for the given finders, in one pass over the glyphs."""
+    found = {key: [] for key in finders}
+    masterIds = [m.id for m in font.masters]
+    currentId = font.selectedFontMaster.id
+    colors = set(COLOR_LABELS)
+    readLayers = bool(LAYER_FINDERS & set(finders))
+    layerData = LayerData(font)
+
+    for glyph in font.glyphs:
+        name = glyph.name
+        if "color" in found:
+            color = glyph.color  # custom RGBA colors are not labels and are skipped
+            if isinstance(color, int) and (color in colors if colors else 0 <= color < 12):
+                found["color"].append(name)
+        if "incompatible" in found and not glyph.mastersCompatible:
+            found["incompatible"].append(name)
+        if not readLayers:
+            continue
+
+        lastChange = str(glyph.lastChange)
+        checkEmpty = "empty" in found and name not in INTENTIONALLY_EMPTY and glyph.export
+        hasPaths = "paths" not in found
+        unaligned = "autoAlign" not in found
+        for masterId in masterIds:
+            layer = glyph.layers[masterId]
+            if not layer:
+                continue
+            paths, components, _, unalignedComponents = layerData.get(glyph, layer, lastChange)
+            if checkEmpty and masterId == currentId and not paths and not components:
+                found["empty"].append(name)
+            if not hasPaths and paths:
+                hasPaths = True
+                found["paths"].append(name)
+            if not unaligned and unalignedComponents:
+                unaligned = True
+                found["autoAlign"].append(name)
+
+    layerData.save()
+    print(layerData.summary() + "\n")
+    return found
+
+
+font = Glyphs.font
+if not font:
+    print("No font open.")
+else:
+    finders = [key for key in FINDERS if key in TITLES]
+    unknown = [key for key in FINDERS if key not in TITLES]
+    if unknown:
+        print(f"Ignoring unknown finders: {', '.join(unknown)}\n")
+
+    found = scan(font, finders)
+    for key in finders:
+        names = found[key]
+        if names:
+            font.newTab("/" + "/".join(names))
+            print(f"• {len(names)} glyphs {TITLES[key]}: opened in a new tab.")
+        else:
+            print(f"• No glyphs {TITLES[key]}.")
@@ -1,100 +1,84 @@
 #MenuTitle: Open Glyphs without Auto-Alignment
 # Open glyph-edit tabs for glyphs that contain components with automatic alignment disabled
 # Paste into Glyphs.app Macro Panel and Run.
+#
+# Prints every component with automatic alignment disabled, per glyph and
+# master layer (and brace/bracket layer with INCLUDE_SPECIAL_LAYERS).
+# Components and their alignment come from the session's shared layer data
+# (font.tempData), so layers another script has already read are not read again.
 
 from GlyphsApp import *
+import os
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from LayerData import LayerData
+
+# ---------- CONFIGURATION ----------
+INCLUDE_SPECIAL_LAYERS = False  # also audit brace and bracket layers
+GROUP = 20                      # glyphs per tab
+# -----------------------------------
+
 font = Glyphs.font
 if not font:
     raise Exception("Open a font first.")
 
-def layer_is_for_master(layer, master):
-    """Return True if layer corresponds to the given master (robust across Glyphs versions)."""
-    # direct associatedMasterId (recommended API)
-    if getattr(layer, "associatedMasterId", None) == master.id:
-        return True
-    # some proxies expose .master
-    master_obj = getattr(layer, "master", None)
-    if master_obj is not None and getattr(master_obj, "id", None) == master.id:
-        return True
-    # fallback: some layers expose .layerId equal to the master id in some contexts
-    if getattr(layer, "layerId", None) == master.id:
-        return True
-    return False
+def is_special_layer(layer):
+    """True for brace ({…}) and bracket ([…]) layers."""
+    special = getattr(layer, "isSpecialLayer", None)
+    if special is not None:
+        return bool(special)
+    name = layer.name or ""
+    return "{" in name or "[" in name
 
-def master_layer_for_glyph(glyph, master):
-    """Return the layer of 'glyph' that corresponds to 'master', or None if not present."""
-    # iterate all layers (Glyphs uses a layer proxy)
-    for layer in glyph.layers:
-        if layer_is_for_master(layer, master):
-            return layer
-    return None
+def audited_layers(glyph, masters):
+    """Yield (label, layer): the master layers, then the brace/bracket layers with INCLUDE_SPECIAL_LAYERS."""
+    for master in masters:
+        layer = glyph.layers[master.id]
+        if layer is not None:
+            yield master.name, layer
+    if INCLUDE_SPECIAL_LAYERS:
+        masterNames = {master.id: master.name for master in masters}
+        for layer in glyph.layers:
+            if layer.layerId != layer.associatedMasterId and is_special_layer(layer):
+                yield "%s (%s)" % (layer.name, masterNames.get(layer.associatedMasterId, "?")), layer
 
-def component_has_auto_alignment_disabled(component):
-    """
-    Return True if this component definitively has automatic alignment disabled.
-    Handles different property names and API versions defensively.
-    """
-    # Newer/common property: automaticAlignment (True == enabled)
-    if hasattr(component, "automaticAlignment"):
-        try:
-            return not bool(getattr(component, "automaticAlignment"))
-        except Exception:
-            pass
-    # Older/alternate property: disableAutomaticAlignment (True == disabled)
-    if hasattr(component, "disableAutomaticAlignment"):
-        try:
-            return bool(getattr(component, "disableAutomaticAlignment"))
-        except Exception:
-            pass
-    # Could not determine -> treat as enabled (not disabled)
-    return False
+masters = list(font.masters)
+layerData = LayerData(font)
+report = []  # (glyph name, [(layer label, [(component index, component name)])])
 
-disabled_glyphs = []
-
-# iterate every glyph and check every master-layer (active layers only)
 for glyph in font.glyphs:
-    glyph_marked = False
-    for master in font.masters:
-        layer = master_layer_for_glyph(glyph, master)
-        if not layer:
-            # glyph has no active layer for this master (skip)
-            continue
-
-        comps = getattr(layer, "components", None)
-        if not comps:
-            continue
+    glyph_hits = []
+    lastChange = str(glyph.lastChange)
+    for label, layer in audited_layers(glyph, masters):
+        _, components, _, unaligned = layerData.get(glyph, layer, lastChange)
+        if unaligned:
+            glyph_hits.append((label, [(index, components[index][0]) for index in unaligned]))
+    if glyph_hits:
+        report.append((glyph.name, glyph_hits))
+layerData.save()
+print(layerData.summary())
 
-        # if any component in this master-layer has auto alignment disabled -> mark glyph
-        for comp in comps:
-            if component_has_auto_alignment_disabled(comp):
-                disabled_glyphs.append(glyph)
-                glyph_marked = True
-                break
-
-        if glyph_marked:
-            break  # no need to check other masters for this glyph
-
-# dedupe while preserving order
-seen = set()
-unique_glyphs = []
-for g in disabled_glyphs:
-    if g.name not in seen:
-        unique_glyphs.append(g)
-        seen.add(g.name)
-
-if not unique_glyphs:
+if not report:
     Glyphs.showNotification("No glyphs found", "No components with automatic alignment disabled were found in active master layers.")
     print("No glyphs with disabled component auto-alignment were found in active master layers.")
 else:
+    names = [name for name, _ in report]
+
     # open glyph-edit tabs, grouping up to GROUP glyphs per tab
-    GROUP = 20
-    chunks = [unique_glyphs[i:i+GROUP] for i in range(0, len(unique_glyphs), GROUP)]
+    chunks = [names[i:i+GROUP] for i in range(0, len(names), GROUP)]
     for chunk in chunks:
         # Always open in glyph-edit mode (prefix with slash).
         # Use a single space as separator to avoid joining glyphs.
-        tab_string = " ".join("/" + g.name for g in chunk)
+        tab_string = " ".join("/" + name for name in chunk)
         font.newTab(tab_string)
 
-    Glyphs.showNotification("Opened glyphs", "%d glyph(s) opened in %d tab(s)." % (len(unique_glyphs), len(chunks)))
-    print("Opened %d glyph(s):" % len(unique_glyphs))
-    print(", ".join(g.name for g in unique_glyphs))
+    Glyphs.showNotification("Opened glyphs", "%d glyph(s) opened in %d tab(s)." % (len(names), len(chunks)))
+    componentCount = sum(len(hits) for _, glyph_hits in report for _, hits in glyph_hits)
+    print("Opened %d glyph(s) with %d component(s) without automatic alignment:" % (len(names), componentCount))
+    for name, glyph_hits in report:
+        print("• %s" % name)
+        for label, hits in glyph_hits:
+            print("    %s: %s" % (label, ", ".join("#%d %s" % (index, compName) for index, compName in hits)))
@@ -1,16 +1,193 @@
 # MenuTitle: Open Incompatible Glyphs
 # -*- coding: utf-8 -*-
+__doc__ = """
+Opens a new tab with all glyphs whose master layers are not compatible, and
+prints which masters differ and where: the first path, node, component or
+anchor that does not match.
+
+Glyphs decides which glyphs are incompatible (glyph.mastersCompatible). Only
+those are read to explain why: every master layer gets a structural
+fingerprint (node types per path, open or closed, component names in order and
+anchor names), masters that share the most common fingerprint are the
+reference, and the others are compared with it. The verdict and fingerprints
+are kept in font.tempData per glyph and lastChange, so checking again after an
+edit only asks Glyphs about, and reads, the glyphs that changed.
+
+Headless/BatchCheck.py runs this script unchanged and adds DETAILS (glyph →
+per-master differences) to its report.
+"""
 
 import GlyphsApp
+from GlyphsApp import LINE, CURVE, OFFCURVE, QCURVE
+
+# -----------------------------
+# Fingerprints
+# -----------------------------
+FINGERPRINT_KEY = "sk.compatibility"  # key in font.tempData
+FINGERPRINT_VERSION = 2
+NODE_CODES = {LINE: "l", CURVE: "c", OFFCURVE: "o", QCURVE: "q"}
+NODE_NAMES = {code: str(t) for t, code in NODE_CODES.items()}
+
+
+def layer_structure(layer):
+    """Return (paths, components, anchors): node codes per path ("-" marks open paths), component names, anchor names."""
+    paths = []
+    for path in layer.paths:
+        codes = "".join(NODE_CODES.get(n.type) or str(n.type) for n in path.nodes)
+        paths.append(codes if path.closed else "-" + codes)
+    components = tuple(c.componentName for c in layer.components)
+    anchors = tuple(sorted(a.name for a in layer.anchors))
+    return tuple(paths), components, anchors
+
+
+def describe_difference(structure, reference, referenceName):
+    """The first place where structure differs from reference, in words."""
+    paths, components, anchors = structure
+    refPaths, refComponents, refAnchors = reference
+    if len(paths) != len(refPaths):
+        return f"{len(paths)} paths, {referenceName} has {len(refPaths)}"
+    for p, (codes, refCodes) in enumerate(zip(paths, refPaths)):
+        if codes == refCodes:
+            continue
+        if codes.startswith("-") != refCodes.startswith("-"):
+            return f"path {p} is {'open' if codes.startswith('-') else 'closed'}, {'closed' if codes.startswith('-') else 'open'} in {referenceName}"
+        codes, refCodes = codes.lstrip("-"), refCodes.lstrip("-")
+        if len(codes) != len(refCodes):
+            return f"path {p}: {len(codes)} nodes, {referenceName} has {len(refCodes)}"
+        n = next(i for i, (a, b) in enumerate(zip(codes, refCodes)) if a != b)
+        return f"path {p} node {n}: {NODE_NAMES.get(codes[n], codes[n])}, {NODE_NAMES.get(refCodes[n], refCodes[n])} in {referenceName}"
+    if components != refComponents:
+        if sorted(components) == sorted(refComponents):
+            return f"components in a different order ({', '.join(components)}; {referenceName}: {', '.join(refComponents)})"
+        return f"components {', '.join(components) or 'none'}, {referenceName} has {', '.join(refComponents) or 'none'}"
+    missing = [a for a in refAnchors if a not in anchors]
+    extra = [a for a in anchors if a not in refAnchors]
+    parts = []
+    if missing:
+        parts.append("missing " + ", ".join(missing))
+    if extra:
+        parts.append("extra " + ", ".join(extra))
+    return "anchors: " + "; ".join(parts)
+
+
+def diagnose(structures, masterNames):
+    """
+    structures: one layer structure (or None for a missing layer) per master.
+    Returns [(master name, difference)] for the masters that differ from the
+    most common structure, or () if all match.
+    """
+    groups = {}
+    for i, structure in enumerate(structures):
+        if structure is not None:
+            groups.setdefault(structure, []).append(i)
+    if len(groups) <= 1:
+        return ()
+    reference = max(groups.values(), key=len)[0]  # ties go to the first master
+    referenceName = masterNames[reference]
+    differences = []
+    for i, structure in enumerate(structures):
+        if structure is not None and structure != structures[reference]:
+            differences.append((masterNames[i], describe_difference(structure, structures[reference], referenceName)))
+    return tuple(differences)
+
+
+class FingerprintCache(object):
+    """
+    Per glyph: (lastChange, differences, fingerprints), kept as a plain dict in
+    font.tempData. differences is None for glyphs Glyphs reports as
+    compatible; their layers are not read and fingerprints is None. Otherwise
+    fingerprints are hashes of the master layer structures, in master order.
+    The table is dropped when the masters change.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.masters = list(font.masters)
+        self.masterIds = tuple(m.id for m in self.masters)
+        self.masterNames = [m.name for m in self.masters]
+        self.entries = {}
+        self.reused = 0
+        self.read = 0
+        try:
+            stored = font.tempData[FINGERPRINT_KEY]
+            if stored is not None and stored.get("version") == FINGERPRINT_VERSION and stored.get("masters") == self.masterIds:
+                self.entries = stored["entries"]
+        except Exception:
+            pass
+
+    def differences(self, glyph):
+        """None if Glyphs reports glyph's masters as compatible, else [(master name, difference)]."""
+        name = glyph.name
+        lastChange = str(glyph.lastChange)
+        entry = self.entries.get(name)
+        if entry is not None and entry[0] == lastChange:
+            self.reused += 1
+            return entry[1]
+        self.read += 1
+        if glyph.mastersCompatible:
+            self.entries[name] = (lastChange, None, None)
+            return None
+        structures = []
+        for masterId in self.masterIds:
+            layer = glyph.layers[masterId]
+            structures.append(layer_structure(layer) if layer is not None else None)
+        fingerprints = tuple(hash(s) if s is not None else None for s in structures)
+        if entry is not None and entry[1] is not None and entry[2] == fingerprints:
+            found = entry[1]  # changed, but not structurally
+        else:
+            # the fingerprints only explain the difference; Glyphs may see one they do not cover
+            found = diagnose(structures, self.masterNames) or (("all masters", "no difference in paths, components or anchors"),)
+        self.entries[name] = (lastChange, found, fingerprints)
+        return found
+
+    def save(self):
+        try:
+            self.font.tempData[FINGERPRINT_KEY] = {
+                "version": FINGERPRINT_VERSION,
+                "masters": self.masterIds,
+                "entries": self.entries,
+            }
+        except Exception:
+            pass
+
+    def summary(self):
+        return f"Compatibility: {self.reused} glyphs reused, {self.read} checked."
+
+
+def find_incompatible(font):
+    """
+    Return {glyph name: [(master name, difference)]} for every glyph whose
+    masters Glyphs reports as incompatible, in font order.
+    """
+    cache = FingerprintCache(font)
+    found = {}
+    for glyph in font.glyphs:
+        differences = cache.differences(glyph)
+        if differences is not None:
+            found[glyph.name] = differences
+    cache.save()
+    print(cache.summary())
+    return found
+
+
+# -----------------------------
+# Main
+# -----------------------------
+DETAILS = {}
 
 font = Glyphs.font
 if not font:
     Glyphs.showNotification("No Font Open", "Open a font first.")
 else:
-    incompatible = [g for g in font.glyphs if not g.mastersCompatible]
+    incompatible = find_incompatible(font)
+    DETAILS = {name: [list(d) for d in differences] for name, differences in incompatible.items()}
 
     if incompatible:
-        tabString = " ".join("/" + g.name for g in incompatible)
+        print(f"\n{len(incompatible)} incompatible glyphs:")
+        for name, differences in incompatible.items():
+            for masterName, difference in differences:
+                print(f"  {name} [{masterName}]: {difference}")
+        tabString = " ".join("/" + name for name in incompatible)
         font.newTab(tabString)
     else:
         Glyphs.showNotification("No Incompatible Glyphs", "All glyphs are compatible across masters.")
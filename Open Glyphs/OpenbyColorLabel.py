@@ -2,12 +2,28 @@
 # -*- coding: utf-8 -*-
 __doc__ = """
 Open all glyphs with selected color labels in a new tab. Now with color swatches!
+
+The window counts the glyphs per label. The counts come from an index that is
+built once when the window opens and then kept up to date while it is open:
+whenever Glyphs updates its interface, only the labels of the selected glyphs
+are read again. After an undo or redo, which can change labels of glyphs that
+are not selected, the glyphs whose lastChange moved are read again. Open Tab is
+a lookup in that index.
 """
 
+import traceback
+
 import GlyphsApp
 import vanilla
 from AppKit import NSColor
 
+try:
+    from GlyphsApp import UPDATEINTERFACE
+except ImportError:
+    UPDATEINTERFACE = None
+
+UNDO_NOTIFICATIONS = ("NSUndoManagerDidUndoChangeNotification", "NSUndoManagerDidRedoChangeNotification")
+
 # -----------------------------
 # Palette helpers
 # -----------------------------
@@ -59,12 +75,117 @@ def _load_palette():
     n = min(len(names), len(colors))
     return names[:n], colors[:n]
 
+# -----------------------------
+# Color index
+# -----------------------------
+def _label(color):
+    # glyph.color is a palette index, None, or custom RGBA values (not a label)
+    return color if isinstance(color, int) else None
+
+class ColorIndex:
+    """
+    Color label → glyph names for one font. build() reads every glyph once;
+    update() reads the labels of the given glyphs (the selection) again, and
+    refresh() compares every glyph's lastChange with the one it was indexed at
+    and reads the label again only where it differs. Added, removed, renamed or
+    reordered glyphs rebuild the index.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.build()
+
+    def build(self):
+        self.order = {}    # glyph name → position in font.glyphs, for tab order
+        self.stamps = {}   # glyph name → lastChange when its label was read
+        self.colorOf = {}  # glyph name → label or None
+        self.names = {}    # label → set of glyph names
+        for i, glyph in enumerate(self.font.glyphs):
+            name = glyph.name
+            color = _label(glyph.color)
+            self.order[name] = i
+            self.stamps[name] = str(glyph.lastChange)
+            self.colorOf[name] = color
+            if color is not None:
+                self.names.setdefault(color, set()).add(name)
+
+    def _set(self, name, color):
+        old = self.colorOf[name]
+        if color == old:
+            return False
+        if old is not None:
+            self.names[old].discard(name)
+        if color is not None:
+            self.names.setdefault(color, set()).add(name)
+        self.colorOf[name] = color
+        return True
+
+    def update(self, glyphs):
+        """Re-read the labels of glyphs. Returns True if any count changed."""
+        if len(self.font.glyphs) != len(self.order):
+            self.build()
+            return True
+        changed = False
+        for glyph in glyphs:
+            name = glyph.name
+            if name not in self.colorOf:
+                self.build()  # renamed
+                return True
+            self.stamps[name] = str(glyph.lastChange)
+            changed = self._set(name, _label(glyph.color)) or changed
+        return changed
+
+    def refresh(self):
+        """Re-read the labels of glyphs whose lastChange moved. Returns True if any count changed."""
+        if len(self.font.glyphs) != len(self.order):
+            self.build()
+            return True
+        changed = False
+        for i, glyph in enumerate(self.font.glyphs):
+            name = glyph.name
+            if self.order.get(name) != i:
+                self.build()
+                return True
+            lastChange = str(glyph.lastChange)
+            if lastChange == self.stamps[name]:
+                continue
+            self.stamps[name] = lastChange
+            changed = self._set(name, _label(glyph.color)) or changed
+        return changed
+
+    def count(self, color):
+        return len(self.names.get(color, ()))
+
+    def lookup(self, colors):
+        """Glyph names with any of colors, in font order."""
+        found = set()
+        for color in colors:
+            found.update(self.names.get(color, ()))
+        if any(self.font.glyphs[name] is None for name in found):
+            # renamed or removed since the last refresh
+            self.build()
+            return self.lookup(colors)
+        return sorted(found, key=self.order.get)
+
+def _selected_glyphs(font):
+    glyphs = []
+    try:
+        glyphs.extend(font.selection or ())
+    except Exception:
+        pass
+    try:
+        glyphs.extend(layer.parent for layer in font.selectedLayers or ())
+    except Exception:
+        pass
+    return glyphs
+
 # -----------------------------
 # UI
 # -----------------------------
 class ColorLabelTabOpener:
     def __init__(self):
         self.colorLabels, self.colorNSColors = _load_palette()
+        self.index = ColorIndex(Glyphs.font) if Glyphs.font else None
 
         row_h = 22
         content_top = 38
@@ -86,8 +207,51 @@ class ColorLabelTabOpener:
 
         self.w.openTab = vanilla.Button((-120, -36, -15, 24), "Open Tab", callback=self.openTabCallback)
         self.w.setDefaultButton(self.w.openTab)
+        self.updateTitles()
+
+        if UPDATEINTERFACE is not None:
+            Glyphs.addCallback(self.interfaceUpdated, UPDATEINTERFACE)
+            for name in UNDO_NOTIFICATIONS:
+                Glyphs.addCallback(self.undoneOrRedone, name)
+            self.w.bind("close", self.windowClosed)
         self.w.open()
 
+    def windowClosed(self, sender):
+        try:
+            Glyphs.removeCallback(self.interfaceUpdated)
+            Glyphs.removeCallback(self.undoneOrRedone)
+        except Exception:
+            pass
+
+    def interfaceUpdated(self, notification=None):
+        # fires on every redraw: only the selection can have been relabelled from the interface
+        try:
+            font = Glyphs.font
+            if font is None or self.index is None or font != self.index.font:
+                return
+            if self.index.update(_selected_glyphs(font)):
+                self.updateTitles()
+        except Exception:
+            print(traceback.format_exc())
+
+    def undoneOrRedone(self, notification=None):
+        try:
+            font = Glyphs.font
+            if font is None or self.index is None or font != self.index.font:
+                return
+            if self.index.refresh():
+                self.updateTitles()
+        except Exception:
+            print(traceback.format_exc())
+
+    def updateTitles(self):
+        for i, cb in enumerate(self.checkboxes):
+            title = self.colorLabels[i]
+            if self.index is not None:
+                title = f"{title} ({self.index.count(i)})"
+            if cb.getTitle() != title:
+                cb.setTitle(title)
+
     def _buildStaticArea(self, y0, row_h):
         for i, label in enumerate(self.colorLabels):
             y = y0 + i * row_h
@@ -137,11 +301,11 @@ class ColorLabelTabOpener:
                 print("Open by Color Label: No font open.")
             return
 
-        glyphNames = []
-        for glyph in font.glyphs:
-            c = glyph.color
-            if c is not None and c in selectedColorIndexes:
-                glyphNames.append(glyph.name)
+        if self.index is None or font != self.index.font:
+            self.index = ColorIndex(font)
+            self.updateTitles()
+
+        glyphNames = self.index.lookup(selectedColorIndexes)
 
         if glyphNames:
             font.newTab("/" + "/".join(glyphNames))
@@ -1,10 +1,17 @@
 # MenuTitle: Word Generator
 # -*- coding: utf-8 -*-
+# Set Glyphs.defaults["sk.profilePhases"] to 1 (or 2 for cProfile stats) to print phase timings.
 from GlyphsApp import Glyphs
 import random
 import vanilla
 import os
 import traceback
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Lib")  # modules shared by the scripts
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+from PhaseTimer import PhaseTimer
 
 _WORD_CACHE = None
 UDK = "sk.wordgen"
@@ -27,6 +34,11 @@ def setpref_font(font, key, value):
     except:
         pass
 
+# -----------------------------
+# Phase timing
+# -----------------------------
+TIMER = PhaseTimer("Word Generator")
+
 # -----------------------------
 # Dictionary
 # -----------------------------
@@ -204,6 +216,13 @@ class WordGenerator:
         self._save()
 
     def insert(self, sender):
+        TIMER.start()
+        try:
+            self._insert(sender)
+        finally:
+            TIMER.report()
+
+    def _insert(self, sender):
         self._save()
 
         try:
@@ -219,18 +238,21 @@ class WordGenerator:
         mustIncl = self.w.mustContainInput.get() or ""
 
         try:
-            allowed = getDrawnCharacters(self.font)
-            words = loadWordList()
-
-            pool = filterWords(
-                words,
-                allowed,
-                titleCase=useTitle,
-                upperCase=useUpper,
-                minLen=minLen,
-                maxLen=maxLen,
-                mustInclude=mustIncl
-            )
+            with TIMER.phase("drawn characters"):
+                allowed = getDrawnCharacters(self.font)
+            with TIMER.phase("word list"):
+                words = loadWordList()
+
+            with TIMER.phase("filter"):
+                pool = filterWords(
+                    words,
+                    allowed,
+                    titleCase=useTitle,
+                    upperCase=useUpper,
+                    minLen=minLen,
+                    maxLen=maxLen,
+                    mustInclude=mustIncl
+                )
 
             if not pool:
                 print("WORD GENERATOR — NO RESULTS")
@@ -238,7 +260,8 @@ class WordGenerator:
                 Glyphs.showNotification("No usable words", "No words satisfy the current constraints.")
                 return
 
-            self.font.newTab(generateParagraph(pool, wordCount))
+            with TIMER.phase("newTab"):
+                self.font.newTab(generateParagraph(pool, wordCount))
             self.w.close()
 
         except Exception:
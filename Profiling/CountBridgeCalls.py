@@ -0,0 +1,283 @@
+# MenuTitle: Count Bridge Calls in Script…
+# -*- coding: utf-8 -*-
+__doc__ = """
+Runs another script from this repository with the font objects wrapped in
+counting proxies, and prints how often it read, wrote and called attributes
+of Glyphs objects: per phase (the script function that made the access) and
+per call site (file and line), with the attributes behind each site.
+
+Everything reached from Glyphs is wrapped: fonts, masters, glyphs, layers,
+paths, nodes, components, anchors and the proxy lists between them. Plain
+values (numbers, strings, NSPoints) are returned as they are, so reading
+pos.x after pos = node.position counts once, for position.
+
+Scripts that continue in a progress window are counted until they go quiet
+for IDLE_REPORT seconds; the report is printed then. Counting makes every
+access much slower, so use it to compare loops, not to time them.
+"""
+
+import GlyphsApp
+from GlyphsApp import Glyphs, GetOpenFile
+import linecache
+import os
+import runpy
+import sys
+
+try:
+    import objc
+except ImportError:
+    objc = None
+
+try:
+    from PyObjCTools.AppHelper import callLater
+except ImportError:
+    callLater = None
+
+# ---------- CONFIGURATION ----------
+SCRIPT = ""         # script to run; empty = ask
+TOP_SITES = 20      # call sites listed in the report
+IDLE_REPORT = 1.0   # seconds without new accesses before the report of a still-running script
+# -----------------------------------
+
+
+# -----------------------------
+# Counting
+# -----------------------------
+class BridgeCounter(object):
+    """Counts reads, writes and calls per (phase, kind, attribute) and per call site."""
+
+    KINDS = ("read", "write", "call")
+
+    def __init__(self, scriptPath):
+        self.scriptPath = os.path.abspath(scriptPath)
+        self.phases = {}  # (phase, kind) → count
+        self.sites = {}   # (file, line, phase) → {(kind, attribute): count}
+        self.total = 0
+
+    def record(self, kind, name):
+        phase, site = self.caller()
+        self.total += 1
+        self.phases[(phase, kind)] = self.phases.get((phase, kind), 0) + 1
+        attributes = self.sites.setdefault(site, {})
+        attributes[(kind, name)] = attributes.get((kind, name), 0) + 1
+
+    def caller(self):
+        """Return (phase, site) of the innermost frame in the counted script, else of the first outside this file."""
+        frame = sys._getframe(1)
+        first = None
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename != HERE:
+                if first is None:
+                    first = frame
+                if code.co_filename == self.scriptPath:
+                    break
+            frame = frame.f_back
+        frame = frame or first
+        if frame is None:
+            return "?", ("?", 0, "?")
+        # comprehensions and generator expressions count for the function around them
+        outer = frame
+        while outer.f_code.co_name.startswith("<") and outer.f_code.co_name != "<module>" and outer.f_back is not None:
+            outer = outer.f_back
+        phase = outer.f_code.co_name
+        if phase == "<module>":
+            phase = "(top level)"
+        return phase, (frame.f_code.co_filename, frame.f_lineno, phase)
+
+    def report(self):
+        name = os.path.basename(self.scriptPath)
+        print(f"### Bridge calls: {name} ###\n")
+        print(f"{self.total:,} accesses to Glyphs objects.\n")
+
+        phaseNames = sorted(
+            {phase for phase, _ in self.phases},
+            key=lambda phase: -sum(self.phases.get((phase, kind), 0) for kind in self.KINDS),
+        )
+        print(f"{'Phase':30} {'reads':>12} {'writes':>10} {'calls':>10}")
+        for phase in phaseNames:
+            reads, writes, calls = (self.phases.get((phase, kind), 0) for kind in self.KINDS)
+            print(f"{phase[:30]:30} {reads:>12,} {writes:>10,} {calls:>10,}")
+
+        print(f"\nTop {TOP_SITES} call sites:\n")
+        ranked = sorted(self.sites.items(), key=lambda item: -sum(item[1].values()))
+        for (path, line, phase), attributes in ranked[:TOP_SITES]:
+            count = sum(attributes.values())
+            top = sorted(attributes.items(), key=lambda item: -item[1])[:4]
+            detail = ", ".join(f"{attr} ({kind}) {n:,}" for (kind, attr), n in top)
+            print(f"{count:>12,}  {os.path.basename(path)}:{line} in {phase}: {detail}")
+            source = linecache.getline(path, line).strip()
+            if source:
+                print(f"{'':14}{source}")
+        print()
+
+
+# -----------------------------
+# Proxies
+# -----------------------------
+VALUE_TYPES = {"NSPoint", "NSSize", "NSRect", "CGPoint", "CGSize", "CGRect", "Point"}  # structs, copied across once (Point: headless NSPoint)
+
+
+def is_bridged(value):
+    """True for Objective-C objects and the GlyphsApp wrappers around them (layer.paths and the like)."""
+    if objc is not None and isinstance(value, objc.objc_object):
+        return True
+    kind = type(value)
+    return kind.__module__.split(".")[0] == "GlyphsApp" and kind.__name__ not in VALUE_TYPES and not isinstance(value, type)
+
+
+def wrap(value, counter):
+    if isinstance(value, Counted) or not is_bridged(value):
+        return value
+    return Counted(value, counter)
+
+
+def unwrap(value):
+    """Return value with every proxy replaced by its object, also inside lists, tuples and dicts."""
+    if isinstance(value, Counted):
+        return object.__getattribute__(value, "_target")
+    if isinstance(value, list):
+        return [unwrap(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(unwrap(v) for v in value)
+    if isinstance(value, dict):
+        return {unwrap(k): unwrap(v) for k, v in value.items()}
+    return value
+
+
+class Counted(object):
+    """
+    Stands in for a Glyphs object and counts every access to it. Results are
+    wrapped again, arguments unwrapped, and isinstance() sees the real class.
+    """
+
+    __slots__ = ("_target", "_counter")
+
+    def __init__(self, target, counter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counter", counter)
+
+    @property
+    def __class__(self):
+        return type(object.__getattribute__(self, "_target"))
+
+    def __getattr__(self, name):
+        target = object.__getattribute__(self, "_target")
+        counter = object.__getattribute__(self, "_counter")
+        value = getattr(target, name)
+        if callable(value) and not is_bridged(value):
+            def method(*args, **kwargs):
+                counter.record("call", name)
+                return wrap(value(*unwrap(args), **unwrap(kwargs)), counter)
+            return method
+        counter.record("read", name)
+        return wrap(value, counter)
+
+    def __setattr__(self, name, value):
+        object.__getattribute__(self, "_counter").record("write", name)
+        setattr(object.__getattribute__(self, "_target"), name, unwrap(value))
+
+    def __delattr__(self, name):
+        object.__getattribute__(self, "_counter").record("write", name)
+        delattr(object.__getattribute__(self, "_target"), name)
+
+    def _call(self, name, *args):
+        counter = object.__getattribute__(self, "_counter")
+        counter.record("call", name)
+        target = object.__getattribute__(self, "_target")
+        return wrap(getattr(type(target), name)(target, *unwrap(args)), counter)
+
+    def __getitem__(self, key):
+        return self._call("__getitem__", key)
+
+    def __setitem__(self, key, value):
+        self._call("__setitem__", key, value)
+
+    def __delitem__(self, key):
+        self._call("__delitem__", key)
+
+    def __len__(self):
+        return self._call("__len__")
+
+    def __contains__(self, item):
+        return self._call("__contains__", item)
+
+    def __iter__(self):
+        counter = object.__getattribute__(self, "_counter")
+        counter.record("call", "__iter__")
+        for item in object.__getattribute__(self, "_target"):
+            yield wrap(item, counter)
+
+    def __bool__(self):
+        target = object.__getattribute__(self, "_target")
+        if hasattr(type(target), "__bool__") or hasattr(type(target), "__len__"):
+            object.__getattribute__(self, "_counter").record("call", "__bool__")
+        return bool(target)
+
+    def __call__(self, *args, **kwargs):
+        counter = object.__getattribute__(self, "_counter")
+        counter.record("call", "__call__")
+        return wrap(object.__getattribute__(self, "_target")(*unwrap(args), **unwrap(kwargs)), counter)
+
+    def __eq__(self, other):
+        return object.__getattribute__(self, "_target") == unwrap(other)
+
+    def __ne__(self, other):
+        return object.__getattribute__(self, "_target") != unwrap(other)
+
+    def __hash__(self):
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __repr__(self):
+        return repr(object.__getattribute__(self, "_target"))
+
+    def __str__(self):
+        return str(object.__getattribute__(self, "_target"))
+
+
+HERE = Counted.__init__.__code__.co_filename  # frames of this file are never call sites
+
+
+# -----------------------------
+# Running
+# -----------------------------
+def run_counted(scriptPath):
+    """
+    Run scriptPath with Glyphs replaced by a counting proxy, the way the Macro
+    panel runs it. Returns the counter; the script keeps its proxy afterwards,
+    so work it schedules for later is still counted.
+    """
+    counter = BridgeCounter(scriptPath)
+    glyphs = Counted(GlyphsApp.Glyphs, counter)
+    names = {name: getattr(GlyphsApp, name) for name in getattr(GlyphsApp, "__all__", ()) if hasattr(GlyphsApp, name)}
+    names["GlyphsApp"] = GlyphsApp
+    names["Glyphs"] = glyphs
+    original = GlyphsApp.Glyphs
+    GlyphsApp.Glyphs = glyphs  # for `from GlyphsApp import Glyphs` in the script
+    try:
+        runpy.run_path(scriptPath, init_globals=names, run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        GlyphsApp.Glyphs = original
+    return counter
+
+
+def report_when_idle(counter, seen=-1):
+    if counter.total != seen:
+        callLater(IDLE_REPORT, report_when_idle, counter, counter.total)
+    else:
+        counter.report()
+
+
+scriptPath = SCRIPT or GetOpenFile(message="Script to count bridge calls in", filetypes=["py"])
+if not scriptPath:
+    print("No script chosen.")
+elif not Glyphs.font:
+    print("No font open.")
+else:
+    counter = run_counted(scriptPath)
+    if callLater is None:
+        counter.report()
+    else:
+        report_when_idle(counter)